@@ -1,85 +1,672 @@
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
+from discord.ui import Button, View
 import pytz
-from datetime import datetime, timedelta, timezone
-import re
-from typing import Optional
+from fuzzywuzzy import fuzz
+from datetime import datetime, timedelta, timezone, tzinfo
+import io
+import bisect
+import time
+import tempfile
+import csv
+import uuid
+import asyncio
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
 import logging
 
-from utils.storage import load_user_timezones, save_user_timezone
+from utils.storage import (
+    save_user_timezone, get_user_timezone, save_user_preference, load_event_series, save_event_series,
+    load_event_reminders, save_event_reminders, load_event_attendance, record_attendance_samples
+)
 from utils.permissions import has_event_access
+from utils.ratelimit import TokenBucket
+from utils.scheduler import DeadlineScheduler
+from utils.timeparse import parse_time, parse_duration, normalize_timezone, zone_for, localize
+from utils.recurrence import parse_recurrence, iter_occurrences
+from utils.event_import import RowIntervals, iter_csv_events, iter_ics_events
 
 logger = logging.getLogger('discord')
 
+ENDED_STATUSES = (discord.EventStatus.completed, discord.EventStatus.canceled)
+EVENT_LEAD_MINUTES = 30
+MAX_EVENT_MINUTES = 1440
+EVENTS_PER_PAGE = 8
+AUTOCOMPLETE_MIN_SCORE = 55
+DEFAULT_EVENT_MINUTES = 90  # assumed length for events without an end time
+# Discord allows 100 active/scheduled events per guild
+GUILD_EVENT_CAP = 100
+# Scheduled event creation is paced per guild: a short burst, then one every few seconds
+EVENT_CREATE_BURST = 3
+EVENT_CREATE_RATE = 0.25  # creations per second
+# Recurring series only materialize occurrences inside this rolling window
+RECURRING_WINDOW_DAYS = 14
+RECURRING_MAX_AHEAD = 6  # upcoming events per series at any time
+# Reminder DMs share one bucket across guilds and run a few at a time
+REMINDER_DM_CONCURRENCY = 5
+REMINDER_DM_BURST = 5
+REMINDER_DM_RATE = 2  # DMs per second
+MAX_REMINDERS_PER_EVENT = 5
+# Explicit ScheduledEvent.users() limit: without one discord.py stops at user_count, which can be stale
+EVENT_USERS_LIMIT = 1_000_000
+IMPORT_MAX_BYTES = 1024 * 1024
+
+class ScheduledEventCache:
+    """
+    Per-guild copy of scheduled events, seeded from the gateway guild cache and kept
+    current by the scheduled event gateway events. Commands read from here and only
+    go to REST when an event is missing.
+    """
+    def __init__(self):
+        self.events: Dict[int, Dict[int, discord.ScheduledEvent]] = {}
+        # Start-time order plus the matching start timestamps for bisecting, rebuilt lazily
+        self.ordered: Dict[int, Tuple[List[discord.ScheduledEvent], List[float]]] = {}
+
+    def seed(self, guild: discord.Guild):
+        self.events[guild.id] = {event.id: event for event in guild.scheduled_events if event.status not in ENDED_STATUSES}
+        self.ordered.pop(guild.id, None)
+
+    def drop_guild(self, guild_id: int):
+        self.events.pop(guild_id, None)
+        self.ordered.pop(guild_id, None)
+
+    def put(self, event: discord.ScheduledEvent):
+        if event.status in ENDED_STATUSES:
+            return self.remove(event.guild_id, event.id)
+        self.events.setdefault(event.guild_id, {})[event.id] = event
+        self.ordered.pop(event.guild_id, None)
+
+    def remove(self, guild_id: int, event_id: int):
+        if self.events.get(guild_id, {}).pop(event_id, None) is not None:
+            self.ordered.pop(guild_id, None)
+
+    def get(self, guild_id: int, event_id: int) -> Optional[discord.ScheduledEvent]:
+        return self.events.get(guild_id, {}).get(event_id)
+
+    async def fetch(self, guild: discord.Guild, event_id: int) -> discord.ScheduledEvent:
+        """Return the cached event, fetching it over REST on a miss (raises discord.NotFound)"""
+        event = self.get(guild.id, event_id)
+        if event is None:
+            event = await guild.fetch_scheduled_event(event_id)
+            self.put(event)
+        return event
+
+    def timeline(self, guild: discord.Guild) -> Tuple[List[discord.ScheduledEvent], List[float]]:
+        """Events sorted by start time and their start timestamps. Both lists are replaced, never mutated."""
+        if guild.id not in self.events:
+            self.seed(guild)
+        ordered = self.ordered.get(guild.id)
+        if ordered is None:
+            events = sorted(self.events[guild.id].values(), key=lambda event: event.start_time)
+            ordered = self.ordered[guild.id] = (events, [event.start_time.timestamp() for event in events])
+        return ordered
+
+    def sorted_events(self, guild: discord.Guild) -> List[discord.ScheduledEvent]:
+        return self.timeline(guild)[0]
+
+    def window(self, guild: discord.Guild, start: Optional[datetime], end: Optional[datetime]) -> Tuple[List[discord.ScheduledEvent], int, int]:
+        """Sorted events plus the index range of those starting in [start, end)"""
+        events, starts = self.timeline(guild)
+        lo = bisect.bisect_left(starts, start.timestamp()) if start else 0
+        hi = bisect.bisect_left(starts, end.timestamp()) if end else len(events)
+        return events, lo, max(lo, hi)
+
+event_cache = ScheduledEventCache()
+
+class EventCreationQueue:
+    """Paces create_scheduled_event calls per guild; callers wait their turn on the guild's token bucket"""
+    def __init__(self):
+        self.buckets: Dict[int, TokenBucket] = {}
+
+    def capacity_left(self, guild: discord.Guild) -> int:
+        return GUILD_EVENT_CAP - len(event_cache.sorted_events(guild))
+
+    async def create(self, guild: discord.Guild, **kwargs) -> discord.ScheduledEvent:
+        bucket = self.buckets.get(guild.id)
+        if bucket is None:
+            bucket = self.buckets[guild.id] = TokenBucket(EVENT_CREATE_RATE, EVENT_CREATE_BURST)
+        await bucket.acquire()
+        event = await guild.create_scheduled_event(**kwargs)
+        event_cache.put(event)
+        return event
+
+event_creator = EventCreationQueue()
+
+def resolve_location(guild: discord.Guild, location: str) -> Tuple[str, Optional[discord.VoiceChannel]]:
+    """Turn a voice channel mention into that channel; anything else is an external location"""
+    if location.startswith('<#') and location.endswith('>') and location[2:-1].isdigit():
+        channel = guild.get_channel(int(location[2:-1]))
+        if isinstance(channel, discord.VoiceChannel):
+            return channel.name, channel
+    return location, None
+
+def location_kwargs(location: str, voice_channel: Optional[discord.VoiceChannel]) -> dict:
+    if voice_channel:
+        return {"channel": voice_channel, "entity_type": discord.EntityType.voice}
+    return {"location": location[:100], "entity_type": discord.EntityType.external}
+
+class EventReminders:
+    """
+    Pending event reminders for every guild on one DeadlineScheduler.
+    Each reminder is persisted per guild and re-scheduled from storage on startup.
+    """
+    def __init__(self):
+        self.bot = None
+        self.reminders: Dict[tuple, dict] = {}  # (guild_id, 'event_id:offset_minutes') -> reminder
+        self.scheduler = DeadlineScheduler(self.deliver)
+        self.dm_bucket = TokenBucket(REMINDER_DM_RATE, REMINDER_DM_BURST)
+
+    def load_guild(self, guild_id: str):
+        for key, reminder in load_event_reminders(guild_id).items():
+            self.reminders[(guild_id, key)] = reminder
+            self.scheduler.schedule((guild_id, key), reminder["due"])
+
+    def add(self, guild_id: str, event: discord.ScheduledEvent, offsets: List[int], target: str, channel_id: Optional[int]) -> List[dict]:
+        updates = {}
+        for offset in offsets:
+            key = f"{event.id}:{offset}"
+            reminder = {
+                "event_id": str(event.id),
+                "offset_minutes": offset,
+                "target": target,
+                "channel_id": str(channel_id) if channel_id else None,
+                "due": event.start_time.timestamp() - offset * 60
+            }
+            updates[key] = reminder
+            self.reminders[(guild_id, key)] = reminder
+            self.scheduler.schedule((guild_id, key), reminder["due"])
+        save_event_reminders(guild_id, updates)
+        return list(updates.values())
+
+    def for_event(self, guild_id: str, event_id: int) -> List[str]:
+        return [key for (entry_guild, key), reminder in self.reminders.items()
+                if entry_guild == guild_id and reminder["event_id"] == str(event_id)]
+
+    def reschedule_event(self, event: discord.ScheduledEvent):
+        """Move an event's reminders after its start time changed"""
+        guild_id = str(event.guild_id)
+        updates = {}
+        for key in self.for_event(guild_id, event.id):
+            reminder = self.reminders[(guild_id, key)]
+            reminder["due"] = event.start_time.timestamp() - reminder["offset_minutes"] * 60
+            updates[key] = reminder
+            self.scheduler.schedule((guild_id, key), reminder["due"])
+        if updates:
+            save_event_reminders(guild_id, updates)
+
+    def clear_event(self, guild_id: str, event_id: int) -> int:
+        keys = self.for_event(guild_id, event_id)
+        for key in keys:
+            self.reminders.pop((guild_id, key), None)
+            self.scheduler.cancel((guild_id, key))
+        if keys:
+            save_event_reminders(guild_id, dict.fromkeys(keys))
+        return len(keys)
+
+    async def deliver(self, entry: tuple):
+        guild_id, key = entry
+        reminder = self.reminders.pop(entry, None)
+        if reminder:
+            save_event_reminders(guild_id, {key: None})
+        guild = self.bot.get_guild(int(guild_id)) if self.bot else None
+        if not reminder or not guild:
+            return
+
+        try:
+            event = await event_cache.fetch(guild, int(reminder["event_id"]))
+        except discord.NotFound:
+            return
+        # Reminders that came due while the bot was offline are only worth sending before the start
+        if event.status in ENDED_STATUSES or event.start_time <= datetime.now(timezone.utc):
+            return
+
+        start = int(event.start_time.timestamp())
+        content = f"⏰ **{event.name}** starts <t:{start}:R> (<t:{start}:F>)\n{event.url}"
+        if reminder["target"] == "channel":
+            channel = guild.get_channel(int(reminder["channel_id"])) if reminder.get("channel_id") else None
+            if channel:
+                await channel.send(content)
+            return
+
+        sent, failed = await self.send_dms(event, content)
+        logger.info(f"✅ Reminder for event {event.id} sent to {sent} users ({failed} failed)")
+
+    async def send_dms(self, event: discord.ScheduledEvent, content: str) -> Tuple[int, int]:
+        """DM everyone interested in the event, paced and a few at a time, while paging through users"""
+        counts = [0, 0]
+        slots = asyncio.Semaphore(REMINDER_DM_CONCURRENCY)
+        pending = set()
+
+        async def send(user: discord.User):
+            try:
+                await self.dm_bucket.acquire()
+                await user.send(content)
+                counts[0] += 1
+            except discord.HTTPException:
+                counts[1] += 1
+            finally:
+                slots.release()
+
+        async for user in event.users(limit=EVENT_USERS_LIMIT):
+            if user.bot:
+                continue
+            await slots.acquire()
+            task = asyncio.create_task(send(user))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
+        return counts[0], counts[1]
+
+event_reminders = EventReminders()
+
+class ChannelScheduleIndex:
+    """
+    Per-guild, per-channel interval index over cached events, sorted by start time.
+    Only events starting at most one longest-event-length before a window can overlap it,
+    so two bisects bound the candidates, giving O(log n + k) lookups.
+    """
+    def __init__(self):
+        # guild_id -> (timeline, {channel_id: [starts, ends, events, longest length in seconds]})
+        self.indexes: Dict[int, tuple] = {}
+
+    def channels(self, guild: discord.Guild) -> Dict[int, list]:
+        timeline = event_cache.timeline(guild)
+        index = self.indexes.get(guild.id)
+        if index is None or index[0] is not timeline:
+            channels: Dict[int, list] = {}
+            # The timeline is already in start order, so each channel's lists come out sorted
+            for event in timeline[0]:
+                if not event.channel_id:
+                    continue
+                entry = channels.setdefault(event.channel_id, [[], [], [], 0])
+                end = event.end_time or event.start_time + timedelta(minutes=DEFAULT_EVENT_MINUTES)
+                entry[0].append(event.start_time.timestamp())
+                entry[1].append(end.timestamp())
+                entry[2].append(event)
+                entry[3] = max(entry[3], entry[1][-1] - entry[0][-1])
+            index = self.indexes[guild.id] = (timeline, channels)
+        return index[1]
+
+    def conflicts(self, guild: discord.Guild, channel_id: int, start: datetime, end: datetime,
+                  ignore_id: Optional[int] = None) -> List[discord.ScheduledEvent]:
+        """Events in the channel overlapping [start, end)"""
+        entry = self.channels(guild).get(channel_id)
+        if not entry:
+            return []
+        starts, ends, events, longest = entry
+        lo = bisect.bisect_left(starts, start.timestamp() - longest)
+        hi = bisect.bisect_left(starts, end.timestamp())
+        return [events[i] for i in range(lo, hi) if ends[i] > start.timestamp() and events[i].id != ignore_id]
+
+    def nearest_free_slot(self, guild: discord.Guild, channel_id: int, start: datetime, end: datetime,
+                          earliest: datetime, ignore_id: Optional[int] = None) -> datetime:
+        """Closest start time to the requested one where the same duration fits without overlap"""
+        duration = end - start
+        later = start
+        while True:
+            clashes = self.conflicts(guild, channel_id, later, later + duration, ignore_id)
+            if not clashes:
+                break
+            later = max(event.end_time or event.start_time + timedelta(minutes=DEFAULT_EVENT_MINUTES) for event in clashes)
+
+        earlier = start
+        while earlier >= earliest:
+            clashes = self.conflicts(guild, channel_id, earlier, earlier + duration, ignore_id)
+            if not clashes:
+                if later - start > start - earlier:
+                    return earlier
+                break
+            earlier = min(event.start_time for event in clashes) - duration
+        return later
+
+schedule_index = ChannelScheduleIndex()
+
+class EventSearchIndex:
+    """
+    Per-guild search text for cached events, built in the searching user's timezone.
+    An index is reused until the guild's event timeline is rebuilt after a change.
+    """
+    def __init__(self):
+        self.indexes: Dict[tuple, tuple] = {}  # (guild_id, timezone) -> (timeline, [(event, haystack)])
+
+    def entries(self, guild: discord.Guild, user_timezone: tzinfo, timezone_str: str) -> List[tuple]:
+        timeline = event_cache.timeline(guild)
+        key = (guild.id, timezone_str)
+        index = self.indexes.get(key)
+        if index is None or index[0] is not timeline:
+            entries = []
+            for event in timeline[0]:
+                local = event.start_time.astimezone(user_timezone)
+                haystack = f"{event.name} {local.strftime('%a %A %b %B %d %Y-%m-%d %m-%d %H:%M')}".lower()
+                entries.append((event, haystack))
+            index = self.indexes[key] = (timeline, entries)
+        return index[1]
+
+    def search(self, guild: discord.Guild, current: str, user_timezone: tzinfo, timezone_str: str, limit: int = 25) -> List[tuple]:
+        """Return (event, local start) pairs, best matches first; upcoming order when nothing is typed"""
+        entries = self.entries(guild, user_timezone, timezone_str)
+        query = current.strip().lower()
+        matches = [event for event, _ in entries if str(event.id).startswith(query)][:limit] if query.isdigit() else []
+        if not query:
+            matches = [event for event, _ in entries[:limit]]
+        elif not matches:
+            scored = [(fuzz.WRatio(query, haystack), i, event) for i, (event, haystack) in enumerate(entries)]
+            scored = [entry for entry in scored if entry[0] >= AUTOCOMPLETE_MIN_SCORE]
+            # Highest score first; ties go to the sooner event
+            scored.sort(key=lambda entry: (-entry[0], entry[1]))
+            matches = [event for _, _, event in scored[:limit]]
+        return [(event, event.start_time.astimezone(user_timezone)) for event in matches]
+
+event_search = EventSearchIndex()
+
+async def event_id_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+    if not interaction.guild:
+        return []
+    timezone_str = get_user_timezone(str(interaction.guild.id), interaction.user.id) or "UTC"
+    user_timezone = zone_for(timezone_str) or pytz.UTC
+    return [
+        app_commands.Choice(name=f"{event.name[:70]} · {local.strftime('%a %b %d %H:%M')}", value=str(event.id))
+        for event, local in event_search.search(interaction.guild, current, user_timezone, timezone_str)
+    ]
+
+class AttendanceTracker:
+    """
+    Interested-user counts per event, fetched once per guild with counts and then kept
+    current by the scheduled event user gateway events. Changed counts are sampled into
+    each guild's attendance history by a periodic task.
+    """
+    def __init__(self):
+        self.counts: Dict[int, int] = {}  # event_id -> interested users
+        self.seeded = set()  # guild ids whose counts came from REST
+        self.dirty: Dict[int, set] = {}  # guild_id -> event ids changed since the last sample
+
+    async def seed_guild(self, guild: discord.Guild):
+        for event in await guild.fetch_scheduled_events(with_counts=True):
+            # Only the count is taken; gateway objects already in the cache stay as they are
+            if event_cache.get(guild.id, event.id) is None:
+                event_cache.put(event)
+            self.set(event, event.user_count)
+        self.seeded.add(guild.id)
+
+    def set(self, event: discord.ScheduledEvent, count: int):
+        self.counts[event.id] = count
+        self.dirty.setdefault(event.guild_id, set()).add(event.id)
+
+    def adjust(self, event: discord.ScheduledEvent, delta: int):
+        if event.id in self.counts:
+            self.set(event, max(0, self.counts[event.id] + delta))
+
+    def forget(self, event_id: int):
+        self.counts.pop(event_id, None)
+
+    def sample(self, event: discord.ScheduledEvent) -> Optional[dict]:
+        interested = self.counts.get(event.id)
+        in_channel = None
+        if event.status == discord.EventStatus.active and isinstance(event.channel, (discord.VoiceChannel, discord.StageChannel)):
+            in_channel = len(event.channel.members)
+        if interested is None and in_channel is None:
+            return None
+        return {"name": event.name, "sample": [int(time.time()), interested, in_channel]}
+
+    def flush(self, guild: discord.Guild) -> int:
+        """Record samples for changed events and for active voice events in one write"""
+        dirty = self.dirty.pop(guild.id, set())
+        samples = {}
+        for event in event_cache.sorted_events(guild):
+            if event.id in dirty or event.status == discord.EventStatus.active:
+                entry = self.sample(event)
+                if entry:
+                    samples[str(event.id)] = entry
+        return record_attendance_samples(str(guild.id), samples) if samples else 0
+
+attendance = AttendanceTracker()
+
+class EventListView(View):
+    """
+    Pages through a window of the cached, time-sorted event list.
+    Matches for the status/channel filters are found lazily, only as far as the requested page needs.
+    """
+    def __init__(self, events: List[discord.ScheduledEvent], lo: int, hi: int, status: Optional[discord.EventStatus],
+                 channel_id: Optional[int], user_timezone: Optional[tzinfo], timezone_str: Optional[str]):
+        super().__init__(timeout=300)
+        self.events, self.lo, self.hi = events, lo, hi
+        self.status, self.channel_id = status, channel_id
+        self.user_timezone, self.timezone_str = user_timezone, timezone_str
+        self.filtered = status is not None or channel_id is not None
+        self.matches: List[int] = []  # indices into events that pass the filters, found so far
+        self.scanned = lo
+        self.page = 0
+
+    def fill(self, count: int):
+        while len(self.matches) < count and self.scanned < self.hi:
+            event = self.events[self.scanned]
+            if (self.status is None or event.status == self.status) and (self.channel_id is None or event.channel_id == self.channel_id):
+                self.matches.append(self.scanned)
+            self.scanned += 1
+
+    def render(self) -> discord.Embed:
+        start = self.page * EVENTS_PER_PAGE
+        # One extra match tells us whether a next page exists
+        self.fill(start + EVENTS_PER_PAGE + 1)
+        page_events = [self.events[i] for i in self.matches[start:start + EVENTS_PER_PAGE]]
+
+        embed = discord.Embed(title="📅 Upcoming Events", color=discord.Color.blue())
+        for event in page_events:
+            status_emoji = "🟢" if event.status == discord.EventStatus.scheduled else "🟡" if event.status == discord.EventStatus.active else "🔴"
+            
+            # Convert to user's timezone if available
+            time_display = event.start_time.strftime('%b %d, %Y %H:%M UTC')
+            if self.user_timezone:
+                local_time = event.start_time.astimezone(self.user_timezone)
+                time_display = f"{local_time.strftime('%b %d, %Y %H:%M')} ({self.timezone_str})"
+            
+            where = event.location or (f"<#{event.channel_id}>" if event.channel_id else "TBA")
+            embed.add_field(
+                name=f"{status_emoji} {event.name}",
+                value=f"**When:** {time_display}\n"
+                      f"**Where:** {where}\n"
+                      f"**ID:** `{event.id}`",
+                inline=False
+            )
+
+        footer = f"Page {self.page + 1}"
+        if not self.filtered:
+            # Without filters the window size is the exact total
+            total = self.hi - self.lo
+            footer += f" of {max(1, -(-total // EVENTS_PER_PAGE))} · {total} events"
+        embed.set_footer(text=f"{footer} · Use /event_info for details")
+
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = len(self.matches) <= start + EVENTS_PER_PAGE
+        return embed
+
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary, emoji="◀️")
+    async def previous_page(self, interaction: discord.Interaction, button: Button):
+        self.page = max(0, self.page - 1)
+        await interaction.response.edit_message(embed=self.render(), view=self)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary, emoji="▶️")
+    async def next_page(self, interaction: discord.Interaction, button: Button):
+        self.page += 1
+        await interaction.response.edit_message(embed=self.render(), view=self)
+
 class Events(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.filling = set()  # series_ids currently being materialized
+
+    async def cog_load(self):
+        event_reminders.bot = self.bot
+        for guild in self.bot.guilds:
+            event_cache.seed(guild)
+            event_reminders.load_guild(str(guild.id))
+        event_reminders.scheduler.start()
+        self.top_up_series.start()
+        self.snapshot_attendance.start()
+
+    async def cog_unload(self):
+        self.top_up_series.cancel()
+        self.snapshot_attendance.cancel()
+        event_reminders.scheduler.stop()
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        event_cache.seed(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        event_cache.drop_guild(guild.id)
+
+    @commands.Cog.listener()
+    async def on_scheduled_event_create(self, event: discord.ScheduledEvent):
+        event_cache.put(event)
+        attendance.set(event, event.user_count)
+
+    @commands.Cog.listener()
+    async def on_scheduled_event_update(self, before: discord.ScheduledEvent, after: discord.ScheduledEvent):
+        event_cache.put(after)
+        if after.status in ENDED_STATUSES:
+            event_reminders.clear_event(str(after.guild_id), after.id)
+            # Final sample before the event leaves the cache
+            entry = attendance.sample(after)
+            if entry:
+                record_attendance_samples(str(after.guild_id), {str(after.id): entry})
+            attendance.forget(after.id)
+        elif before.start_time != after.start_time:
+            event_reminders.reschedule_event(after)
+
+    @commands.Cog.listener()
+    async def on_scheduled_event_delete(self, event: discord.ScheduledEvent):
+        event_cache.remove(event.guild_id, event.id)
+        event_reminders.clear_event(str(event.guild_id), event.id)
+        attendance.forget(event.id)
+
+    @commands.Cog.listener()
+    async def on_scheduled_event_user_add(self, event: discord.ScheduledEvent, user: discord.User):
+        attendance.adjust(event, 1)
+
+    @commands.Cog.listener()
+    async def on_scheduled_event_user_remove(self, event: discord.ScheduledEvent, user: discord.User):
+        attendance.adjust(event, -1)
+
+    @tasks.loop(minutes=15)
+    async def snapshot_attendance(self):
+        for guild in self.bot.guilds:
+            if guild.id not in attendance.seeded:
+                try:
+                    await attendance.seed_guild(guild)
+                except discord.HTTPException as e:
+                    logger.error(f"❌ Couldn't fetch event counts for {guild.id}: {e}")
+                    continue
+            attendance.flush(guild)
+
+    @snapshot_attendance.before_loop
+    async def before_snapshot_attendance(self):
+        await self.bot.wait_until_ready()
 
-    def parse_time_input(self, time_str: str, user_timezone: pytz.FixedOffset) -> Optional[datetime]:
+    def parse_time_input(self, time_str: str, user_timezone: tzinfo) -> Optional[datetime]:
         """Parse various time formats and return localized datetime"""
-        now = datetime.now(user_timezone)
-        
-        # Try YYYY-MM-DD HH:MM format
-        try:
-            return user_timezone.localize(datetime.strptime(time_str, "%Y-%m-%d %H:%M"))
-        except ValueError:
-            pass
-        
-        # Try MM-DD HH:MM format (assume current year)
-        try:
-            time_with_year = f"{now.year}-{time_str}"
-            return user_timezone.localize(datetime.strptime(time_with_year, "%Y-%m-%d %H:%M"))
-        except ValueError:
-            pass
-        
-        # Try HH:MM format (assume today or tomorrow if time has passed)
-        try:
-            time_only = datetime.strptime(time_str, "%H:%M").time()
-            candidate = user_timezone.localize(datetime.combine(now.date(), time_only))
-            
-            # If time has passed today, assume tomorrow
-            if candidate <= now:
-                candidate = user_timezone.localize(datetime.combine(now.date() + timedelta(days=1), time_only))
-            
-            return candidate
-        except ValueError:
-            pass
-        
+        return parse_time(time_str, user_timezone)
+
+    def check_start_time(self, local_start: datetime) -> Optional[str]:
+        """Return an error message if an event can't start at this time"""
+        now = datetime.now(timezone.utc)
+        if local_start < now:
+            return "❌ Can't create past events"
+        if local_start < now + timedelta(minutes=EVENT_LEAD_MINUTES):
+            return f"❌ Events need {EVENT_LEAD_MINUTES}+ minutes lead time"
         return None
 
-    @app_commands.command(name="set_timezone", description="Set your timezone for event creation")
-    @app_commands.describe(timezone="Your timezone in UTC±X format (e.g., UTC+3)")
-    async def set_timezone(self, interaction: discord.Interaction, timezone: str):
-        if not interaction.guild:
-            return await interaction.response.send_message("❌ This command must be used in a server!", ephemeral=True)
+    def prepare_event(self, guild: discord.Guild, name: str, description: str, local_start: datetime,
+                      location: str, duration_minutes: int) -> Tuple[Optional[dict], Optional[str]]:
+        """Validate an event the way /create_event does; returns create_scheduled_event kwargs or an error"""
+        if not name.strip():
+            return None, "❌ Events need a name"
+        error = self.check_start_time(local_start)
+        if error:
+            return None, error
+        if not 1 <= duration_minutes <= MAX_EVENT_MINUTES:
+            return None, f"❌ Duration must be between 1 and {MAX_EVENT_MINUTES} minutes"
 
-        if not re.match(r'^UTC[+-]\d{1,2}$', timezone):
-            return await interaction.response.send_message(
-                "❌ Use format: UTC±X (e.g., UTC+2, UTC-7)", ephemeral=True)
+        # Check if location is a voice channel mention
+        location, voice_channel = resolve_location(guild, location)
+        if not voice_channel and not location.strip():
+            return None, "❌ Events need a location or voice channel"
 
-        try:
-            offset = int(timezone[3:])
-            if not (-12 <= offset <= 14):
-                raise ValueError
-        except ValueError:
+        return {
+            "name": name[:100],
+            "description": description[:1000],
+            "start_time": local_start.astimezone(pytz.UTC),
+            "end_time": (local_start + timedelta(minutes=duration_minutes)).astimezone(pytz.UTC),
+            "privacy_level": discord.PrivacyLevel.guild_only,
+            **location_kwargs(location, voice_channel)
+        }, None
+
+    def user_timezone(self, guild_id: str, user_id: int) -> Tuple[Optional[tzinfo], Optional[str]]:
+        """The user's tzinfo and its stored name, or (None, None) if they haven't set one"""
+        timezone_str = get_user_timezone(guild_id, user_id)
+        user_timezone = zone_for(timezone_str) if timezone_str else None
+        return (user_timezone, timezone_str) if user_timezone else (None, None)
+
+    def conflict_message(self, guild: discord.Guild, channel_id: int, start: datetime, end: datetime,
+                         user_timezone: tzinfo, ignore_id: Optional[int] = None) -> Optional[str]:
+        """Describe events already booked in the channel during [start, end), with the nearest free slot"""
+        clashes = schedule_index.conflicts(guild, channel_id, start, end, ignore_id)
+        if not clashes:
+            return None
+        lines = [f"❌ <#{channel_id}> is already booked at that time:"]
+        for event in clashes[:5]:
+            event_end = event.end_time or event.start_time + timedelta(minutes=DEFAULT_EVENT_MINUTES)
+            lines.append(f"• **{event.name}** {event.start_time.astimezone(user_timezone).strftime('%m-%d %H:%M')}"
+                         f"–{event_end.astimezone(user_timezone).strftime('%H:%M')} (`{event.id}`)")
+        earliest = datetime.now(timezone.utc) + timedelta(minutes=EVENT_LEAD_MINUTES)
+        slot = schedule_index.nearest_free_slot(guild, channel_id, start, end, earliest, ignore_id)
+        lines.append(f"Nearest free slot: {slot.astimezone(user_timezone).strftime('%Y-%m-%d %H:%M')}")
+        return "\n".join(lines)
+
+    @app_commands.command(name="set_timezone", description="Set your timezone for event creation")
+    @app_commands.describe(
+        timezone="A zone name (e.g., Europe/Berlin) or UTC±X offset (e.g., UTC+3)",
+        scope="Use it everywhere, or only in this server (default: everywhere)"
+    )
+    @app_commands.choices(scope=[
+        app_commands.Choice(name="Everywhere", value="global"),
+        app_commands.Choice(name="This server only", value="server")
+    ])
+    async def set_timezone(self, interaction: discord.Interaction, timezone: str, scope: Optional[app_commands.Choice[str]] = None):
+        if not interaction.guild and scope and scope.value == "server":
+            return await interaction.response.send_message("❌ Server timezones must be set in a server!", ephemeral=True)
+
+        timezone_str = normalize_timezone(timezone)
+        if not timezone_str:
             return await interaction.response.send_message(
-                "❌ Offset must be between -12 and 14", ephemeral=True)
+                "❌ Use a zone name like Europe/Berlin or America/New_York, or UTC±X between UTC-12 and UTC+14", ephemeral=True)
 
-        save_user_timezone(str(interaction.guild.id), interaction.user.id, timezone)
+        if scope and scope.value == "server":
+            save_user_timezone(str(interaction.guild.id), interaction.user.id, timezone_str)
+            where = "for this server"
+        else:
+            save_user_preference(interaction.user.id, "timezone", timezone_str)
+            # A global change replaces this server's old override
+            if interaction.guild:
+                save_user_timezone(str(interaction.guild.id), interaction.user.id, None)
+            where = "everywhere"
         await interaction.response.send_message(
-            f"✅ Timezone set to {timezone} for this server", ephemeral=True)
+            f"✅ Timezone set to {timezone_str} {where}", ephemeral=True)
 
     @app_commands.command(name="create_event", description="Create a scheduled event")
     @app_commands.describe(
         name="Event name",
         description="Event description",
-        time="Event time (YYYY-MM-DD HH:MM, MM-DD HH:MM, or HH:MM)",
+        time="Event time (YYYY-MM-DD HH:MM, MM-DD HH:MM, HH:MM, tomorrow 18:00, fri 18:00 or in 2h)",
         location="Event location or voice channel",
-        duration_minutes="Duration in minutes (default: 90)"
+        duration_minutes="Duration in minutes (default: 90)",
+        allow_overlap="Schedule even if the voice channel already has an event then"
     )
     async def create_event(self, interaction: discord.Interaction, name: str, description: str, 
-                          time: str, location: str, duration_minutes: int = 90):
+                          time: str, location: str, duration_minutes: int = 90, allow_overlap: bool = False):
         if not interaction.guild:
             return await interaction.response.send_message("❌ This command must be used in a server!", ephemeral=True)
 
@@ -87,19 +674,12 @@ class Events(commands.Cog):
             return await interaction.response.send_message(
                 "❌ Only staff, administrators, or owners can create events!", ephemeral=True)
 
-        guild_id = str(interaction.guild.id)
-        user_id = str(interaction.user.id)
-        user_timezones = load_user_timezones(guild_id)
-
-        if user_id not in user_timezones:
+        user_timezone, _ = self.user_timezone(str(interaction.guild.id), interaction.user.id)
+        if not user_timezone:
             return await interaction.response.send_message(
-                "❌ Set your timezone first with `/set_timezone UTC±X`", ephemeral=True)
+                "❌ Set your timezone first with `/set_timezone`", ephemeral=True)
 
         try:
-            timezone_str = user_timezones[user_id]
-            offset = int(timezone_str[3:])
-            user_timezone = pytz.FixedOffset(offset * 60)
-
             # Parse the time input
             local_start = self.parse_time_input(time, user_timezone)
             if not local_start:
@@ -107,45 +687,27 @@ class Events(commands.Cog):
                     "❌ Invalid time format! Use:\n"
                     "• YYYY-MM-DD HH:MM (2024-12-25 14:30)\n"
                     "• MM-DD HH:MM (12-25 14:30)\n" 
-                    "• HH:MM (14:30)",
+                    "• HH:MM (14:30)\n"
+                    "• tomorrow HH:MM / friday HH:MM\n"
+                    "• in 2h / in 1h30m / in 3 days",
                     ephemeral=True
                 )
 
-            # Validate time
-            now_local = datetime.now(user_timezone)
-            if local_start < now_local:
-                return await interaction.response.send_message(
-                    "❌ Can't create past events", ephemeral=True)
-            if local_start < now_local + timedelta(minutes=30):
-                return await interaction.response.send_message(
-                    "❌ Events need 30+ minutes lead time", ephemeral=True)
+            # Validate time, duration and location
+            event_kwargs, error = self.prepare_event(interaction.guild, name, description, local_start, location, duration_minutes)
+            if error:
+                return await interaction.response.send_message(error, ephemeral=True)
 
-            # Calculate end time
-            local_end = local_start + timedelta(minutes=duration_minutes)
-            utc_start = local_start.astimezone(pytz.UTC)
-            utc_end = local_end.astimezone(pytz.UTC)
+            if "channel" in event_kwargs and not allow_overlap:
+                conflict = self.conflict_message(interaction.guild, event_kwargs["channel"].id, event_kwargs["start_time"],
+                                                 event_kwargs["end_time"], user_timezone)
+                if conflict:
+                    return await interaction.response.send_message(
+                        f"{conflict}\nUse `allow_overlap: True` to schedule anyway", ephemeral=True)
 
-            # Check if location is a voice channel mention
-            voice_channel = None
-            if location.startswith('<#') and location.endswith('>'):
-                try:
-                    channel_id = int(location[2:-1])
-                    voice_channel = interaction.guild.get_channel(channel_id)
-                    if voice_channel and isinstance(voice_channel, discord.VoiceChannel):
-                        location = voice_channel.name
-                except:
-                    pass
-
-            # Create event
-            event = await interaction.guild.create_scheduled_event(
-                name=name[:100],
-                description=description[:1000],
-                start_time=utc_start,
-                end_time=utc_end,
-                location=location[:100],
-                privacy_level=discord.PrivacyLevel.guild_only,
-                entity_type=discord.EntityType.voice if voice_channel else discord.EntityType.external
-            )
+            # Creation can wait behind other queued creations, so acknowledge first
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            event = await event_creator.create(interaction.guild, **event_kwargs)
 
             embed = discord.Embed(
                 title="✅ Event Created",
@@ -158,18 +720,155 @@ class Events(commands.Cog):
             embed.add_field(name="Location", value=location, inline=False)
             embed.add_field(name="Event ID", value=f"`{event.id}`", inline=True)
             
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True)
 
         except Exception as e:
             logger.error(f"Error creating event: {e}")
-            await interaction.response.send_message(f"❌ Error creating event: {str(e)}", ephemeral=True)
+            if interaction.response.is_done():
+                await interaction.followup.send(f"❌ Error creating event: {str(e)}", ephemeral=True)
+            else:
+                await interaction.response.send_message(f"❌ Error creating event: {str(e)}", ephemeral=True)
 
-    @app_commands.command(name="change_event_time", description="Change the time of an existing event")
+    async def fill_series(self, guild: discord.Guild, series_id: str) -> List[discord.ScheduledEvent]:
+        """Create the series' missing occurrences inside the rolling window"""
+        if series_id in self.filling:
+            return []
+        self.filling.add(series_id)
+        guild_id = str(guild.id)
+        created = []
+        try:
+            series = load_event_series(guild_id).get(series_id)
+            if not series or series.get("finished"):
+                return []
+            user_timezone = zone_for(series["timezone"])
+            if not user_timezone:
+                logger.error(f"❌ Series {series_id} has an unrecognized timezone {series['timezone']}")
+                return []
+
+            # Forget events that already ended or were deleted
+            series["event_ids"] = [event_id for event_id in series["event_ids"] if event_cache.get(guild.id, int(event_id))]
+            now = datetime.now(timezone.utc)
+            earliest = now + timedelta(minutes=EVENT_LEAD_MINUTES)
+            horizon = now + timedelta(days=RECURRING_WINDOW_DAYS)
+            duration = timedelta(minutes=series["duration_minutes"])
+            voice_channel = guild.get_channel(int(series["voice_channel_id"])) if series.get("voice_channel_id") else None
+
+            occurrences = iter_occurrences(series["rule"], datetime.fromisoformat(series["start"]), user_timezone)
+            for occurrence in islice(occurrences, series["next_index"], None):
+                if occurrence > horizon or len(series["event_ids"]) >= RECURRING_MAX_AHEAD:
+                    break
+                if occurrence >= earliest:
+                    if event_creator.capacity_left(guild) <= 0:
+                        logger.warning(f"⚠️ Guild {guild_id} is at the scheduled event cap, series {series_id} paused")
+                        break
+                    event = await event_creator.create(
+                        guild,
+                        name=series["name"][:100],
+                        description=series["description"][:1000],
+                        start_time=occurrence.astimezone(pytz.UTC),
+                        end_time=(occurrence + duration).astimezone(pytz.UTC),
+                        privacy_level=discord.PrivacyLevel.guild_only,
+                        **location_kwargs(series["location"], voice_channel)
+                    )
+                    series["event_ids"].append(str(event.id))
+                    created.append(event)
+                # Occurrences that are too close or already past are skipped for good
+                series["next_index"] += 1
+                save_event_series(guild_id, series_id, series)
+            else:
+                series["finished"] = True
+                save_event_series(guild_id, series_id, series)
+        except Exception as e:
+            logger.error(f"❌ Error filling event series {series_id}: {e}")
+        finally:
+            self.filling.discard(series_id)
+        return created
+
+    @tasks.loop(hours=1)
+    async def top_up_series(self):
+        for guild in self.bot.guilds:
+            for series_id, series in load_event_series(str(guild.id)).items():
+                if not series.get("finished"):
+                    await self.fill_series(guild, series_id)
+
+    @top_up_series.before_loop
+    async def before_top_up_series(self):
+        await self.bot.wait_until_ready()
+
+    @app_commands.command(name="create_recurring_event", description="Create a repeating scheduled event")
     @app_commands.describe(
-        event_id="The ID of the event to modify",
-        new_time="New event time (YYYY-MM-DD HH:MM, MM-DD HH:MM, or HH:MM)"
+        name="Event name",
+        description="Event description",
+        first_time="Time of the first occurrence (same formats as /create_event)",
+        rule="Repeat rule, e.g. FREQ=WEEKLY;BYDAY=TU,TH;COUNT=12 (DAILY/WEEKLY/MONTHLY, INTERVAL, COUNT, UNTIL)",
+        location="Event location or voice channel",
+        duration_minutes="Duration in minutes (default: 90)"
     )
-    async def change_event_time(self, interaction: discord.Interaction, event_id: str, new_time: str):
+    async def create_recurring_event(self, interaction: discord.Interaction, name: str, description: str, first_time: str,
+                                     rule: str, location: str, duration_minutes: app_commands.Range[int, 1, 1440] = 90):
+        if not interaction.guild:
+            return await interaction.response.send_message("❌ This command must be used in a server!", ephemeral=True)
+
+        if not has_event_access(interaction):
+            return await interaction.response.send_message(
+                "❌ Only staff, administrators, or owners can create events!", ephemeral=True)
+
+        guild_id = str(interaction.guild.id)
+        user_timezone, timezone_str = self.user_timezone(guild_id, interaction.user.id)
+        if not user_timezone:
+            return await interaction.response.send_message(
+                "❌ Set your timezone first with `/set_timezone`", ephemeral=True)
+
+        local_start = self.parse_time_input(first_time, user_timezone)
+        if not local_start:
+            return await interaction.response.send_message("❌ Invalid time format! Use the same formats as `/create_event`", ephemeral=True)
+        error = self.check_start_time(local_start)
+        if error:
+            return await interaction.response.send_message(error, ephemeral=True)
+
+        try:
+            parsed_rule = parse_recurrence(rule)
+        except ValueError as e:
+            return await interaction.response.send_message(f"❌ Invalid rule: {e}", ephemeral=True)
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        location, voice_channel = resolve_location(interaction.guild, location)
+        series_id = uuid.uuid4().hex[:8]
+        save_event_series(guild_id, series_id, {
+            "name": name,
+            "description": description,
+            "location": location,
+            "voice_channel_id": str(voice_channel.id) if voice_channel else None,
+            "duration_minutes": duration_minutes,
+            "timezone": timezone_str,
+            "start": local_start.isoformat(),
+            "rule": parsed_rule,
+            "next_index": 0,
+            "event_ids": [],
+            "created_by": str(interaction.user.id),
+            "created_at": datetime.now(timezone.utc).isoformat()
+        })
+
+        created = await self.fill_series(interaction.guild, series_id)
+
+        embed = discord.Embed(
+            title="✅ Recurring Event Created",
+            description=f"**{name}** repeats with `{rule.strip()[:200]}`",
+            color=discord.Color.green()
+        )
+        upcoming = "\n".join(
+            f"• {event.start_time.astimezone(user_timezone).strftime('%Y-%m-%d %H:%M')} (`{event.id}`)" for event in created
+        )
+        embed.add_field(name=f"Scheduled Now ({len(created)})", value=upcoming or "None yet", inline=False)
+        embed.add_field(name="Series ID", value=f"`{series_id}`", inline=True)
+        embed.set_footer(text=f"Occurrences are created up to {RECURRING_WINDOW_DAYS} days ahead and topped up automatically")
+
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="stop_recurring_event", description="Stop creating new occurrences of a recurring event")
+    @app_commands.describe(series_id="ID of the recurring event series")
+    async def stop_recurring_event(self, interaction: discord.Interaction, series_id: str):
         if not interaction.guild:
             return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
 
@@ -177,12 +876,217 @@ class Events(commands.Cog):
             return await interaction.response.send_message("❌ Permission denied!", ephemeral=True)
 
         guild_id = str(interaction.guild.id)
-        user_id = str(interaction.user.id)
-        user_timezones = load_user_timezones(guild_id)
+        series = load_event_series(guild_id).get(series_id)
+        if not series:
+            return await interaction.response.send_message(f"❌ Series `{series_id}` not found", ephemeral=True)
+        if series_id in self.filling:
+            return await interaction.response.send_message("⏳ That series is creating events right now, try again shortly", ephemeral=True)
+
+        save_event_series(guild_id, series_id, None)
+        await interaction.response.send_message(
+            f"✅ Stopped **{series['name']}**. Already scheduled occurrences were kept.", ephemeral=True)
+
+    @app_commands.command(name="add_event_reminder", description="Remind a channel or interested users before an event starts")
+    @app_commands.describe(
+        event_id="The ID of the event",
+        before="Comma-separated times before the start (e.g. 24h,1h,10m)",
+        deliver_to="Post in a channel or DM everyone marked as interested",
+        channel="Channel to post in (defaults to this channel)"
+    )
+    @app_commands.choices(deliver_to=[
+        app_commands.Choice(name="Channel", value="channel"),
+        app_commands.Choice(name="Interested users (DM)", value="dm")
+    ])
+    @app_commands.autocomplete(event_id=event_id_autocomplete)
+    async def add_event_reminder(self, interaction: discord.Interaction, event_id: str, before: str,
+                                 deliver_to: app_commands.Choice[str], channel: Optional[discord.TextChannel] = None):
+        if not interaction.guild:
+            return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
+
+        if not has_event_access(interaction):
+            return await interaction.response.send_message("❌ Permission denied!", ephemeral=True)
+
+        offsets = []
+        for part in before.split(","):
+            delta = parse_duration(part)
+            if not delta or delta <= timedelta(0):
+                return await interaction.response.send_message(f"❌ Couldn't read `{part.strip()[:50]}`, use values like 24h, 1h or 10m", ephemeral=True)
+            offsets.append(int(delta.total_seconds() // 60))
+        offsets = sorted(set(offsets), reverse=True)
+        if len(offsets) > MAX_REMINDERS_PER_EVENT:
+            return await interaction.response.send_message(f"❌ At most {MAX_REMINDERS_PER_EVENT} reminders per event", ephemeral=True)
+
+        try:
+            event = await event_cache.fetch(interaction.guild, int(event_id.strip()))
+        except (ValueError, discord.NotFound):
+            return await interaction.response.send_message("❌ Event not found!", ephemeral=True)
+
+        now = datetime.now(timezone.utc)
+        upcoming = [offset for offset in offsets if event.start_time - timedelta(minutes=offset) > now]
+        if not upcoming:
+            return await interaction.response.send_message("❌ All of those reminder times have already passed", ephemeral=True)
+
+        target_channel = channel or interaction.channel
+        guild_id = str(interaction.guild.id)
+        event_reminders.add(guild_id, event, upcoming, deliver_to.value, target_channel.id if deliver_to.value == "channel" else None)
+
+        when = ", ".join(f"<t:{int(event.start_time.timestamp()) - offset * 60}:R>" for offset in upcoming)
+        where = target_channel.mention if deliver_to.value == "channel" else "interested users by DM"
+        skipped = len(offsets) - len(upcoming)
+        note = f"\nℹ️ Skipped {skipped} reminder(s) that would already have passed" if skipped else ""
+        await interaction.response.send_message(f"✅ Reminders for **{event.name}** to {where}: {when}{note}", ephemeral=True)
+
+    @app_commands.command(name="clear_event_reminders", description="Remove all pending reminders for an event")
+    @app_commands.describe(event_id="The ID of the event")
+    @app_commands.autocomplete(event_id=event_id_autocomplete)
+    async def clear_event_reminders(self, interaction: discord.Interaction, event_id: str):
+        if not interaction.guild:
+            return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
+
+        if not has_event_access(interaction):
+            return await interaction.response.send_message("❌ Permission denied!", ephemeral=True)
+
+        try:
+            event_id_int = int(event_id.strip())
+        except ValueError:
+            return await interaction.response.send_message("❌ Invalid event ID format.", ephemeral=True)
+
+        removed = event_reminders.clear_event(str(interaction.guild.id), event_id_int)
+        await interaction.response.send_message(f"✅ Removed {removed} pending reminder(s)", ephemeral=True)
+
+    @app_commands.command(name="import_events", description="Create scheduled events from a CSV or ICS file")
+    @app_commands.describe(
+        file="CSV with name,description,time,location,duration_minutes columns, or an .ics calendar",
+        dry_run="Only validate the file without creating anything",
+        allow_overlap="Create events even if their voice channel already has an event then"
+    )
+    async def import_events(self, interaction: discord.Interaction, file: discord.Attachment, dry_run: bool = False,
+                            allow_overlap: bool = False):
+        if not interaction.guild:
+            return await interaction.response.send_message("❌ This command must be used in a server!", ephemeral=True)
+
+        if not has_event_access(interaction):
+            return await interaction.response.send_message(
+                "❌ Only staff, administrators, or owners can create events!", ephemeral=True)
 
-        if user_id not in user_timezones:
+        guild = interaction.guild
+        user_timezone, _ = self.user_timezone(str(guild.id), interaction.user.id)
+        if not user_timezone:
             return await interaction.response.send_message(
-                "❌ Set your timezone first with `/set_timezone UTC±X`", ephemeral=True)
+                "❌ Set your timezone first with `/set_timezone`", ephemeral=True)
+
+        filename = file.filename.lower()
+        if not filename.endswith((".csv", ".ics")):
+            return await interaction.response.send_message("❌ Upload a .csv or .ics file", ephemeral=True)
+        if file.size > IMPORT_MAX_BYTES:
+            return await interaction.response.send_message(f"❌ Files can be at most {IMPORT_MAX_BYTES // 1024} KB", ephemeral=True)
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        # Validate every row before creating anything. discord.py only hands attachments over whole,
+        # so the (size-capped) bytes are read once and decoded and parsed line by line from there
+        lines = io.TextIOWrapper(io.BytesIO(await file.read()), encoding="utf-8-sig", errors="replace", newline="")
+        results: Dict[int, str] = {}
+        valid = []
+        accepted = RowIntervals()
+        capacity = event_creator.capacity_left(guild)
+        try:
+            rows = iter_csv_events(lines) if filename.endswith(".csv") else iter_ics_events(lines, user_timezone)
+            for row in rows:
+                if row.get("error"):
+                    results[row["row"]] = f"❌ {row['error']}"
+                    continue
+                local_start = row.get("start") or self.parse_time_input(row["time"], user_timezone)
+                if not local_start:
+                    results[row["row"]] = f"❌ couldn't read time `{row['time'][:40]}`"
+                    continue
+                try:
+                    duration = int(row["duration_minutes"]) if row["duration_minutes"] else 90
+                except ValueError:
+                    results[row["row"]] = f"❌ duration `{row['duration_minutes'][:20]}` isn't a number"
+                    continue
+                event_kwargs, error = self.prepare_event(guild, row["name"], row["description"], local_start, row["location"], duration)
+                if not error and "channel" in event_kwargs and not allow_overlap:
+                    clashes = schedule_index.conflicts(guild, event_kwargs["channel"].id, event_kwargs["start_time"], event_kwargs["end_time"])
+                    if clashes:
+                        error = f"❌ overlaps **{clashes[0].name}** (`{clashes[0].id}`) in <#{event_kwargs['channel'].id}>"
+                    else:
+                        earlier = accepted.clash(event_kwargs["channel"].id, event_kwargs["start_time"], event_kwargs["end_time"])
+                        if earlier:
+                            error = f"❌ overlaps row {earlier} in <#{event_kwargs['channel'].id}>"
+                if error:
+                    results[row["row"]] = error
+                elif len(valid) >= capacity:
+                    results[row["row"]] = f"⏭️ skipped, the server is at its {GUILD_EVENT_CAP} event limit"
+                else:
+                    valid.append((row["row"], event_kwargs))
+                    if "channel" in event_kwargs and not allow_overlap:
+                        accepted.add(event_kwargs["channel"].id, event_kwargs["start_time"], event_kwargs["end_time"], row["row"])
+        except (ValueError, csv.Error) as e:
+            return await interaction.followup.send(f"❌ Couldn't read the file: {e}", ephemeral=True)
+
+        if not results and not valid:
+            return await interaction.followup.send("ℹ️ No events found in that file", ephemeral=True)
+
+        if dry_run:
+            for row_number, event_kwargs in valid:
+                results[row_number] = f"✅ would create **{event_kwargs['name']}** <t:{int(event_kwargs['start_time'].timestamp())}:f>"
+        elif valid:
+            progress = await interaction.followup.send(f"📅 Creating events... 0/{len(valid)}", ephemeral=True, wait=True)
+            done = [0]
+
+            async def create_one(row_number: int, event_kwargs: dict):
+                try:
+                    event = await event_creator.create(guild, **event_kwargs)
+                    results[row_number] = f"✅ **{event.name}** (`{event.id}`)"
+                except discord.HTTPException as e:
+                    results[row_number] = f"❌ Discord rejected it: {e.text or e.status}"
+                done[0] += 1
+
+            async def report():
+                while True:
+                    await asyncio.sleep(3)
+                    await progress.edit(content=f"📅 Creating events... {done[0]}/{len(valid)}")
+
+            # Creations queue on the guild's token bucket, so gathering them doesn't burst REST calls
+            reporter = asyncio.create_task(report())
+            try:
+                await asyncio.gather(*(create_one(row_number, event_kwargs) for row_number, event_kwargs in valid))
+            finally:
+                reporter.cancel()
+            await progress.edit(content=f"📅 Created {sum(r.startswith('✅') for r in results.values())}/{len(valid)} events")
+
+        label = "Row" if filename.endswith(".csv") else "Event"
+        summary = "\n".join(f"{label} {row_number}: {result}" for row_number, result in sorted(results.items()))
+        created = sum(result.startswith("✅") for result in results.values())
+        header = f"{'🔎 Dry run' if dry_run else '📥 Import'}: {created} ok, {len(results) - created} not created"
+        if len(header) + len(summary) < 1900:
+            await interaction.followup.send(f"{header}\n{summary}", ephemeral=True)
+        else:
+            await interaction.followup.send(
+                header,
+                file=discord.File(io.BytesIO(summary.encode("utf-8")), filename="import-results.txt"),
+                ephemeral=True
+            )
+
+    @app_commands.command(name="change_event_time", description="Change the time of an existing event")
+    @app_commands.describe(
+        event_id="The ID of the event to modify",
+        new_time="New event time (YYYY-MM-DD HH:MM, MM-DD HH:MM, HH:MM, tomorrow 18:00, fri 18:00 or in 2h)",
+        allow_overlap="Move it even if the voice channel already has an event then"
+    )
+    @app_commands.autocomplete(event_id=event_id_autocomplete)
+    async def change_event_time(self, interaction: discord.Interaction, event_id: str, new_time: str, allow_overlap: bool = False):
+        if not interaction.guild:
+            return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
+
+        if not has_event_access(interaction):
+            return await interaction.response.send_message("❌ Permission denied!", ephemeral=True)
+
+        user_timezone, _ = self.user_timezone(str(interaction.guild.id), interaction.user.id)
+        if not user_timezone:
+            return await interaction.response.send_message(
+                "❌ Set your timezone first with `/set_timezone`", ephemeral=True)
 
         await interaction.response.defer(ephemeral=True)
         
@@ -193,20 +1097,18 @@ class Events(commands.Cog):
 
         try:
             # Get the event
-            event = await interaction.guild.fetch_scheduled_event(event_id_int)
+            event = await event_cache.fetch(interaction.guild, event_id_int)
             
             # Parse the new time
-            timezone_str = user_timezones[user_id]
-            offset = int(timezone_str[3:])
-            user_timezone = pytz.FixedOffset(offset * 60)
-            
             new_local_start = self.parse_time_input(new_time, user_timezone)
             if not new_local_start:
                 return await interaction.followup.send(
                     "❌ Invalid time format! Use:\n"
                     "• YYYY-MM-DD HH:MM (2024-12-25 14:30)\n"
                     "• MM-DD HH:MM (12-25 14:30)\n" 
-                    "• HH:MM (14:30)",
+                    "• HH:MM (14:30)\n"
+                    "• tomorrow HH:MM / friday HH:MM\n"
+                    "• in 2h / in 1h30m / in 3 days",
                     ephemeral=True
                 )
 
@@ -218,12 +1120,19 @@ class Events(commands.Cog):
                 return await interaction.followup.send("❌ Events need 30+ minutes lead time!", ephemeral=True)
 
             # Calculate new end time (preserve original duration)
-            original_duration = event.end_time - event.start_time
+            original_duration = event.end_time - event.start_time if event.end_time else timedelta(minutes=DEFAULT_EVENT_MINUTES)
             new_utc_start = new_local_start.astimezone(pytz.UTC)
             new_utc_end = new_utc_start + original_duration
 
+            if event.channel_id and not allow_overlap:
+                conflict = self.conflict_message(interaction.guild, event.channel_id, new_utc_start, new_utc_end, user_timezone, event.id)
+                if conflict:
+                    return await interaction.followup.send(f"{conflict}\nUse `allow_overlap: True` to move it anyway", ephemeral=True)
+
             # Update the event
-            await event.edit(start_time=new_utc_start, end_time=new_utc_end)
+            event = await event.edit(start_time=new_utc_start, end_time=new_utc_end)
+            event_cache.put(event)
+            event_reminders.reschedule_event(event)
             
             embed = discord.Embed(
                 title="✅ Event Time Updated",
@@ -244,60 +1153,110 @@ class Events(commands.Cog):
             await interaction.followup.send(f"❌ Failed to change event time: {e}", ephemeral=True)
 
     @app_commands.command(name="list_events", description="List all upcoming events")
-    async def list_events(self, interaction: discord.Interaction):
+    @app_commands.describe(
+        status="Only show events with this status",
+        channel="Only show events in this voice channel",
+        from_date="Only show events starting on or after this date (YYYY-MM-DD, your timezone)",
+        to_date="Only show events starting on or before this date (YYYY-MM-DD, your timezone)"
+    )
+    @app_commands.choices(status=[
+        app_commands.Choice(name="Scheduled", value="scheduled"),
+        app_commands.Choice(name="Active", value="active")
+    ])
+    async def list_events(self, interaction: discord.Interaction, status: Optional[app_commands.Choice[str]] = None,
+                          channel: Optional[discord.VoiceChannel] = None, from_date: Optional[str] = None, to_date: Optional[str] = None):
         if not interaction.guild:
             return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
 
-        await interaction.response.defer(ephemeral=True)
-        
+        # Resolve the user's timezone once for the whole list
+        user_timezone, timezone_str = self.user_timezone(str(interaction.guild.id), interaction.user.id)
+        date_timezone = user_timezone or pytz.UTC
         try:
-            events = await interaction.guild.fetch_scheduled_events()
-            if not events:
-                return await interaction.followup.send("📭 No upcoming events found", ephemeral=True)
+            start = localize(date_timezone, datetime.strptime(from_date, "%Y-%m-%d")) if from_date else None
+            end = localize(date_timezone, datetime.strptime(to_date, "%Y-%m-%d") + timedelta(days=1)) if to_date else None
+        except ValueError:
+            return await interaction.response.send_message("❌ Dates must use the format YYYY-MM-DD", ephemeral=True)
 
-            # Sort events by start time
-            events = sorted(events, key=lambda x: x.start_time)
-            
-            embed = discord.Embed(title="📅 Upcoming Events", color=discord.Color.blue())
-            
-            for event in events[:8]:
-                status_emoji = "🟢" if event.status == discord.EventStatus.scheduled else "🟡" if event.status == discord.EventStatus.active else "🔴"
-                
-                # Convert to user's timezone if available
-                time_display = event.start_time.strftime('%b %d, %Y %H:%M UTC')
-                guild_id = str(interaction.guild.id)
-                user_id = str(interaction.user.id)
-                user_timezones = load_user_timezones(guild_id)
-                
-                if user_id in user_timezones:
-                    try:
-                        timezone_str = user_timezones[user_id]
-                        offset = int(timezone_str[3:])
-                        user_timezone = pytz.FixedOffset(offset * 60)
-                        local_time = event.start_time.astimezone(user_timezone)
-                        time_display = f"{local_time.strftime('%b %d, %Y %H:%M')} ({timezone_str})"
-                    except:
-                        pass
-                
-                embed.add_field(
-                    name=f"{status_emoji} {event.name}",
-                    value=f"**When:** {time_display}\n"
-                          f"**Where:** {event.location or 'TBA'}\n"
-                          f"**ID:** `{event.id}`",
-                    inline=False
-                )
+        try:
+            events, lo, hi = event_cache.window(interaction.guild, start, end)
+            view = EventListView(
+                events, lo, hi, discord.EventStatus[status.value] if status else None,
+                channel.id if channel else None, user_timezone, timezone_str
+            )
+            embed = view.render()
+            if not view.matches:
+                return await interaction.response.send_message("📭 No upcoming events found", ephemeral=True)
             
-            if len(events) > 8:
-                embed.set_footer(text=f"Showing 8 of {len(events)} events. Use /event_info for details.")
-                
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
             
         except Exception as e:
             logger.error(f"Error listing events: {e}")
-            await interaction.followup.send(f"❌ Failed to fetch events: {e}", ephemeral=True)
+            await interaction.response.send_message(f"❌ Failed to list events: {e}", ephemeral=True)
+
+    @app_commands.command(name="event_attendees", description="Download the users interested in an event as CSV")
+    @app_commands.describe(event_id="The ID of the event")
+    @app_commands.autocomplete(event_id=event_id_autocomplete)
+    async def event_attendees(self, interaction: discord.Interaction, event_id: str):
+        if not interaction.guild:
+            return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
+
+        if not has_event_access(interaction):
+            return await interaction.response.send_message("❌ Permission denied!", ephemeral=True)
+
+        try:
+            event = await event_cache.fetch(interaction.guild, int(event_id.strip()))
+        except (ValueError, discord.NotFound):
+            return await interaction.response.send_message("❌ Event not found!", ephemeral=True)
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        # Rows go straight to a temporary file while paging through users, so memory stays flat
+        guild = interaction.guild
+        limit = guild.filesize_limit - 64 * 1024
+        with tempfile.TemporaryFile() as raw:
+            output = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+            writer = csv.writer(output)
+            writer.writerow(["user_id", "username", "display_name", "in_server"])
+            count, truncated = 0, False
+            try:
+                async for user in event.users(limit=EVENT_USERS_LIMIT):
+                    writer.writerow([user.id, user.name, user.display_name, "yes" if guild.get_member(user.id) else "no"])
+                    count += 1
+                    if count % 500 == 0 and output.tell() > limit:
+                        truncated = True
+                        break
+                output.flush()
+            except discord.HTTPException as e:
+                return await interaction.followup.send(f"❌ Failed to fetch attendees: {e}", ephemeral=True)
+
+            if not truncated:
+                attendance.set(event, count)
+                entry = attendance.sample(event)
+                if entry:
+                    record_attendance_samples(str(guild.id), {str(event.id): entry})
+
+            message = f"👥 **{count}** users interested in **{event.name}**"
+            if truncated:
+                message += "\n⚠️ The list hit the upload size limit and was cut off"
+            samples = load_event_attendance(str(guild.id)).get(str(event.id), {}).get("samples", [])
+            counted = [sample[1] for sample in samples if sample[1] is not None]
+            if len(counted) > 1:
+                message += f"\n📈 Since <t:{samples[0][0]}:d>: peak {max(counted)} interested across {len(samples)} snapshots"
+            in_channel = [sample[2] for sample in samples if sample[2] is not None]
+            if in_channel:
+                message += f"\n🎙️ Peak in the voice channel: {max(in_channel)}"
+
+            output.detach()
+            raw.seek(0)
+            await interaction.followup.send(
+                message,
+                file=discord.File(raw, filename=f"attendees-{event.id}.csv"),
+                ephemeral=True
+            )
 
     @app_commands.command(name="event_info", description="Get detailed information about an event")
     @app_commands.describe(event_id="The ID of the event")
+    @app_commands.autocomplete(event_id=event_id_autocomplete)
     async def event_info(self, interaction: discord.Interaction, event_id: str):
         if not interaction.guild:
             return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
@@ -308,7 +1267,7 @@ class Events(commands.Cog):
             return await interaction.response.send_message("❌ Invalid event ID format.", ephemeral=True)
 
         try:
-            event = await interaction.guild.fetch_scheduled_event(event_id_int)
+            event = await event_cache.fetch(interaction.guild, event_id_int)
             
             embed = discord.Embed(
                 title=f"📊 Event Info: {event.name}",
@@ -326,29 +1285,19 @@ class Events(commands.Cog):
             start_time_display = event.start_time.strftime('%Y-%m-%d %H:%M UTC')
             end_time_display = event.end_time.strftime('%Y-%m-%d %H:%M UTC')
             
-            guild_id = str(interaction.guild.id)
-            user_id = str(interaction.user.id)
-            user_timezones = load_user_timezones(guild_id)
-            
-            if user_id in user_timezones:
-                try:
-                    timezone_str = user_timezones[user_id]
-                    offset = int(timezone_str[3:])
-                    user_timezone = pytz.FixedOffset(offset * 60)
-                    
-                    start_local = event.start_time.astimezone(user_timezone)
-                    end_local = event.end_time.astimezone(user_timezone)
-                    
-                    start_time_display = f"{start_local.strftime('%Y-%m-%d %H:%M')} ({timezone_str})"
-                    end_time_display = f"{end_local.strftime('%Y-%m-%d %H:%M')} ({timezone_str})"
-                except:
-                    pass
+            user_timezone, timezone_str = self.user_timezone(str(interaction.guild.id), interaction.user.id)
+            if user_timezone:
+                start_local = event.start_time.astimezone(user_timezone)
+                end_local = event.end_time.astimezone(user_timezone)
+                
+                start_time_display = f"{start_local.strftime('%Y-%m-%d %H:%M')} ({timezone_str})"
+                end_time_display = f"{end_local.strftime('%Y-%m-%d %H:%M')} ({timezone_str})"
             
             embed.add_field(name="Status", value=status_map.get(event.status, "Unknown"), inline=True)
             embed.add_field(name="Start Time", value=start_time_display, inline=False)
             embed.add_field(name="End Time", value=end_time_display, inline=False)
             embed.add_field(name="Location", value=event.location or "Not specified", inline=True)
-            embed.add_field(name="Subscribers", value=str(event.subscriber_count), inline=True)
+            embed.add_field(name="Interested", value=str(attendance.counts.get(event.id, event.user_count)), inline=True)
             
             if event.creator:
                 embed.add_field(name="Creator", value=event.creator.mention, inline=True)
@@ -363,6 +1312,7 @@ class Events(commands.Cog):
 
     @app_commands.command(name="delete_event", description="Delete an event")
     @app_commands.describe(event_id="The ID of the event to delete")
+    @app_commands.autocomplete(event_id=event_id_autocomplete)
     async def delete_event(self, interaction: discord.Interaction, event_id: str):
         if not interaction.guild:
             return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
@@ -378,9 +1328,11 @@ class Events(commands.Cog):
             return await interaction.followup.send("❌ Invalid event ID format.", ephemeral=True)
 
         try:
-            event = await interaction.guild.fetch_scheduled_event(event_id_int)
+            event = await event_cache.fetch(interaction.guild, event_id_int)
             event_name = event.name
             await event.delete()
+            event_cache.remove(interaction.guild.id, event.id)
+            event_reminders.clear_event(str(interaction.guild.id), event.id)
             await interaction.followup.send(f"✅ Deleted event: **{event_name}**", ephemeral=True)
             
         except discord.NotFound:
@@ -1,25 +1,210 @@
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord.ui import Button, View, TextInput, Modal, Select
 import uuid
-from datetime import datetime, timezone
+import heapq
+import bisect
+import itertools
+from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, Optional, List
 import asyncio
 import re
 import io
+import time
+import contextlib
 from utils.storage import (
     load_multi_ticket_configs, save_multi_ticket_configs, get_multi_ticket_setup_by_id,
     load_ticket_configs, save_ticket_configs, get_ticket_setup_by_id,
-    load_active_tickets, save_active_ticket, get_ticket_data, remove_active_ticket,
-    load_staff_roles, increment_user_ticket_count, reset_user_ticket_count,
-    load_user_ticket_counts, update_ticket_data
+    load_active_tickets, get_ticket_data, remove_active_ticket,
+    load_staff_roles, reset_user_ticket_count,
+    load_user_ticket_counts, update_ticket_data, record_ticket_open, remove_active_tickets,
+    get_panel_registry, get_ticket_option, render_title,
+    load_staff_availability, save_staff_availability, load_handle_digests, save_handle_digest,
+    apply_ticket_reconciliation, update_ticket_activity
 )
 from utils.permissions import is_admin_or_owner, has_event_access
+from utils.ratelimit import TokenBucket
+from utils.scheduler import DeadlineScheduler
+from utils.transcript_index import index_transcript, search_transcripts, export_transcripts
+from utils.analytics import record_ticket_opened, record_first_join, record_ticket_closed, get_ticket_stats
+
+# Ticket-open admission limits (per guild)
+TICKET_QUEUE_SIZE = 200      # requests waiting before new clicks are turned away
+TICKET_OPEN_BURST = 5        # thread creations allowed back to back
+TICKET_OPEN_RATE = 1.0       # sustained thread creations per second
+TICKET_OPEN_CONCURRENCY = 3  # ticket pipelines running at once
+BULK_CLOSE_CONCURRENCY = 5   # tickets closed in parallel by /bulk_close
+RECONCILE_CONCURRENCY = 5    # thread fetches in flight during reconciliation
+RECONCILE_FETCH_RATE = 2.0   # thread fetches per second during reconciliation
+DEFAULT_TICKET_PRIORITY = 3  # options rank 1 (lowest) to 5 (highest)
+ALREADY_IN_FLIGHT = -1       # TicketAdmission.submit result when the user's ticket is already queued or opening
+TICKET_AUTO_ARCHIVE_MINUTES = 10080  # longest inactivity Discord allows before archiving a thread
+
+def parse_priority(value: Optional[str]) -> int:
+    try:
+        return min(max(int(value), 1), 5)
+    except (TypeError, ValueError):
+        return DEFAULT_TICKET_PRIORITY
+
+# The event loop only holds weak references to tasks, so fire-and-forget work is kept here until it finishes
+background_tasks: set = set()
+
+def spawn(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+# Ticket-open admission control
+class TicketAdmission:
+    """Per-guild in-flight dedupe plus a bounded, paced queue of ticket opens"""
+    def __init__(self):
+        self.in_flight: Dict[str, set] = {}
+        self.queues: Dict[str, asyncio.Queue] = {}
+        self.workers: Dict[str, asyncio.Task] = {}
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.slots: Dict[str, asyncio.Semaphore] = {}
+
+    def is_in_flight(self, guild_id: str, user_id: int) -> bool:
+        return user_id in self.in_flight.get(guild_id, ())
+
+    def submit(self, guild_id: str, user_id: int, job) -> Optional[int]:
+        """
+        Queue a ticket open; returns the queue position, None when the queue is full,
+        or ALREADY_IN_FLIGHT when the user's ticket is already queued or opening.
+        Checking and marking happen without awaiting, so concurrent clicks can't both get in.
+        """
+        if self.is_in_flight(guild_id, user_id):
+            return ALREADY_IN_FLIGHT
+        if guild_id not in self.queues:
+            self.queues[guild_id] = asyncio.Queue(maxsize=TICKET_QUEUE_SIZE)
+            self.buckets[guild_id] = TokenBucket(TICKET_OPEN_RATE, TICKET_OPEN_BURST)
+            self.slots[guild_id] = asyncio.Semaphore(TICKET_OPEN_CONCURRENCY)
+        queue = self.queues[guild_id]
+        try:
+            queue.put_nowait((user_id, job))
+        except asyncio.QueueFull:
+            return None
+        
+        self.in_flight.setdefault(guild_id, set()).add(user_id)
+        worker = self.workers.get(guild_id)
+        if worker is None or worker.done():
+            self.workers[guild_id] = asyncio.create_task(self.drain(guild_id))
+        return queue.qsize()
+
+    async def drain(self, guild_id: str):
+        queue = self.queues[guild_id]
+        bucket = self.buckets[guild_id]
+        slots = self.slots[guild_id]
+        while not queue.empty():
+            user_id, job = queue.get_nowait()
+            await bucket.acquire()
+            await slots.acquire()
+            spawn(self.run(guild_id, user_id, job, slots))
+
+    async def run(self, guild_id: str, user_id: int, job, slots: asyncio.Semaphore):
+        try:
+            await job()
+        except Exception as e:
+            print(f"Error opening ticket: {e}")
+        finally:
+            slots.release()
+            self.in_flight.get(guild_id, set()).discard(user_id)
+
+ticket_admission = TicketAdmission()
+
+# Handle message updates
+class HandleMessageCoalescer:
+    """Merges handle message embed edits that arrive within a short window into one edit"""
+    def __init__(self, delay: float = 1.5):
+        self.delay = delay
+        self.embeds: Dict[int, discord.Embed] = {}
+        self.pending: Dict[int, discord.PartialMessage] = {}
+
+    def update(self, message, ticket_data: dict, thread_mention: str):
+        """Re-render the in-memory embed and schedule a single edit for the message"""
+        base = self.embeds.get(message.id)
+        if base is None:
+            embeds = getattr(message, "embeds", None)
+            base = embeds[0] if embeds else discord.Embed()
+        self.embeds[message.id] = build_handle_embed(base, ticket_data, thread_mention)
+        
+        if message.id not in self.pending:
+            self.pending[message.id] = message
+            spawn(self.flush(message.id))
+
+    async def flush(self, message_id: int):
+        await asyncio.sleep(self.delay)
+        message = self.pending.pop(message_id, None)
+        embed = self.embeds.get(message_id)
+        if message is None or embed is None:
+            return
+        try:
+            await message.edit(embed=embed)
+        except Exception as e:
+            print(f"Error updating handle message: {e}")
+
+    def forget(self, message_id: int):
+        """Drop state for a handle message that is being deleted"""
+        self.embeds.pop(message_id, None)
+        self.pending.pop(message_id, None)
+
+def build_handle_embed(base: discord.Embed, ticket_data: dict, thread_mention: str) -> discord.Embed:
+    """Rebuild the handle message embed with the current joined staff list"""
+    embed = base.copy()
+    embed.clear_fields()
+    
+    # Add basic info
+    embed.add_field(
+        name="Ticket Information",
+        value=f"**Creator:** {ticket_data.get('user_mention', 'Unknown')}\n**Ticket:** {thread_mention}",
+        inline=False
+    )
+    
+    # Add joined staff information
+    joined_staff = ticket_data.get('joined_staff', [])
+    if joined_staff:
+        staff_list = "\n".join([f"• {staff['name']} (<t:{int(datetime.fromisoformat(staff['joined_at']).timestamp())}:R>)" for staff in joined_staff])
+        embed.add_field(
+            name=f"Joined Staff ({len(joined_staff)})",
+            value=staff_list,
+            inline=False
+        )
+    else:
+        embed.add_field(
+            name="Joined Staff (0)",
+            value="No staff members have joined yet",
+            inline=False
+        )
+    return embed
+
+handle_updates = HandleMessageCoalescer()
+
+def record_staff_join(guild_id: str, thread_id: str, ticket_data: dict, member: discord.Member) -> bool:
+    """Add a staff member to the ticket's joined_staff list; returns False if they had already joined"""
+    # Get current joined staff list or initialize empty list
+    joined_staff = ticket_data.get('joined_staff', [])
+    if any(staff['id'] == str(member.id) for staff in joined_staff):
+        return False
+    
+    staff_info = {
+        'id': str(member.id),
+        'name': member.display_name,
+        'joined_at': datetime.now(timezone.utc).isoformat()
+    }
+    joined_staff.append(staff_info)
+    ticket_data['joined_staff'] = joined_staff
+    update_ticket_data(guild_id, thread_id, ticket_data)
+    staff_assigner.adjust(guild_id, member.id, 1)
+    unclaimed_queue.claim(guild_id, int(thread_id))
+    if len(joined_staff) == 1:
+        record_first_join(guild_id, ticket_data, staff_info['joined_at'])
+    return True
 
 # JoinTicketView class
 class JoinTicketView(View):
-    def __init__(self, thread_id: str, guild_id: str, handle_msg_id: str):
+    def __init__(self, thread_id: str, guild_id: str, handle_msg_id: Optional[str] = None):
         super().__init__(timeout=None)
         self.thread_id = thread_id
         self.guild_id = guild_id
@@ -38,52 +223,15 @@ class JoinTicketView(View):
                     if ticket_data and 'handle_channel_id' in ticket_data:
                         handle_channel = interaction.guild.get_channel(int(ticket_data['handle_channel_id']))
                         if handle_channel:
-                            handle_msg = await handle_channel.fetch_message(int(self.handle_msg_id))
-                            
-                            # Get current joined staff list or initialize empty list
-                            joined_staff = ticket_data.get('joined_staff', [])
-                            
-                            # Add current staff if not already in list
-                            staff_info = {
-                                'id': str(interaction.user.id),
-                                'name': interaction.user.display_name,
-                                'joined_at': datetime.now(timezone.utc).isoformat()
-                            }
-                            
-                            if not any(staff['id'] == str(interaction.user.id) for staff in joined_staff):
-                                joined_staff.append(staff_info)
-                                ticket_data['joined_staff'] = joined_staff
-                                update_ticket_data(self.guild_id, self.thread_id, ticket_data)
-                            
-                            # Update the embed with joined staff information
-                            embed = handle_msg.embeds[0] if handle_msg.embeds else discord.Embed()
+                            record_staff_join(self.guild_id, self.thread_id, ticket_data, interaction.user)
                             
-                            # Clear existing fields and rebuild
-                            embed.clear_fields()
-                            
-                            # Add basic info
-                            embed.add_field(
-                                name="Ticket Information",
-                                value=f"**Creator:** {ticket_data.get('user_mention', 'Unknown')}\n**Ticket:** {thread.mention}",
-                                inline=False
-                            )
-                            
-                            # Add joined staff information
-                            if joined_staff:
-                                staff_list = "\n".join([f"• {staff['name']} (<t:{int(datetime.fromisoformat(staff['joined_at']).timestamp())}:R>)" for staff in joined_staff])
-                                embed.add_field(
-                                    name=f"Joined Staff ({len(joined_staff)})",
-                                    value=staff_list,
-                                    inline=False
-                                )
+                            # The clicked message is the handle message, so no fetch is needed
+                            handle_msg_id = int(self.handle_msg_id or interaction.message.id)
+                            if interaction.message and interaction.message.id == handle_msg_id:
+                                handle_msg = interaction.message
                             else:
-                                embed.add_field(
-                                    name="Joined Staff (0)",
-                                    value="No staff members have joined yet",
-                                    inline=False
-                                )
-                            
-                            await handle_msg.edit(embed=embed)
+                                handle_msg = handle_channel.get_partial_message(handle_msg_id)
+                            handle_updates.update(handle_msg, ticket_data, thread.mention)
                 except Exception as e:
                     print(f"Error updating handle message: {e}")
                 
@@ -93,6 +241,113 @@ class JoinTicketView(View):
         except Exception as e:
             await interaction.response.send_message(f"❌ Error joining ticket: {str(e)}", ephemeral=True)
 
+# Handle channel digest mode
+class DigestJoinButton(discord.ui.DynamicItem[Button], template=r"digest_join:(?P<thread_id>[0-9]+)"):
+    """Join button on a digest message; the thread ID lives in the custom_id so it survives restarts"""
+    def __init__(self, thread_id: int, label: str = "Join"):
+        super().__init__(Button(label=label[:80], style=discord.ButtonStyle.primary, emoji="🎫", custom_id=f"digest_join:{thread_id}"))
+        self.thread_id = thread_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: Button, match):
+        return cls(int(match['thread_id']))
+
+    async def callback(self, interaction: discord.Interaction):
+        try:
+            guild_id = str(interaction.guild.id)
+            thread = interaction.guild.get_thread(self.thread_id)
+            ticket_data = get_ticket_data(guild_id, str(self.thread_id))
+            if not thread or not ticket_data:
+                return await interaction.response.send_message("❌ Ticket not found!", ephemeral=True)
+            
+            await thread.add_user(interaction.user)
+            if record_staff_join(guild_id, str(self.thread_id), ticket_data, interaction.user):
+                handle_digest.refresh(guild_id, ticket_data['panel_id'], ticket_data['option_id'])
+            
+            await interaction.response.send_message(f"✅ Joined ticket: {thread.mention}", ephemeral=True)
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Error joining ticket: {str(e)}", ephemeral=True)
+
+class HandleDigest:
+    """One pinned summary message per option listing unclaimed tickets, re-rendered at most once per interval"""
+    MAX_BUTTONS = 20
+    MAX_LINES = 30
+
+    def __init__(self, interval: float = 5.0):
+        self.bot = None
+        self.interval = interval
+        self.pending: set = set()
+        self.last_render: Dict[tuple, float] = {}
+
+    def refresh(self, guild_id: str, panel_id: str, option_id: str):
+        """Mark an option's digest as stale; bursts of calls collapse into one render"""
+        key = (guild_id, panel_id, option_id)
+        if key in self.pending:
+            return
+        self.pending.add(key)
+        spawn(self.render_later(key))
+
+    async def render_later(self, key: tuple):
+        wait = self.last_render.get(key, 0) + self.interval - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        # Clear before rendering so changes made mid-render schedule another pass
+        self.pending.discard(key)
+        self.last_render[key] = time.monotonic()
+        try:
+            await self.render(*key)
+        except Exception as e:
+            print(f"Error rendering handle digest: {e}")
+
+    async def render(self, guild_id: str, panel_id: str, option_id: str):
+        guild = self.bot.get_guild(int(guild_id)) if self.bot else None
+        option = get_ticket_option(guild_id, panel_id, option_id)
+        if not guild or not option:
+            return
+        channel = guild.get_channel(option["handle_channel"])
+        if not channel:
+            return
+        
+        unclaimed = sorted(
+            (t for t in load_active_tickets(guild_id).values()
+             if t.get('panel_id') == panel_id and t.get('option_id') == option_id and not t.get('joined_staff')),
+            key=lambda t: t.get('created_at', '')
+        )
+        
+        embed = discord.Embed(
+            title=f"📥 {option['button_label']}: {len(unclaimed)} unclaimed ticket(s)",
+            color=discord.Color.blue() if unclaimed else discord.Color.green(),
+            timestamp=datetime.now(timezone.utc)
+        )
+        lines = [
+            f"• <#{t['thread_id']}> by {t.get('user_mention', 'Unknown')} (<t:{int(datetime.fromisoformat(t['created_at']).timestamp())}:R>)"
+            for t in unclaimed[:self.MAX_LINES]
+        ]
+        if len(unclaimed) > self.MAX_LINES:
+            lines.append(f"…and {len(unclaimed) - self.MAX_LINES} more")
+        embed.description = "\n".join(lines) if lines else "No tickets are waiting for staff"
+        embed.set_footer(text="Updates every few seconds")
+        
+        view = View(timeout=None)
+        for t in unclaimed[:self.MAX_BUTTONS]:
+            view.add_item(DigestJoinButton(int(t['thread_id']), label=t.get('user_name', 'Join')))
+        
+        digests = load_handle_digests(guild_id)
+        digest_key = f"{panel_id}:{option_id}"
+        if digest_key in digests:
+            try:
+                await channel.get_partial_message(int(digests[digest_key])).edit(embed=embed, view=view)
+                return
+            except discord.NotFound:
+                pass
+        
+        message = await channel.send(embed=embed, view=view)
+        with contextlib.suppress(discord.HTTPException):
+            await message.pin()
+        save_handle_digest(guild_id, digest_key, str(message.id))
+
+handle_digest = HandleDigest()
+
 # CloseReasonModal class
 class CloseReasonModal(Modal, title="🔒 Close Ticket"):
     reason = TextInput(label="Reason for closing", placeholder="Optional reason for closing...", style=discord.TextStyle.paragraph, required=False, max_length=500)
@@ -128,38 +383,59 @@ class ConfirmCloseView(View):
                     await interaction.response.send_message("❌ Ticket data not found!", ephemeral=True)
                     return
  
-                self.ticket_data['closer_name'] = interaction.user.display_name
-                self.ticket_data['closer_id'] = str(interaction.user.id)
-                self.ticket_data['closed_at'] = datetime.now(timezone.utc).isoformat()
-
-                try:
-                    if 'handle_channel_id' in ticket_data and 'handle_msg_id' in ticket_data:
-                        handle_channel = interaction.guild.get_channel(int(ticket_data['handle_channel_id']))
-                        if handle_channel:
-                            handle_msg = await handle_channel.fetch_message(int(ticket_data['handle_msg_id']))
-                            if handle_msg:
-                                if handle_msg.author.id == interaction.client.user.id:
-                                    await handle_msg.delete()
-                except Exception as e:
-                    print(f"Error when deleting message: {str(e)}")
-                
-                # Create transcript
-                await self.create_transcript(interaction.guild, thread, self.reason, ticket_data)
-                
-                # Remove from active tickets
-                remove_active_ticket(self.guild_id, self.thread_id)
-
-                await thread.edit(archived=True, locked=True)
+                await interaction.response.defer()
+                await self.close_ticket(interaction.guild, thread, ticket_data, interaction.user)
                 
                 await interaction.followup.send("✅ Ticket closed and archived!", ephemeral=False)
             else:
-                await interaction.followup.send("❌ Ticket not found!", ephemeral=True)
+                await interaction.response.send_message("❌ Ticket not found!", ephemeral=True)
         except Exception as e:
             await interaction.followup.send(f"❌ Error closing ticket: {str(e)}", ephemeral=True)
+
+    async def close_ticket(self, guild: discord.Guild, thread: discord.Thread, ticket_data: dict, closer: discord.abc.User, remove: bool = True):
+        """Delete the handle message, post the transcript, drop the ticket and archive the thread"""
+        activity = ticket_activity.forget(thread.id)
+        for data in (self.ticket_data, ticket_data):
+            data['closer_name'] = closer.display_name
+            data['closer_id'] = str(closer.id)
+            data['closed_at'] = datetime.now(timezone.utc).isoformat()
+            if activity:
+                data['activity'] = activity
+
+        try:
+            if ticket_data.get('handle_channel_id') and ticket_data.get('handle_msg_id'):
+                handle_channel = guild.get_channel(int(ticket_data['handle_channel_id']))
+                if handle_channel:
+                    handle_updates.forget(int(ticket_data['handle_msg_id']))
+                    handle_msg = await handle_channel.fetch_message(int(ticket_data['handle_msg_id']))
+                    if handle_msg:
+                        if handle_msg.author.id == guild.me.id:
+                            await handle_msg.delete()
+        except Exception as e:
+            print(f"Error when deleting message: {str(e)}")
+        
+        # Create transcript
+        await self.create_transcript(guild, thread, self.reason, ticket_data)
+        
+        # Remove from active tickets (bulk closes batch this themselves)
+        if remove:
+            remove_active_ticket(self.guild_id, self.thread_id)
+        idle_closer.untrack(thread.id)
+        unclaimed_queue.claim(self.guild_id, thread.id)
+        staff_assigner.release(self.guild_id, ticket_data)
+        record_ticket_closed(self.guild_id, ticket_data)
+        if not ticket_data.get('handle_msg_id') and ticket_data.get('option_id'):
+            handle_digest.refresh(self.guild_id, ticket_data['panel_id'], ticket_data['option_id'])
+
+        await thread.edit(archived=True, locked=True)
             
     async def create_transcript(self, guild: discord.Guild, thread: discord.Thread, reason: str, ticket_data: dict):
         """Create a transcript of the ticket and send it to the transcripts channel"""
         try:
+            # Create transcript content and add it to the search index
+            transcript_content = await self.generate_transcript(thread, reason, ticket_data)
+            await asyncio.to_thread(index_transcript, self.guild_id, str(thread.id), thread.name, ticket_data, transcript_content)
+            
             # Get the ticket config to find transcripts channel
             panel_id = ticket_data.get('panel_id', '')
             option_id = ticket_data.get('option_id', '')
@@ -167,29 +443,16 @@ class ConfirmCloseView(View):
             if not panel_id:
                 return  # No panel ID, can't find transcripts channel
             
-            # Get the multi-ticket config
-            multi_config = get_multi_ticket_setup_by_id(self.guild_id, panel_id)
-            if not multi_config:
-                return  # Config not found
-            
-            # Find the specific option to get transcripts channel
-            transcripts_channel_id = None
-            for option in multi_config.get("ticket_options", []):
-                if option.get("id") == option_id:
-                    transcripts_channel_id = option.get("transcripts_channel_id")
-                    break
-            
-            if not transcripts_channel_id:
-                return  # No transcripts channel configured
+            # Look up the option to get transcripts channel
+            option = get_ticket_option(self.guild_id, panel_id, option_id)
+            if not option or not option["transcripts_channel"]:
+                return  # Option not found or no transcripts channel configured
             
             # Get the transcripts channel
-            transcripts_channel = guild.get_channel(int(transcripts_channel_id))
+            transcripts_channel = guild.get_channel(option["transcripts_channel"])
             if not transcripts_channel:
                 return  # Channel not found
             
-            # Create transcript content
-            transcript_content = await self.generate_transcript(thread, reason, ticket_data)
-            
             # Send transcript to transcripts channel
             transcript_file = discord.File(
                 io.BytesIO(transcript_content.encode('utf-8')),
@@ -280,6 +543,347 @@ class CloseTicketView(View):
         modal = CloseReasonModal(self.guild_id, str(interaction.channel.id), ticket_data)
         await interaction.response.send_modal(modal)
 
+# Idle ticket auto-close
+class IdleTicketCloser:
+    """Tracks last activity for every open ticket and closes tickets idle past their panel's timeout"""
+    def __init__(self):
+        self.bot = None
+        self.tracked: Dict[int, List] = {}  # thread_id -> [guild_id, panel_id, last_activity]
+        self.timeouts: Dict[tuple, float] = {}  # (guild_id, panel_id) -> timeout in seconds
+        self.scheduler = DeadlineScheduler(self.close_idle)
+
+    def load_guild(self, guild: discord.Guild):
+        """Seed timeouts and last activity for a guild from storage and the thread cache"""
+        guild_id = str(guild.id)
+        for config in get_panel_registry(guild_id)["panels"].values():
+            self.timeouts[(guild_id, config['id'])] = float(config.get('idle_timeout_hours') or 0) * 3600
+        
+        for ticket_data in load_active_tickets(guild_id).values():
+            if not ticket_data.get('thread_id') or not ticket_data.get('panel_id'):
+                continue
+            thread_id = int(ticket_data['thread_id'])
+            stamps = [ticket_data.get('created_at')] + [staff.get('joined_at') for staff in ticket_data.get('joined_staff', [])]
+            last_activity = max((datetime.fromisoformat(ts).timestamp() for ts in stamps if ts), default=time.time())
+            thread = guild.get_thread(thread_id)
+            if thread and thread.last_message_id:
+                last_activity = max(last_activity, discord.utils.snowflake_time(thread.last_message_id).timestamp())
+            self.track(guild_id, thread_id, ticket_data['panel_id'], last_activity)
+
+    def track(self, guild_id: str, thread_id: int, panel_id: str, last_activity: float):
+        self.tracked[thread_id] = [guild_id, panel_id, last_activity]
+        self.reschedule(thread_id)
+
+    def untrack(self, thread_id: int):
+        self.tracked.pop(thread_id, None)
+        self.scheduler.cancel(thread_id)
+
+    def touch(self, thread_id: int):
+        """Record activity in a ticket thread; a no-op for threads that aren't tickets"""
+        entry = self.tracked.get(thread_id)
+        if entry:
+            entry[2] = time.time()
+            self.reschedule(thread_id)
+
+    def reschedule(self, thread_id: int):
+        guild_id, panel_id, last_activity = self.tracked[thread_id]
+        timeout = self.timeouts.get((guild_id, panel_id), 0)
+        if timeout > 0:
+            self.scheduler.schedule(thread_id, last_activity + timeout)
+        else:
+            self.scheduler.cancel(thread_id)
+
+    def set_timeout(self, guild_id: str, panel_id: str, hours: float):
+        self.timeouts[(guild_id, panel_id)] = hours * 3600
+        for thread_id, (entry_guild, entry_panel, _) in self.tracked.items():
+            if entry_guild == guild_id and entry_panel == panel_id:
+                self.reschedule(thread_id)
+
+    async def close_idle(self, thread_id: int):
+        entry = self.tracked.get(thread_id)
+        guild = self.bot.get_guild(int(entry[0])) if entry and self.bot else None
+        if not guild:
+            return self.untrack(thread_id)
+        
+        guild_id = str(guild.id)
+        ticket_data = get_ticket_data(guild_id, str(thread_id))
+        if not ticket_data:
+            return self.untrack(thread_id)
+        
+        try:
+            thread = guild.get_thread(thread_id) or await guild.fetch_channel(thread_id)
+        except discord.NotFound:
+            remove_active_ticket(guild_id, str(thread_id))
+            return self.untrack(thread_id)
+        
+        hours = self.timeouts.get((guild_id, entry[1]), 0) / 3600
+        reason = f"Closed automatically after {hours:g}h of inactivity"
+        view = ConfirmCloseView(guild_id, str(thread_id), reason, ticket_data)
+        await view.close_ticket(guild, thread, ticket_data, guild.me)
+        print(f"Auto-closed idle ticket {thread_id} in {guild_id}")
+
+idle_closer = IdleTicketCloser()
+
+# Per-ticket activity counters
+class TicketActivity:
+    """Message counters for open tickets, kept in memory and flushed to storage in batches"""
+    def __init__(self):
+        self.tickets: Dict[int, Dict[str, Any]] = {}  # thread_id -> counters
+        self.dirty: Dict[str, set] = {}  # guild_id -> thread IDs changed since the last flush
+
+    def load_guild(self, guild_id: str):
+        for ticket_data in load_active_tickets(guild_id).values():
+            if ticket_data.get('thread_id'):
+                self.watch(guild_id, ticket_data)
+
+    def watch(self, guild_id: str, ticket_data: dict):
+        activity = ticket_data.get('activity', {})
+        self.tickets[int(ticket_data['thread_id'])] = {
+            'guild_id': guild_id,
+            'creator_id': int(ticket_data.get('user_id', 0)),
+            'messages': activity.get('messages', 0),
+            'staff_messages': activity.get('staff_messages', 0),
+            'last_user_at': activity.get('last_user_at'),
+            'last_staff_at': activity.get('last_staff_at'),
+            'first_staff_response_at': activity.get('first_staff_response_at')
+        }
+
+    def record(self, message: discord.Message):
+        """O(1) bookkeeping for a message; ignores channels that aren't open tickets"""
+        counters = self.tickets.get(message.channel.id)
+        if counters is None:
+            return
+        counters['messages'] += 1
+        if message.author.id == counters['creator_id']:
+            counters['last_user_at'] = message.created_at
+        else:
+            # Only the creator and staff can post in a private ticket thread
+            counters['staff_messages'] += 1
+            counters['last_staff_at'] = message.created_at
+            if counters['first_staff_response_at'] is None:
+                counters['first_staff_response_at'] = message.created_at
+        self.dirty.setdefault(counters['guild_id'], set()).add(message.channel.id)
+
+    def snapshot(self, thread_id: int) -> Optional[Dict[str, Any]]:
+        counters = self.tickets.get(thread_id)
+        if counters is None:
+            return None
+        return {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in counters.items() if key not in ('guild_id', 'creator_id')
+        }
+
+    def forget(self, thread_id: int) -> Optional[Dict[str, Any]]:
+        """Stop counting a ticket and return its final counters"""
+        activity = self.snapshot(thread_id)
+        self.tickets.pop(thread_id, None)
+        return activity
+
+    def flush(self):
+        """Write every changed ticket's counters, one write per guild"""
+        dirty, self.dirty = self.dirty, {}
+        for guild_id, thread_ids in dirty.items():
+            updates = {str(thread_id): self.snapshot(thread_id) for thread_id in thread_ids if thread_id in self.tickets}
+            if updates:
+                update_ticket_activity(guild_id, updates)
+
+ticket_activity = TicketActivity()
+
+# Staff auto-assignment
+class StaffAssigner:
+    """Per-guild min-heap of available staff ordered by how many open tickets they have joined"""
+    def __init__(self):
+        self.heaps: Dict[str, list] = {}  # guild_id -> [(load, staff_id)]
+        self.loads: Dict[str, Dict[int, int]] = {}  # guild_id -> staff_id -> open tickets joined
+        self.available: Dict[str, set] = {}  # guild_id -> staff IDs taking new tickets
+
+    def load_guild(self, guild: discord.Guild):
+        """Rebuild loads from active tickets and the rotation from staff role members"""
+        guild_id = str(guild.id)
+        loads: Dict[int, int] = {}
+        for ticket_data in load_active_tickets(guild_id).values():
+            for staff in ticket_data.get('joined_staff', []):
+                staff_id = int(staff['id'])
+                loads[staff_id] = loads.get(staff_id, 0) + 1
+        
+        availability = load_staff_availability(guild_id)
+        available = set()
+        for role_id in load_staff_roles(guild_id):
+            role = guild.get_role(int(role_id))
+            if role:
+                available.update(m.id for m in role.members if not m.bot and availability.get(str(m.id), True))
+        
+        self.loads[guild_id] = loads
+        self.available[guild_id] = available
+        self.heaps[guild_id] = [(loads.get(staff_id, 0), staff_id) for staff_id in available]
+        heapq.heapify(self.heaps[guild_id])
+
+    def pick(self, guild: discord.Guild) -> Optional[discord.Member]:
+        """Take the least-loaded available staff member and count the new ticket against them"""
+        guild_id = str(guild.id)
+        if not self.heaps.get(guild_id):
+            self.load_guild(guild)
+        
+        heap = self.heaps[guild_id]
+        loads = self.loads[guild_id]
+        available = self.available[guild_id]
+        while heap:
+            load, staff_id = heapq.heappop(heap)
+            # Entries are pushed on every load change; skip the ones that are out of date
+            if staff_id not in available or loads.get(staff_id, 0) != load:
+                continue
+            member = guild.get_member(staff_id)
+            if not member:
+                available.discard(staff_id)
+                continue
+            self.adjust(guild_id, staff_id, 1)
+            return member
+        return None
+
+    def adjust(self, guild_id: str, staff_id: int, delta: int):
+        if guild_id not in self.loads:
+            return
+        loads = self.loads[guild_id]
+        loads[staff_id] = max(loads.get(staff_id, 0) + delta, 0)
+        available = self.available[guild_id]
+        if staff_id in available:
+            heapq.heappush(self.heaps[guild_id], (loads[staff_id], staff_id))
+        
+        # Drop out-of-date entries once they outnumber the live ones
+        if len(self.heaps[guild_id]) > 2 * len(available) + 64:
+            self.heaps[guild_id] = [(loads.get(member_id, 0), member_id) for member_id in available]
+            heapq.heapify(self.heaps[guild_id])
+
+    def release(self, guild_id: str, ticket_data: dict):
+        for staff in ticket_data.get('joined_staff', []):
+            self.adjust(guild_id, int(staff['id']), -1)
+
+    def refresh_member(self, member: discord.Member):
+        """Add or drop a member from the rotation after their roles changed"""
+        guild_id = str(member.guild.id)
+        if guild_id not in self.available:
+            return
+        staff_roles = set(map(str, load_staff_roles(guild_id)))
+        is_staff = not member.bot and any(str(role.id) in staff_roles for role in member.roles)
+        wants_tickets = load_staff_availability(guild_id).get(str(member.id), True)
+        if (is_staff and wants_tickets) != (member.id in self.available[guild_id]):
+            self.set_available(guild_id, member.id, is_staff and wants_tickets)
+
+    def set_available(self, guild_id: str, staff_id: int, available: bool):
+        if guild_id not in self.available:
+            return
+        if available:
+            self.available[guild_id].add(staff_id)
+            heapq.heappush(self.heaps[guild_id], (self.loads[guild_id].get(staff_id, 0), staff_id))
+        else:
+            self.available[guild_id].discard(staff_id)
+
+staff_assigner = StaffAssigner()
+
+# Unclaimed ticket queue
+class UnclaimedQueue:
+    """Per-guild priority queue of tickets no staff member has joined: highest priority, then oldest"""
+    def __init__(self):
+        self.heaps: Dict[str, list] = {}  # guild_id -> [(-priority, created_ts, thread_id)]
+        self.unclaimed: Dict[str, set] = {}  # guild_id -> thread IDs still waiting
+
+    def load_guild(self, guild_id: str):
+        heap, unclaimed = [], set()
+        for ticket_data in load_active_tickets(guild_id).values():
+            if ticket_data.get('joined_staff') or not ticket_data.get('thread_id'):
+                continue
+            option = get_ticket_option(guild_id, ticket_data.get('panel_id'), ticket_data.get('option_id')) or {}
+            created_ts = datetime.fromisoformat(ticket_data['created_at']).timestamp() if ticket_data.get('created_at') else 0
+            thread_id = int(ticket_data['thread_id'])
+            heap.append((-option.get('priority', DEFAULT_TICKET_PRIORITY), created_ts, thread_id))
+            unclaimed.add(thread_id)
+        heapq.heapify(heap)
+        self.heaps[guild_id] = heap
+        self.unclaimed[guild_id] = unclaimed
+
+    def push(self, guild_id: str, thread_id: int, priority: int, created_ts: float):
+        # Guilds not loaded yet pick the ticket up from storage on first use
+        if guild_id in self.heaps:
+            heapq.heappush(self.heaps[guild_id], (-priority, created_ts, thread_id))
+            self.unclaimed[guild_id].add(thread_id)
+
+    def claim(self, guild_id: str, thread_id: int):
+        """Mark a ticket as taken; its heap entry is skipped when it reaches the top"""
+        if guild_id in self.unclaimed:
+            self.unclaimed[guild_id].discard(thread_id)
+
+    def pop(self, guild_id: str) -> Optional[int]:
+        if guild_id not in self.heaps:
+            self.load_guild(guild_id)
+        heap, unclaimed = self.heaps[guild_id], self.unclaimed[guild_id]
+        while heap:
+            _, _, thread_id = heapq.heappop(heap)
+            if thread_id in unclaimed:
+                unclaimed.discard(thread_id)
+                return thread_id
+        return None
+
+    def pending(self, guild_id: str) -> int:
+        if guild_id not in self.heaps:
+            self.load_guild(guild_id)
+        return len(self.unclaimed[guild_id])
+
+unclaimed_queue = UnclaimedQueue()
+
+class PanelSearchIndex:
+    """
+    Per-guild prefix index over panel IDs, titles, option labels and panel channel names.
+    Terms are kept sorted so a prefix lookup is a bisect plus a short scan. An index is
+    rebuilt only when the guild's panel registry has been recompiled after a config save.
+    """
+    def __init__(self):
+        self.indexes: Dict[str, tuple] = {}  # guild_id -> (registry, sorted [(term, panel_id)], {panel_id: label})
+
+    def build(self, guild: discord.Guild, registry: dict) -> tuple:
+        terms, labels = [], {}
+        panels = {**registry["ticket_setups"], **registry["panels"]}
+        for panel_id, config in panels.items():
+            channel = guild.get_channel(int(config["panel_channel_id"])) if config.get("panel_channel_id") else None
+            title = config.get("panel_title") or config.get("button_label") or "Ticket panel"
+            labels[panel_id] = f"{title} · #{channel.name if channel else 'unknown'} ({panel_id})"[:100]
+            
+            words = {panel_id.lower()}
+            words.update(title.lower().split())
+            words.update(option.get("button_label", "").lower() for option in config.get("ticket_options", []))
+            if channel:
+                words.add(channel.name.lower())
+            terms.extend((word, panel_id) for word in words if word)
+        terms.sort()
+        index = (registry, terms, labels)
+        self.indexes[str(guild.id)] = index
+        return index
+
+    def search(self, guild: discord.Guild, current: str, limit: int = 25) -> List[tuple]:
+        """Return (label, panel_id) pairs whose terms start with the typed text"""
+        registry = get_panel_registry(str(guild.id))
+        index = self.indexes.get(str(guild.id))
+        if index is None or index[0] is not registry:
+            index = self.build(guild, registry)
+        _, terms, labels = index
+        
+        prefix = current.strip().lower()
+        if not prefix:
+            return [(label, panel_id) for panel_id, label in itertools.islice(labels.items(), limit)]
+        
+        # Scan in place from the bisect position rather than copying the tail of the list
+        results = {}
+        i = bisect.bisect_left(terms, (prefix,))
+        while i < len(terms) and len(results) < limit and terms[i][0].startswith(prefix):
+            results.setdefault(terms[i][1], labels[terms[i][1]])
+            i += 1
+        return [(label, panel_id) for panel_id, label in results.items()]
+
+panel_index = PanelSearchIndex()
+
+async def panel_id_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+    if not interaction.guild:
+        return []
+    return [app_commands.Choice(name=label, value=panel_id) for label, panel_id in panel_index.search(interaction.guild, current)]
+
 # TicketTypeModal class
 class TicketTypeModal(Modal, title="🎫 Ticket Panel Setup"):
     panel_title = TextInput(label="Panel Title", placeholder="e.g., Support Center", default="Support Tickets", max_length=100, required=True)
@@ -375,6 +979,7 @@ class SingleTicketSetupView(View):
                     'open_message': self.config_data['open_message'],
                     'handle_channel_id': self.config_data['handle_channel_id'],
                     'transcripts_channel_id': self.config_data.get('transcripts_channel_id'),
+                    'priority': self.config_data.get('priority', DEFAULT_TICKET_PRIORITY),
                     'created_at': datetime.now(timezone.utc).isoformat()
                 }],
                 "created_at": datetime.now(timezone.utc).isoformat()
@@ -460,6 +1065,7 @@ class MultiTicketSetupView(View):
                     'open_message': option['open_message'],
                     'handle_channel_id': option['handle_channel_id'],
                     'transcripts_channel_id': option.get('transcripts_channel_id'),
+                    'priority': option.get('priority', DEFAULT_TICKET_PRIORITY),
                     'created_at': datetime.now(timezone.utc).isoformat()
                 })
 
@@ -515,13 +1121,15 @@ class TicketConfigModal(Modal, title="🎫 Configure Ticket Option"):
     button_emoji = TextInput(label="Button Emoji (optional)", placeholder="e.g., 🛠️", max_length=10, required=False)
     title_format = TextInput(label="Ticket Title Format", placeholder="Use {username} or {userid}", default="ticket-{username}", max_length=100, required=True)
     open_message = TextInput(label="Welcome Message", placeholder="Message shown when ticket is opened", default="Please describe your issue...", style=discord.TextStyle.paragraph, max_length=1000, required=True)
+    priority = TextInput(label="Priority (1-5, higher is handled first)", placeholder="e.g., 3", default=str(DEFAULT_TICKET_PRIORITY), max_length=1, required=False)
 
     async def on_submit(self, interaction: discord.Interaction):
         self.config_data = {
             'button_label': str(self.button_label),
             'button_emoji': str(self.button_emoji) if self.button_emoji.value else None,
             'title_format': str(self.title_format),
-            'open_message': str(self.open_message)
+            'open_message': str(self.open_message),
+            'priority': parse_priority(self.priority.value)
         }
         
         # Show channel selection view
@@ -670,45 +1278,102 @@ class MultiTicketView(View):
         if str(interaction.guild.id) != guild_id:
             return await interaction.response.send_message("❌ Invalid server!", ephemeral=True)
 
-        if str(user_id) in load_active_tickets(guild_id):
+        if ticket_admission.is_in_flight(guild_id, user_id) or str(user_id) in load_active_tickets(guild_id):
             return await interaction.response.send_message("❌ You already have an active ticket!", ephemeral=True)
 
+        # Acknowledge first so queueing and REST work can't miss the interaction deadline
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        position = ticket_admission.submit(guild_id, user_id, lambda: self.create_ticket(interaction, option))
+        if position == ALREADY_IN_FLIGHT:
+            await interaction.followup.send("❌ You already have an active ticket!", ephemeral=True)
+        elif position is None:
+            await interaction.followup.send("⏳ Lots of tickets are being opened right now, please try again in a minute.", ephemeral=True)
+        elif position > 1:
+            await interaction.followup.send(f"⏳ You're #{position} in the queue, your ticket will open shortly.", ephemeral=True)
+
+    async def create_ticket(self, interaction: discord.Interaction, option):
+        """Run the ticket-open pipeline once the request is admitted"""
+        user_id = interaction.user.id
+        guild_id = self.guild_id
+
+        assignee = None
         try:
-            handle_channel = await interaction.guild.fetch_channel(int(option["handle_channel_id"]))
-            title = option["title_format"].replace("{username}", interaction.user.name).replace("{userid}", str(user_id))
-        
-            thread = await interaction.channel.create_thread(
-                name=title[:100],
-                type=discord.ChannelType.private_thread,
-                invitable=False
+            # The button captured the option when the panel loaded; settings may have changed since
+            option = get_ticket_option(guild_id, self.panel_id, option['id']) or option
+            title = render_title(option["title_parts"], interaction.user.name, str(user_id))
+            panel = get_multi_ticket_setup_by_id(guild_id, self.panel_id) or {}
+
+            # Stage 1: resolve the handle channel (cache first) while the thread is created
+            handle_channel, thread = await asyncio.gather(
+                self.resolve_channel(interaction.guild, option["handle_channel"]),
+                interaction.channel.create_thread(
+                    name=title[:100],
+                    type=discord.ChannelType.private_thread,
+                    invitable=False,
+                    auto_archive_duration=TICKET_AUTO_ARCHIVE_MINUTES
+                )
             )
-        
-            staff_roles = load_staff_roles(guild_id)
-            for role_id in staff_roles:
-                role = interaction.guild.get_role(int(role_id))
-                if role:
-                    await thread.set_permissions(role, view_channel=True, send_messages=True)
-                    
-           # Create a proper embed for the handle message
+
+            # Create a proper embed for the handle message
             handle_embed = discord.Embed(
                 title=f"New Ticket: {option['button_label']}",
                 description=f"**Creator:** {interaction.user.mention}\n**Ticket:** {thread.mention}",
                 color=discord.Color.blue(),
                 timestamp=datetime.now(timezone.utc)
             )
-            handle_embed.add_field(
-                name="Joined Staff (0)",
-                value="No staff members have joined yet",
-                inline=False
-            )
+            # Auto-assign mode hands the ticket straight to the least-loaded staff member
+            joined_staff = []
+            assignee = staff_assigner.pick(interaction.guild) if panel.get('auto_assign') else None
+            if assignee:
+                joined_staff.append({
+                    'id': str(assignee.id),
+                    'name': assignee.display_name,
+                    'joined_at': datetime.now(timezone.utc).isoformat(),
+                    'auto_assigned': True
+                })
+                handle_embed.add_field(
+                    name="Joined Staff (1)",
+                    value=f"• {assignee.display_name} (auto-assigned)",
+                    inline=False
+                )
+            else:
+                handle_embed.add_field(
+                    name="Joined Staff (0)",
+                    value="No staff members have joined yet",
+                    inline=False
+                )
             handle_embed.set_footer(text=f"User ID: {interaction.user.id} | Ticket ID: {thread.id}")
-        
-            # First create the message
-            handle_msg = await handle_channel.send(embed=handle_embed)
-        
-            # Then create the view with the message ID
-            join_view = JoinTicketView(str(thread.id), guild_id, str(handle_msg.id))
-            await handle_msg.edit(view=join_view)
+
+            # Create a proper welcome embed instead of plain text
+            welcome_embed = discord.Embed(
+                title=f"Welcome to your {option['button_label']} ticket!",
+                description=option['open_message'],
+                color=discord.Color.green()
+            )
+            welcome_embed.add_field(name="Support Team", value="Our staff will be with you shortly.", inline=False)
+            welcome_embed.set_footer(text="Click the button below to close this ticket")
+
+            # Stage 2: everything that only needs the thread runs concurrently.
+            # The join view reads the handle message ID from the click, so it is sent in one call.
+            # In digest mode the option's summary message lists the ticket instead of a handle message.
+            # Private threads carry no overwrites; staff get in through the join button
+            digest_mode = option.get('handle_mode') == 'digest'
+            pipeline = [
+                thread.send(interaction.user.mention, embed=welcome_embed, view=CloseTicketView(guild_id))
+            ]
+            if not digest_mode:
+                pipeline.append(handle_channel.send(embed=handle_embed, view=JoinTicketView(str(thread.id), guild_id)))
+            if assignee:
+                pipeline.append(self.add_assignee(thread, assignee))
+            results = await asyncio.gather(*pipeline)
+            handle_msg = results[1] if not digest_mode else None
+            assignment_failed = bool(assignee) and not results[-1]
+            if assignment_failed:
+                # The thread exists either way; fall back to an unclaimed ticket instead of orphaning it
+                staff_assigner.adjust(guild_id, assignee.id, -1)
+                joined_staff.clear()
+                assignee = None
 
             # Store ticket data with panel and option IDs for transcript functionality
             ticket_data = {
@@ -716,37 +1381,195 @@ class MultiTicketView(View):
                 'user_name': interaction.user.name,
                 'user_mention': interaction.user.mention,
                 'thread_id': str(thread.id),
-                'handle_msg_id': str(handle_msg.id),
+                'handle_msg_id': str(handle_msg.id) if handle_msg else None,
                 'handle_channel_id': str(handle_channel.id),
+                'setup_id': f"multi_{self.panel_id}_{option['id']}",
                 'panel_id': self.panel_id,
                 'option_id': option['id'],
                 'created_at': datetime.now(timezone.utc).isoformat(),
-                'joined_staff': []  # Initialize empty list for staff who join
+                'joined_staff': joined_staff  # Staff who join (or were auto-assigned)
             }
-        
-            save_active_ticket(guild_id, user_id, str(thread.id), str(handle_msg.id), f"multi_{self.panel_id}_{option['id']}", ticket_data)
-            increment_user_ticket_count(guild_id, user_id)
+            record_ticket_open(guild_id, user_id, ticket_data)
+            record_ticket_opened(guild_id, ticket_data)
+            if handle_msg and assignment_failed:
+                handle_updates.update(handle_msg, ticket_data, thread.mention)
+            if assignee:
+                record_first_join(guild_id, ticket_data, ticket_data['created_at'])
+            if digest_mode:
+                handle_digest.refresh(guild_id, self.panel_id, option['id'])
+            if not assignee:
+                unclaimed_queue.push(guild_id, thread.id, option.get('priority', DEFAULT_TICKET_PRIORITY), time.time())
+            idle_closer.track(guild_id, thread.id, self.panel_id, time.time())
+            ticket_activity.watch(guild_id, ticket_data)
 
-        # Create a proper welcome embed instead of plain text
-            welcome_embed = discord.Embed(
-                title=f"Welcome to your {option['button_label']} ticket!",
-                description=option['open_message'],
-                color=discord.Color.green()
-            )
-            welcome_embed.add_field(name="Support Team", value="Our staff will be with you shortly.", inline=False)
-            welcome_embed.set_footer(text="Click the button below to close this ticket")
-        
-            await thread.send(interaction.user.mention, embed=welcome_embed, view=CloseTicketView(guild_id))
-        
-            await interaction.response.send_message(f"✅ Ticket created: {thread.mention}", ephemeral=True)
+            await interaction.followup.send(f"✅ Ticket created: {thread.mention}", ephemeral=True)
 
         except Exception as e:
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            if assignee:
+                staff_assigner.adjust(guild_id, assignee.id, -1)
+            await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True)
+
+    async def add_assignee(self, thread: discord.Thread, member: discord.Member) -> bool:
+        try:
+            await thread.add_user(member)
+            return True
+        except discord.HTTPException as e:
+            print(f"Error adding assigned staff to ticket {thread.id}: {e}")
+            return False
+
+    async def resolve_channel(self, guild: discord.Guild, channel_id: int):
+        """Return a channel from the gateway cache, falling back to REST"""
+        return guild.get_channel(channel_id) or await guild.fetch_channel(channel_id)
+
+def was_auto_archived(thread: discord.Thread) -> bool:
+    """Discord archives a thread once auto_archive_duration passes without messages; earlier archives were manual"""
+    last_activity = discord.utils.snowflake_time(thread.last_message_id or thread.id)
+    return thread.archive_timestamp >= last_activity + timedelta(minutes=thread.auto_archive_duration) - timedelta(minutes=1)
 
 # Tickets Cog
 class Tickets(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        idle_closer.bot = bot
+        handle_digest.bot = bot
+
+    async def cog_load(self):
+        self.bot.add_dynamic_items(DigestJoinButton)
+        for guild in self.bot.guilds:
+            idle_closer.load_guild(guild)
+            ticket_activity.load_guild(str(guild.id))
+        idle_closer.scheduler.start()
+        self.reconcile_tickets.start()
+        self.flush_activity.start()
+
+    async def cog_unload(self):
+        idle_closer.scheduler.stop()
+        self.reconcile_tickets.cancel()
+        self.flush_activity.cancel()
+        ticket_activity.flush()
+        self.bot.remove_dynamic_items(DigestJoinButton)
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if message.author.bot or not message.guild:
+            return
+        idle_closer.touch(message.channel.id)
+        ticket_activity.record(message)
+
+    @tasks.loop(seconds=60)
+    async def flush_activity(self):
+        ticket_activity.flush()
+
+    @commands.Cog.listener()
+    async def on_raw_thread_delete(self, payload: discord.RawThreadDeleteEvent):
+        # Not every ticket is idle-tracked, so storage decides whether the thread was a ticket
+        self.drop_ticket(str(payload.guild_id), payload.thread_id)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.roles != after.roles:
+            staff_assigner.refresh_member(after)
+
+    @commands.Cog.listener()
+    async def on_thread_update(self, before: discord.Thread, after: discord.Thread):
+        # Our close path removes the ticket before archiving, so a ticket still in storage was
+        # archived by Discord for inactivity (reopened) or by a moderator (pruned)
+        if not after.archived or before.archived:
+            return
+        guild_id = str(after.guild.id)
+        ticket_data = get_ticket_data(guild_id, str(after.id))
+        if not ticket_data:
+            return
+        if after.locked or not was_auto_archived(after):
+            self.drop_ticket(guild_id, after.id, ticket_data)
+            return
+        try:
+            await after.edit(archived=False)
+        except discord.HTTPException as e:
+            print(f"Error reopening auto-archived ticket {after.id}: {e}")
+
+    def drop_ticket(self, guild_id: str, thread_id: int, ticket_data: Optional[dict] = None, remove: bool = True):
+        """Forget a ticket whose thread went away outside the close flow (bulk closes batch the removal themselves)"""
+        ticket_data = ticket_data or get_ticket_data(guild_id, str(thread_id))
+        if ticket_data:
+            if remove:
+                remove_active_ticket(guild_id, str(thread_id))
+            staff_assigner.release(guild_id, ticket_data)
+        idle_closer.untrack(thread_id)
+        ticket_activity.forget(thread_id)
+        unclaimed_queue.claim(guild_id, thread_id)
+
+    @tasks.loop(hours=6)
+    async def reconcile_tickets(self):
+        """Check every active ticket against live thread state; the first run happens at startup"""
+        for guild in self.bot.guilds:
+            try:
+                await self.reconcile_guild(guild)
+            except Exception as e:
+                print(f"Error reconciling tickets for {guild.id}: {e}")
+
+    async def reconcile_guild(self, guild: discord.Guild):
+        guild_id = str(guild.id)
+        tickets = load_active_tickets(guild_id)
+        if not tickets:
+            return
+        
+        stale: List[str] = []
+        repairs: Dict[str, Dict[str, Any]] = {}
+        bucket = TokenBucket(RECONCILE_FETCH_RATE, RECONCILE_CONCURRENCY)
+        slots = asyncio.Semaphore(RECONCILE_CONCURRENCY)
+        
+        async def check(user_id: str, ticket_data: dict):
+            thread_id = ticket_data.get('thread_id')
+            if not thread_id:
+                return
+            if ticket_data.get('user_id') != user_id:
+                repairs[user_id] = {'user_id': user_id}
+            
+            thread = guild.get_thread(int(thread_id))
+            if thread is None:
+                async with slots:
+                    await bucket.acquire()
+                    try:
+                        thread = await guild.fetch_channel(int(thread_id))
+                    except discord.NotFound:
+                        stale.append(thread_id)
+                        return
+                    except discord.HTTPException:
+                        return  # Can't tell (e.g. missing access), leave the entry alone
+            
+            if getattr(thread, 'archived', False):
+                if thread.locked or not was_auto_archived(thread):
+                    stale.append(thread_id)
+                    return
+                # Auto-archived for inactivity while the ticket is still open
+                async with slots:
+                    await bucket.acquire()
+                    try:
+                        await thread.edit(archived=False)
+                    except discord.HTTPException as e:
+                        print(f"Error reopening auto-archived ticket {thread_id}: {e}")
+                        return
+            if int(thread_id) not in idle_closer.tracked and ticket_data.get('panel_id'):
+                idle_closer.track(guild_id, int(thread_id), ticket_data['panel_id'], time.time())
+                ticket_activity.watch(guild_id, ticket_data)
+        
+        await asyncio.gather(*(check(user_id, ticket_data) for user_id, ticket_data in tickets.items()))
+        
+        if stale or repairs:
+            apply_ticket_reconciliation(guild_id, stale, repairs)
+            for thread_id in stale:
+                idle_closer.untrack(int(thread_id))
+                ticket_activity.forget(int(thread_id))
+                unclaimed_queue.claim(guild_id, int(thread_id))
+            stale_ids = set(stale)
+            for ticket_data in tickets.values():
+                if ticket_data.get('thread_id') in stale_ids:
+                    staff_assigner.release(guild_id, ticket_data)
+
+    @reconcile_tickets.before_loop
+    async def before_reconcile_tickets(self):
+        await self.bot.wait_until_ready()
 
     @app_commands.command(name="create_ticket_panel", description="Create a ticket panel (single or multi-option)")
     @app_commands.describe(
@@ -773,14 +1596,14 @@ class Tickets(commands.Cog):
             return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
         
         guild_id = str(interaction.guild.id)
-        multi_configs = load_multi_ticket_configs(guild_id)
+        multi_configs = get_panel_registry(guild_id)["panels"]
         
         if not multi_configs:
             return await interaction.response.send_message("ℹ️ No ticket panels found for this server", ephemeral=True)
 
         embed = discord.Embed(title="📋 Ticket Panels", color=discord.Color.blue())
         
-        for config in multi_configs:
+        for config in multi_configs.values():
             channel = interaction.guild.get_channel(int(config["panel_channel_id"]))
             options_count = len(config.get("ticket_options", []))
             embed.add_field(
@@ -791,8 +1614,387 @@ class Tickets(commands.Cog):
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
+    @app_commands.command(name="set_ticket_idle_timeout", description="Auto-close a panel's tickets after a period of inactivity")
+    @app_commands.describe(
+        panel_id="ID of the ticket panel",
+        hours="Hours without messages before a ticket is closed (0 disables)"
+    )
+    @app_commands.autocomplete(panel_id=panel_id_autocomplete)
+    async def set_ticket_idle_timeout(self, interaction: discord.Interaction, panel_id: str, hours: app_commands.Range[float, 0, 8760]):
+        if not interaction.guild: 
+            return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
+        if not is_admin_or_owner(interaction): 
+            return await interaction.response.send_message("❌ Admin only!", ephemeral=True)
+        
+        guild_id = str(interaction.guild.id)
+        multi_configs = load_multi_ticket_configs(guild_id)
+        config = next((c for c in multi_configs if c['id'] == panel_id), None)
+        if not config:
+            return await interaction.response.send_message(f"❌ Ticket panel `{panel_id}` not found", ephemeral=True)
+        
+        config['idle_timeout_hours'] = hours
+        save_multi_ticket_configs(guild_id, multi_configs)
+        idle_closer.set_timeout(guild_id, panel_id, hours)
+        
+        if hours:
+            await interaction.response.send_message(f"✅ Tickets from panel `{panel_id}` will close after {hours:g}h of inactivity", ephemeral=True)
+        else:
+            await interaction.response.send_message(f"✅ Idle auto-close disabled for panel `{panel_id}`", ephemeral=True)
+
+    @app_commands.command(name="set_ticket_auto_assign", description="Assign new tickets from a panel to the least busy staff member")
+    @app_commands.describe(
+        panel_id="ID of the ticket panel",
+        enabled="Whether new tickets are auto-assigned"
+    )
+    @app_commands.autocomplete(panel_id=panel_id_autocomplete)
+    async def set_ticket_auto_assign(self, interaction: discord.Interaction, panel_id: str, enabled: bool):
+        if not interaction.guild: 
+            return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
+        if not is_admin_or_owner(interaction): 
+            return await interaction.response.send_message("❌ Admin only!", ephemeral=True)
+        
+        guild_id = str(interaction.guild.id)
+        multi_configs = load_multi_ticket_configs(guild_id)
+        config = next((c for c in multi_configs if c['id'] == panel_id), None)
+        if not config:
+            return await interaction.response.send_message(f"❌ Ticket panel `{panel_id}` not found", ephemeral=True)
+        
+        config['auto_assign'] = enabled
+        save_multi_ticket_configs(guild_id, multi_configs)
+        
+        state = "will be auto-assigned to staff" if enabled else "will wait for staff to join"
+        await interaction.response.send_message(f"✅ New tickets from panel `{panel_id}` {state}", ephemeral=True)
+
+    @app_commands.command(name="set_ticket_handle_mode", description="Choose how new tickets are announced in an option's handle channel")
+    @app_commands.describe(
+        panel_id="ID of the ticket panel",
+        option_id="ID of the ticket option",
+        mode="Per-ticket handle messages, or one summary message that updates every few seconds"
+    )
+    @app_commands.choices(mode=[
+        app_commands.Choice(name="Message per ticket", value="message"),
+        app_commands.Choice(name="Digest", value="digest")
+    ])
+    @app_commands.autocomplete(panel_id=panel_id_autocomplete)
+    async def set_ticket_handle_mode(self, interaction: discord.Interaction, panel_id: str, option_id: str, mode: app_commands.Choice[str]):
+        if not interaction.guild: 
+            return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
+        if not is_admin_or_owner(interaction): 
+            return await interaction.response.send_message("❌ Admin only!", ephemeral=True)
+        
+        guild_id = str(interaction.guild.id)
+        multi_configs = load_multi_ticket_configs(guild_id)
+        config = next((c for c in multi_configs if c['id'] == panel_id), None)
+        option = next((o for o in config.get('ticket_options', []) if o['id'] == option_id), None) if config else None
+        if not option:
+            return await interaction.response.send_message(f"❌ Option `{option_id}` not found on panel `{panel_id}`", ephemeral=True)
+        
+        option['handle_mode'] = mode.value
+        save_multi_ticket_configs(guild_id, multi_configs)
+        if mode.value == "digest":
+            handle_digest.refresh(guild_id, panel_id, option_id)
+        
+        await interaction.response.send_message(f"✅ Handle mode for `{option['button_label']}` set to **{mode.name}**", ephemeral=True)
+
+    @app_commands.command(name="set_ticket_priority", description="Set the priority of a ticket option")
+    @app_commands.describe(
+        panel_id="ID of the ticket panel",
+        option_id="ID of the ticket option",
+        priority="1 (lowest) to 5 (highest); /next_ticket hands out higher priorities first"
+    )
+    @app_commands.autocomplete(panel_id=panel_id_autocomplete)
+    async def set_ticket_priority(self, interaction: discord.Interaction, panel_id: str, option_id: str, priority: app_commands.Range[int, 1, 5]):
+        if not interaction.guild: 
+            return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
+        if not is_admin_or_owner(interaction): 
+            return await interaction.response.send_message("❌ Admin only!", ephemeral=True)
+        
+        guild_id = str(interaction.guild.id)
+        multi_configs = load_multi_ticket_configs(guild_id)
+        config = next((c for c in multi_configs if c['id'] == panel_id), None)
+        option = next((o for o in config.get('ticket_options', []) if o['id'] == option_id), None) if config else None
+        if not option:
+            return await interaction.response.send_message(f"❌ Option `{option_id}` not found on panel `{panel_id}`", ephemeral=True)
+        
+        option['priority'] = priority
+        save_multi_ticket_configs(guild_id, multi_configs)
+        # Waiting tickets were queued under the old priority
+        unclaimed_queue.load_guild(guild_id)
+        
+        await interaction.response.send_message(f"✅ Priority for `{option['button_label']}` set to **{priority}**", ephemeral=True)
+
+    @app_commands.command(name="next_ticket", description="Join the highest-priority ticket that has been waiting longest")
+    async def next_ticket(self, interaction: discord.Interaction):
+        if not interaction.guild: 
+            return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
+        if not has_event_access(interaction): 
+            return await interaction.response.send_message("❌ Staff only!", ephemeral=True)
+        
+        guild = interaction.guild
+        guild_id = str(guild.id)
+        await interaction.response.defer(ephemeral=True)
+        
+        while True:
+            thread_id = unclaimed_queue.pop(guild_id)
+            if thread_id is None:
+                return await interaction.followup.send("✅ No unclaimed tickets are waiting", ephemeral=True)
+            
+            ticket_data = get_ticket_data(guild_id, str(thread_id))
+            thread = guild.get_thread(thread_id)
+            if ticket_data and thread and not ticket_data.get('joined_staff'):
+                break
+        
+        try:
+            await thread.add_user(interaction.user)
+            record_staff_join(guild_id, str(thread_id), ticket_data, interaction.user)
+            await self.refresh_handle(guild, thread, ticket_data)
+        except Exception as e:
+            return await interaction.followup.send(f"❌ Error joining ticket: {str(e)}", ephemeral=True)
+        
+        remaining = unclaimed_queue.pending(guild_id)
+        await interaction.followup.send(f"✅ Joined ticket: {thread.mention} ({remaining} still waiting)", ephemeral=True)
+
+    async def refresh_handle(self, guild: discord.Guild, thread: discord.Thread, ticket_data: dict):
+        """Show a join on the ticket's handle message or digest after a join made outside its buttons"""
+        if not ticket_data.get('handle_msg_id'):
+            handle_digest.refresh(str(guild.id), ticket_data['panel_id'], ticket_data['option_id'])
+            return
+        handle_channel = guild.get_channel(int(ticket_data['handle_channel_id']))
+        if not handle_channel:
+            return
+        handle_msg_id = int(ticket_data['handle_msg_id'])
+        if handle_msg_id in handle_updates.embeds:
+            handle_msg = handle_channel.get_partial_message(handle_msg_id)
+        else:
+            # First update for this message: fetch once so the embed can be rebuilt from it
+            handle_msg = await handle_channel.fetch_message(handle_msg_id)
+        handle_updates.update(handle_msg, ticket_data, thread.mention)
+
+    @app_commands.command(name="set_availability", description="Choose whether you receive auto-assigned tickets")
+    @app_commands.describe(available="Whether you are available for new tickets")
+    async def set_availability(self, interaction: discord.Interaction, available: bool):
+        if not interaction.guild: 
+            return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
+        if not has_event_access(interaction): 
+            return await interaction.response.send_message("❌ Staff only!", ephemeral=True)
+        
+        guild_id = str(interaction.guild.id)
+        save_staff_availability(guild_id, interaction.user.id, available)
+        staff_assigner.set_available(guild_id, interaction.user.id, available)
+        
+        state = "available for" if available else "away from"
+        await interaction.response.send_message(f"✅ You're now {state} auto-assigned tickets", ephemeral=True)
+
+    @app_commands.command(name="bulk_close", description="Close and archive many tickets at once")
+    @app_commands.describe(
+        panel_id="Only close tickets from this panel",
+        option_id="Only close tickets from this panel option",
+        older_than_hours="Only close tickets opened at least this many hours ago",
+        user="Only close tickets opened by this user",
+        reason="Reason recorded in the transcripts"
+    )
+    @app_commands.autocomplete(panel_id=panel_id_autocomplete)
+    async def bulk_close(self, interaction: discord.Interaction, panel_id: Optional[str] = None, option_id: Optional[str] = None,
+                         older_than_hours: Optional[app_commands.Range[float, 0]] = None, user: Optional[discord.Member] = None,
+                         reason: str = "Bulk close"):
+        if not interaction.guild: 
+            return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
+        if not is_admin_or_owner(interaction): 
+            return await interaction.response.send_message("❌ Admin only!", ephemeral=True)
+        
+        guild = interaction.guild
+        guild_id = str(guild.id)
+        cutoff = datetime.now(timezone.utc).timestamp() - older_than_hours * 3600 if older_than_hours is not None else None
+        
+        matches = []
+        for ticket_data in load_active_tickets(guild_id).values():
+            if panel_id and ticket_data.get('panel_id') != panel_id:
+                continue
+            if option_id and ticket_data.get('option_id') != option_id:
+                continue
+            if user and ticket_data.get('user_id') != str(user.id):
+                continue
+            if cutoff is not None:
+                created_at = ticket_data.get('created_at')
+                if not created_at or datetime.fromisoformat(created_at).timestamp() > cutoff:
+                    continue
+            matches.append(ticket_data)
+        
+        if not matches:
+            return await interaction.response.send_message("ℹ️ No active tickets match those filters", ephemeral=True)
+        
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        progress = await interaction.followup.send(f"🔒 Closing tickets... 0/{len(matches)}", ephemeral=True, wait=True)
+        
+        closed, failed = [], []
+        slots = asyncio.Semaphore(BULK_CLOSE_CONCURRENCY)
+        
+        async def close_one(ticket_data: dict):
+            thread_id = ticket_data['thread_id']
+            async with slots:
+                try:
+                    thread = guild.get_thread(int(thread_id)) or await guild.fetch_channel(int(thread_id))
+                except discord.NotFound:
+                    # Thread is already gone, only the stale entry and its bookkeeping need removing
+                    self.drop_ticket(guild_id, int(thread_id), ticket_data, remove=False)
+                    closed.append(thread_id)
+                    return
+                except discord.HTTPException as e:
+                    print(f"Error fetching ticket thread {thread_id}: {e}")
+                    failed.append(thread_id)
+                    return
+                try:
+                    view = ConfirmCloseView(guild_id, thread_id, reason, ticket_data)
+                    await view.close_ticket(guild, thread, ticket_data, interaction.user, remove=False)
+                    closed.append(thread_id)
+                except Exception as e:
+                    print(f"Error bulk closing ticket {thread_id}: {e}")
+                    failed.append(thread_id)
+        
+        async def report():
+            while True:
+                await asyncio.sleep(2)
+                await progress.edit(content=f"🔒 Closing tickets... {len(closed) + len(failed)}/{len(matches)}")
+        
+        reporter = asyncio.create_task(report())
+        try:
+            await asyncio.gather(*(close_one(ticket_data) for ticket_data in matches))
+        finally:
+            reporter.cancel()
+            # Apply all storage removals in one write, even if the run was cut short
+            remove_active_tickets(guild_id, closed)
+        
+        summary = f"✅ Closed and archived {len(closed)}/{len(matches)} tickets"
+        if failed:
+            summary += f"\n❌ Failed: {', '.join(f'<#{thread_id}>' for thread_id in failed[:20])}"
+        await progress.edit(content=summary)
+
+    @app_commands.command(name="search_tickets", description="Search the transcripts of closed tickets")
+    @app_commands.describe(query="Words to search for")
+    async def search_tickets(self, interaction: discord.Interaction, query: str):
+        if not interaction.guild: 
+            return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
+        if not has_event_access(interaction): 
+            return await interaction.response.send_message("❌ Staff only!", ephemeral=True)
+        
+        try:
+            hits = await asyncio.to_thread(search_transcripts, str(interaction.guild.id), query)
+        except Exception as e:
+            return await interaction.response.send_message(f"❌ Search failed: {str(e)}", ephemeral=True)
+        
+        if not hits:
+            return await interaction.response.send_message(f"ℹ️ No transcripts match `{query[:100]}`", ephemeral=True)
+        
+        embed = discord.Embed(title=f"🔎 Transcript results for: {query[:200]}", color=discord.Color.blue())
+        for hit in hits:
+            closed = hit['closed_at'][:10] if hit['closed_at'] else 'Unknown'
+            embed.add_field(
+                name=f"{hit['thread_name']} ({closed})"[:256],
+                value=f"<#{hit['thread_id']}> by <@{hit['user_id']}>\n{hit['snippet']}"[:1024],
+                inline=False
+            )
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="export_transcripts", description="Download closed ticket transcripts as zip archives")
+    @app_commands.describe(
+        since="Only include tickets closed on or after this date (YYYY-MM-DD, UTC)",
+        until="Only include tickets closed on or before this date (YYYY-MM-DD, UTC)",
+        panel_id="Only include tickets from this panel",
+        user="Only include tickets opened by this user"
+    )
+    @app_commands.autocomplete(panel_id=panel_id_autocomplete)
+    async def export_transcripts(self, interaction: discord.Interaction, since: Optional[str] = None, until: Optional[str] = None,
+                                 panel_id: Optional[str] = None, user: Optional[discord.User] = None):
+        if not interaction.guild: 
+            return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
+        if not is_admin_or_owner(interaction): 
+            return await interaction.response.send_message("❌ Admin only!", ephemeral=True)
+        
+        try:
+            since_date = datetime.strptime(since, "%Y-%m-%d") if since else None
+            until_date = datetime.strptime(until, "%Y-%m-%d") if until else None
+        except ValueError:
+            return await interaction.response.send_message("❌ Dates must use the format YYYY-MM-DD", ephemeral=True)
+        
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        
+        guild = interaction.guild
+        try:
+            parts = await asyncio.to_thread(
+                export_transcripts, str(guild.id), guild.filesize_limit,
+                since=since_date.date().isoformat() if since_date else None,
+                until=(until_date + timedelta(days=1)).date().isoformat() if until_date else None,
+                panel_id=panel_id,
+                user_id=str(user.id) if user else None
+            )
+        except Exception as e:
+            return await interaction.followup.send(f"❌ Export failed: {str(e)}", ephemeral=True)
+        
+        if not parts:
+            return await interaction.followup.send("ℹ️ No transcripts match those filters", ephemeral=True)
+        
+        total = sum(count for _, count in parts)
+        try:
+            # One archive per message since each upload is already close to the size limit
+            for number, (fp, count) in enumerate(parts, start=1):
+                await interaction.followup.send(
+                    f"📦 Part {number}/{len(parts)} ({count} transcripts)",
+                    file=discord.File(fp, filename=f"transcripts-{guild.id}-part{number}.zip"),
+                    ephemeral=True
+                )
+        finally:
+            for fp, _ in parts:
+                fp.close()
+        
+        await interaction.followup.send(f"✅ Exported {total} transcripts in {len(parts)} archive(s)", ephemeral=True)
+
+    @app_commands.command(name="ticket_stats", description="Show ticket metrics for a panel or panel option")
+    @app_commands.describe(
+        panel_id="ID of the ticket panel",
+        option_id="Limit the stats to one option of the panel"
+    )
+    @app_commands.autocomplete(panel_id=panel_id_autocomplete)
+    async def ticket_stats(self, interaction: discord.Interaction, panel_id: str, option_id: Optional[str] = None):
+        if not interaction.guild: 
+            return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
+        if not has_event_access(interaction): 
+            return await interaction.response.send_message("❌ Staff only!", ephemeral=True)
+        
+        stats = get_ticket_stats(str(interaction.guild.id), panel_id, option_id)
+        if not stats:
+            return await interaction.response.send_message("ℹ️ No ticket activity recorded for that panel yet", ephemeral=True)
+        
+        def format_seconds(seconds):
+            if seconds is None:
+                return "No data"
+            if seconds < 3600:
+                return f"~{round(seconds / 60)}m"
+            if seconds < 86400:
+                return f"~{seconds / 3600:.1f}h"
+            return f"~{seconds / 86400:.1f}d"
+        
+        scope = f"`{panel_id}` / `{option_id}`" if option_id else f"`{panel_id}`"
+        embed = discord.Embed(title="📈 Ticket Stats", description=f"Panel: {scope}", color=discord.Color.blue())
+        embed.add_field(name="Opened", value=f"24h: {stats['opened_last_24h']}\n7d: {stats['opened_last_7d']}\nAll time: {stats['opened']}", inline=True)
+        embed.add_field(name="Closed", value=str(stats['closed']), inline=True)
+        embed.add_field(name="Peak Hour (24h)", value=f"{max(stats['hourly_last_24h'])} tickets", inline=True)
+        embed.add_field(name="Median First Staff Join", value=format_seconds(stats['median_first_join']), inline=True)
+        embed.add_field(name="Median Open Duration", value=format_seconds(stats['median_duration']), inline=True)
+        embed.add_field(name="Median First Staff Reply", value=format_seconds(stats['median_first_response']), inline=True)
+        if stats['closed']:
+            messages = stats['messages']
+            embed.add_field(name="Messages per Closed Ticket",
+                            value=f"{messages['total'] / stats['closed']:.1f} ({messages['staff'] / stats['closed']:.1f} from staff)", inline=True)
+        
+        closers = "\n".join(f"• <@{staff_id}>: {count}" for staff_id, count in stats['closes_by'][:10])
+        embed.add_field(name="Closes by Staff", value=closers or "No closes yet", inline=False)
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
     @app_commands.command(name="delete_ticket_panel", description="Delete a ticket panel by ID")
     @app_commands.describe(panel_id="ID of the ticket panel to delete")
+    @app_commands.autocomplete(panel_id=panel_id_autocomplete)
     async def delete_ticket_panel(self, interaction: discord.Interaction, panel_id: str):
         if not interaction.guild: 
             return await interaction.response.send_message("❌ Server only command!", ephemeral=True)
@@ -800,16 +2002,23 @@ class Tickets(commands.Cog):
             return await interaction.response.send_message("❌ Admin only!", ephemeral=True)
         
         guild_id = str(interaction.guild.id)
+        registry = get_panel_registry(guild_id)
+        in_multi = panel_id in registry["panels"]
+        in_single = panel_id in registry["ticket_setups"]
         
-        # Delete from multi-ticket configs
-        multi_configs = load_multi_ticket_configs(guild_id)
-        multi_configs = [c for c in multi_configs if c['id'] != panel_id]
-        save_multi_ticket_configs(guild_id, multi_configs)
+        if not in_multi and not in_single:
+            return await interaction.response.send_message(f"❌ Ticket panel `{panel_id}` not found", ephemeral=True)
+        
+        # Only rewrite the config files that actually contain the panel
+        if in_multi:
+            multi_configs = load_multi_ticket_configs(guild_id)
+            multi_configs = [c for c in multi_configs if c['id'] != panel_id]
+            save_multi_ticket_configs(guild_id, multi_configs)
         
-        # Delete from single ticket configs
-        ticket_configs = load_ticket_configs(guild_id)
-        ticket_configs = [c for c in ticket_configs if c['id'] != panel_id]
-        save_ticket_configs(guild_id, ticket_configs)
+        if in_single:
+            ticket_configs = load_ticket_configs(guild_id)
+            ticket_configs = [c for c in ticket_configs if c['id'] != panel_id]
+            save_ticket_configs(guild_id, ticket_configs)
         
         await interaction.response.send_message(f"✅ Ticket panel `{panel_id}` has been deleted", ephemeral=True)
 
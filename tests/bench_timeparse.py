@@ -0,0 +1,34 @@
+"""
+Time parser benchmark: python tests/bench_timeparse.py
+Reports the mean cost per parse_time call for each input shape.
+"""
+import os
+import sys
+import timeit
+from datetime import datetime
+
+import pytz
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.timeparse import parse_time, zone_for  # noqa: E402
+
+NOW = pytz.UTC.localize(datetime(2030, 12, 31, 23, 30))
+INPUTS = [
+    "2030-05-01 18:00", "12-31 20:00", "18:00", "tomorrow 09:00", "fri 18:00",
+    "in 1h30m", "2030-02-30 10:00", "not a time",
+]
+ZONES = ["UTC+2", "America/New_York"]
+NUMBER = 20000
+
+def main():
+    for zone_name in ZONES:
+        tz = zone_for(zone_name)
+        print(zone_name)
+        for text in INPUTS:
+            call = lambda text=text, tz=tz: parse_time(text, tz, NOW)  # noqa: E731
+            seconds = min(timeit.repeat(call, number=NUMBER, repeat=3))
+            print(f"  {text!r:22} {seconds / NUMBER * 1e6:6.2f} us")
+
+if __name__ == "__main__":
+    main()
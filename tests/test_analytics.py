@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from utils.analytics import (
+    DURATION_BUCKETS,
+    get_ticket_stats,
+    record_first_join,
+    record_ticket_closed,
+    record_ticket_opened,
+)
+
+GUILD = "1"
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    # Server data is written relative to the working directory
+    monkeypatch.chdir(tmp_path)
+
+
+def ticket(created_ago, closed_ago=None, option_id="o", **extra):
+    now = datetime.now(timezone.utc)
+    data = {
+        "panel_id": "p",
+        "option_id": option_id,
+        "created_at": (now - created_ago).isoformat(),
+    }
+    if closed_ago is not None:
+        data["closed_at"] = (now - closed_ago).isoformat()
+    data.update(extra)
+    return data
+
+
+def bucket_bound(seconds):
+    return next(bound for bound in DURATION_BUCKETS if bound >= seconds)
+
+
+def test_opened_counts_per_panel_and_option():
+    record_ticket_opened(GUILD, ticket(timedelta(minutes=5)))
+    record_ticket_opened(GUILD, ticket(timedelta(minutes=10), option_id="other"))
+    record_ticket_opened(GUILD, ticket(timedelta(days=2)))
+
+    panel = get_ticket_stats(GUILD, "p")
+    assert (panel["opened"], panel["opened_last_24h"], panel["opened_last_7d"]) == (
+        3,
+        2,
+        3,
+    )
+    option = get_ticket_stats(GUILD, "p", "o")
+    assert (option["opened"], option["opened_last_24h"]) == (2, 1)
+    assert get_ticket_stats(GUILD, "missing") is None
+
+
+def test_tickets_without_a_panel_are_ignored():
+    record_ticket_opened(GUILD, {"created_at": datetime.now(timezone.utc).isoformat()})
+    assert get_ticket_stats(GUILD, "p") is None
+
+
+def test_medians_come_from_histogram_buckets():
+    for minutes in (2, 10, 60):
+        data = ticket(
+            timedelta(hours=2),
+            timedelta(hours=2) - timedelta(minutes=minutes),
+            closer_id="42",
+        )
+        record_ticket_opened(GUILD, data)
+        record_first_join(
+            GUILD,
+            data,
+            (
+                datetime.fromisoformat(data["created_at"]) + timedelta(minutes=minutes)
+            ).isoformat(),
+        )
+        record_ticket_closed(GUILD, data)
+
+    stats = get_ticket_stats(GUILD, "p", "o")
+    assert stats["closed"] == 3
+    assert stats["median_first_join"] == bucket_bound(600)
+    assert stats["median_duration"] == bucket_bound(600)
+    assert stats["closes_by"] == [("42", 3)]
+
+
+def test_close_activity_is_kept():
+    created = datetime.now(timezone.utc) - timedelta(hours=1)
+    activity = {
+        "messages": 12,
+        "staff_messages": 5,
+        "first_staff_response_at": (created + timedelta(minutes=3)).isoformat(),
+    }
+    data = ticket(timedelta(hours=1), timedelta(0), activity=activity)
+    data["created_at"] = created.isoformat()
+    record_ticket_opened(GUILD, data)
+    record_ticket_closed(GUILD, data)
+    record_ticket_closed(GUILD, ticket(timedelta(hours=1), timedelta(0)))
+
+    stats = get_ticket_stats(GUILD, "p")
+    assert stats["median_first_response"] == bucket_bound(180)
+    assert stats["messages"] == {"total": 12, "staff": 5}
@@ -0,0 +1,133 @@
+import io
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+from utils.event_import import RowIntervals, iter_csv_events, iter_ics_events
+
+UTC = pytz.UTC
+BASE = UTC.localize(datetime(2030, 1, 1, 18, 0))
+
+
+def hours(n):
+    return timedelta(hours=n)
+
+
+def csv_rows(text):
+    return list(iter_csv_events(io.StringIO(text, newline="")))
+
+
+def ics_rows(text, tz=UTC):
+    return list(iter_ics_events(io.StringIO(text, newline=""), tz))
+
+
+def test_csv_rows_are_numbered_by_record():
+    rows = csv_rows(
+        'name,time,description\nA,18:00,"two\nlines"\nB,19:00,\nC,20:00,x\n'
+    )
+    assert [(row["row"], row["name"]) for row in rows] == [(2, "A"), (3, "B"), (4, "C")]
+    assert rows[0]["description"] == "two\nlines"
+
+
+def test_csv_optional_columns_default_to_empty():
+    (row,) = csv_rows("time,name\n 18:00 , Raid night \n")
+    assert (row["name"], row["time"], row["location"], row["duration_minutes"]) == (
+        "Raid night",
+        "18:00",
+        "",
+        "",
+    )
+
+
+def test_csv_requires_name_and_time():
+    with pytest.raises(ValueError, match="time"):
+        csv_rows("name,location\nA,B\n")
+
+
+ICS = """BEGIN:VCALENDAR
+BEGIN:VEVENT
+SUMMARY:Raid\\, night
+DESCRIPTION:Bring
+  potions\\nand food
+DTSTART;TZID=Europe/Berlin:20300105T200000
+DTEND;TZID=Europe/Berlin:20300105T213000
+LOCATION:Voice
+END:VEVENT
+BEGIN:VEVENT
+SUMMARY:Floating
+DTSTART:20300106T100000
+DURATION:PT2H15M
+END:VEVENT
+BEGIN:VEVENT
+SUMMARY:Utc
+DTSTART:20300107T100000Z
+END:VEVENT
+BEGIN:VEVENT
+SUMMARY:All day
+DTSTART;VALUE=DATE:20300108
+END:VEVENT
+BEGIN:VEVENT
+SUMMARY:Too long
+DTSTART:20300109T100000Z
+DURATION:P99999999999W
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+def test_ics_events():
+    rows = ics_rows(ICS, pytz.timezone("America/New_York"))
+    assert [row["row"] for row in rows] == [1, 2, 3, 4, 5]
+
+    raid, floating, utc, all_day, too_long = rows
+    assert (raid["name"], raid["description"], raid["location"]) == (
+        "Raid, night",
+        "Bring potions\nand food",
+        "Voice",
+    )
+    assert raid["start"] == pytz.timezone("Europe/Berlin").localize(
+        datetime(2030, 1, 5, 20, 0)
+    )
+    assert raid["duration_minutes"] == "90"
+
+    # Floating times are read in the importing user's zone
+    assert floating["start"].utcoffset() == timedelta(hours=-5)
+    assert floating["duration_minutes"] == "135"
+
+    assert utc["start"] == UTC.localize(datetime(2030, 1, 7, 10, 0))
+    assert utc["duration_minutes"] == "" and utc["error"] is None
+
+    assert "all-day" in all_day["error"]
+    assert too_long["error"].startswith("bad date")
+
+
+def test_rows_overlapping_earlier_rows_clash():
+    accepted = RowIntervals()
+    accepted.add(5, BASE, BASE + hours(2), row=2)
+    accepted.add(5, BASE + hours(4), BASE + hours(5), row=3)
+
+    assert accepted.clash(5, BASE + hours(1), BASE + hours(3)) == 2
+    assert accepted.clash(5, BASE + hours(3), BASE + hours(4.5)) == 3
+    assert accepted.clash(5, BASE - hours(1), BASE + hours(6)) == 2
+    assert accepted.clash(5, BASE, BASE + hours(1)) == 2
+
+
+def test_touching_rows_and_other_channels_do_not_clash():
+    accepted = RowIntervals()
+    accepted.add(5, BASE, BASE + hours(2), row=2)
+    accepted.add(5, BASE + hours(4), BASE + hours(5), row=3)
+
+    assert accepted.clash(5, BASE + hours(2), BASE + hours(4)) is None
+    assert accepted.clash(5, BASE - hours(1), BASE) is None
+    assert accepted.clash(5, BASE + hours(5), BASE + hours(6)) is None
+    assert accepted.clash(6, BASE, BASE + hours(5)) is None
+
+
+def test_rows_added_out_of_order_stay_sorted():
+    accepted = RowIntervals()
+    for row, start in ((2, 6), (3, 0), (4, 3)):
+        assert accepted.clash(5, BASE + hours(start), BASE + hours(start + 1)) is None
+        accepted.add(5, BASE + hours(start), BASE + hours(start + 1), row)
+    assert accepted.clash(5, BASE + hours(3.5), BASE + hours(3.75)) == 4
+    assert accepted.clash(5, BASE + hours(0.5), BASE + hours(6.5)) == 3
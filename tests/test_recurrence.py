@@ -0,0 +1,106 @@
+from datetime import datetime
+from itertools import islice
+
+import pytest
+import pytz
+
+from utils.recurrence import MAX_COUNT, iter_occurrences, parse_recurrence
+
+UTC = pytz.UTC
+NEW_YORK = pytz.timezone("America/New_York")
+
+
+def dates(spec, start, tz=UTC, limit=50):
+    return [
+        d.strftime("%Y-%m-%d")
+        for d in islice(iter_occurrences(parse_recurrence(spec), start, tz), limit)
+    ]
+
+
+def test_count_limits_occurrences():
+    start = UTC.localize(datetime(2030, 1, 1, 18, 0))
+    assert dates("FREQ=DAILY;COUNT=3", start) == [
+        "2030-01-01",
+        "2030-01-02",
+        "2030-01-03",
+    ]
+    assert dates("FREQ=WEEKLY;INTERVAL=2;COUNT=2", start) == [
+        "2030-01-01",
+        "2030-01-15",
+    ]
+
+
+def test_until_is_inclusive():
+    start = UTC.localize(datetime(2030, 1, 1, 18, 0))
+    assert dates("FREQ=DAILY;UNTIL=2030-01-03", start) == [
+        "2030-01-01",
+        "2030-01-02",
+        "2030-01-03",
+    ]
+    assert dates("FREQ=DAILY;UNTIL=20300102", start) == ["2030-01-01", "2030-01-02"]
+    assert dates("FREQ=DAILY;UNTIL=2029-12-31", start) == []
+
+
+def test_count_and_until_stop_at_whichever_comes_first():
+    start = UTC.localize(datetime(2030, 1, 1, 18, 0))
+    assert dates("FREQ=DAILY;COUNT=10;UNTIL=2030-01-02", start) == [
+        "2030-01-01",
+        "2030-01-02",
+    ]
+    assert len(dates("FREQ=DAILY;COUNT=2;UNTIL=2030-12-31", start)) == 2
+
+
+def test_weekly_byday_starts_from_the_first_matching_day():
+    # 2030-01-01 is a Tuesday, so this week's Monday is skipped
+    start = UTC.localize(datetime(2030, 1, 1, 18, 0))
+    assert dates("FREQ=WEEKLY;BYDAY=MO,TH;COUNT=4", start) == [
+        "2030-01-03",
+        "2030-01-07",
+        "2030-01-10",
+        "2030-01-14",
+    ]
+
+
+def test_monthly_skips_months_without_the_day():
+    start = UTC.localize(datetime(2030, 1, 31, 18, 0))
+    assert dates("FREQ=MONTHLY;COUNT=3", start) == [
+        "2030-01-31",
+        "2030-03-31",
+        "2030-05-31",
+    ]
+    assert dates("FREQ=MONTHLY;UNTIL=2030-04-30", start) == ["2030-01-31", "2030-03-31"]
+
+
+def test_occurrences_keep_wall_clock_across_dst():
+    start = NEW_YORK.localize(datetime(2030, 3, 9, 18, 0))
+    first, second = islice(
+        iter_occurrences(parse_recurrence("FREQ=DAILY"), start, NEW_YORK), 2
+    )
+    assert (first.hour, second.hour) == (18, 18)
+    assert first.utcoffset() != second.utcoffset()
+
+
+def test_rrule_prefix_and_case_are_accepted():
+    rule = parse_recurrence("rrule:freq=weekly;byday=tu")
+    assert (rule["freq"], rule["byday"]) == ("WEEKLY", [1])
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        "",
+        "FREQ=YEARLY",
+        "FREQ=DAILY;COUNT=0",
+        f"FREQ=DAILY;COUNT={MAX_COUNT + 1}",
+        "FREQ=DAILY;COUNT=x",
+        "FREQ=DAILY;INTERVAL=0",
+        "FREQ=DAILY;BYDAY=MO",
+        "FREQ=WEEKLY;BYDAY=XX",
+        "FREQ=DAILY;UNTIL=soon",
+        "FREQ=DAILY;BYMONTH=1",
+        "FREQ",
+    ],
+)
+def test_invalid_specs(spec):
+    with pytest.raises(ValueError):
+        parse_recurrence(spec)
@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+from cogs.events import DEFAULT_EVENT_MINUTES, ChannelScheduleIndex, event_cache
+
+BASE = datetime(2030, 1, 1, 18, 0, tzinfo=timezone.utc)
+VOICE = 5
+
+
+def hours(n):
+    return timedelta(hours=n)
+
+
+def make_event(event_id, start, end, channel_id=VOICE, name=None):
+    return SimpleNamespace(
+        id=event_id,
+        name=name or f"event {event_id}",
+        guild_id=1,
+        channel_id=channel_id,
+        start_time=BASE + start,
+        end_time=BASE + end if end is not None else None,
+        status=discord.EventStatus.scheduled,
+    )
+
+
+@pytest.fixture
+def guild():
+    guild = SimpleNamespace(
+        id=1,
+        scheduled_events=[
+            make_event(1, hours(0), hours(2)),
+            make_event(2, hours(2), hours(3)),
+            make_event(3, hours(5), hours(6)),
+            # A long event in another channel that starts well before the windows below
+            make_event(4, hours(-30), hours(5), channel_id=6),
+            make_event(5, hours(1), None, channel_id=7),
+            make_event(6, hours(1), hours(2), channel_id=None),
+        ],
+    )
+    event_cache.seed(guild)
+    yield guild
+    event_cache.drop_guild(guild.id)
+
+
+def ids(events):
+    return sorted(event.id for event in events)
+
+
+def test_overlapping_windows_conflict(guild):
+    index = ChannelScheduleIndex()
+    assert ids(index.conflicts(guild, VOICE, BASE + hours(1), BASE + hours(2.5))) == [
+        1,
+        2,
+    ]
+    assert ids(index.conflicts(guild, VOICE, BASE + hours(-1), BASE + hours(10))) == [
+        1,
+        2,
+        3,
+    ]
+    assert ids(index.conflicts(guild, VOICE, BASE + hours(0.5), BASE + hours(1))) == [1]
+
+
+def test_touching_windows_do_not_conflict(guild):
+    index = ChannelScheduleIndex()
+    assert index.conflicts(guild, VOICE, BASE + hours(3), BASE + hours(5)) == []
+    assert index.conflicts(guild, VOICE, BASE + hours(-1), BASE) == []
+    assert index.conflicts(guild, VOICE, BASE + hours(6), BASE + hours(7)) == []
+
+
+def test_long_events_are_found_from_far_back(guild):
+    index = ChannelScheduleIndex()
+    assert ids(index.conflicts(guild, 6, BASE + hours(4), BASE + hours(6))) == [4]
+    assert index.conflicts(guild, 6, BASE + hours(5), BASE + hours(6)) == []
+
+
+def test_missing_end_time_uses_default_length(guild):
+    index = ChannelScheduleIndex()
+    default_end = hours(1) + timedelta(minutes=DEFAULT_EVENT_MINUTES)
+    assert ids(
+        index.conflicts(guild, 7, BASE + default_end - hours(0.25), BASE + hours(9))
+    ) == [5]
+    assert index.conflicts(guild, 7, BASE + default_end, BASE + hours(9)) == []
+
+
+def test_ignore_id_and_other_channels(guild):
+    index = ChannelScheduleIndex()
+    assert ids(
+        index.conflicts(guild, VOICE, BASE + hours(1), BASE + hours(2.5), ignore_id=1)
+    ) == [2]
+    assert index.conflicts(guild, 99, BASE, BASE + hours(24)) == []
+
+
+def test_index_follows_cache_changes(guild):
+    index = ChannelScheduleIndex()
+    assert index.conflicts(guild, VOICE, BASE + hours(3), BASE + hours(4)) == []
+    event_cache.put(make_event(7, hours(3.5), hours(4.5)))
+    assert ids(index.conflicts(guild, VOICE, BASE + hours(3), BASE + hours(4))) == [7]
+    event_cache.remove(guild.id, 7)
+    assert index.conflicts(guild, VOICE, BASE + hours(3), BASE + hours(4)) == []
+
+
+def test_nearest_free_slot_prefers_the_closer_side(guild):
+    index = ChannelScheduleIndex()
+    earliest = BASE - hours(10)
+    # Booked 0h-3h and 5h-6h: an hour at 0.5h fits sooner at -1h than at 3h
+    assert index.nearest_free_slot(
+        guild, VOICE, BASE + hours(0.5), BASE + hours(1.5), earliest
+    ) == BASE - hours(1)
+    assert index.nearest_free_slot(
+        guild, VOICE, BASE + hours(2.5), BASE + hours(3.5), earliest
+    ) == BASE + hours(3)
+    # Two hours fit exactly into the 3h-5h gap
+    assert index.nearest_free_slot(
+        guild, VOICE, BASE + hours(4), BASE + hours(6), earliest
+    ) == BASE + hours(3)
+    # Two and a half hours don't, so the closest fit is after the 5h-6h event
+    assert index.nearest_free_slot(
+        guild, VOICE, BASE + hours(4), BASE + hours(6.5), earliest
+    ) == BASE + hours(6)
+
+
+def test_nearest_free_slot_respects_earliest(guild):
+    index = ChannelScheduleIndex()
+    assert index.nearest_free_slot(
+        guild, VOICE, BASE + hours(0.5), BASE + hours(1.5), BASE
+    ) == BASE + hours(3)
@@ -0,0 +1,95 @@
+import asyncio
+import time
+
+from utils.scheduler import DeadlineScheduler
+
+
+def run_scheduler(setup, wait=0.15):
+    """Run a scheduler, let setup() add keys, return the keys in firing order"""
+    fired = []
+
+    async def main():
+        async def callback(key):
+            fired.append(key)
+
+        scheduler = DeadlineScheduler(callback)
+        scheduler.start()
+        setup(scheduler, time.time())
+        await asyncio.sleep(wait)
+        scheduler.stop()
+        return scheduler
+
+    scheduler = asyncio.run(main())
+    return fired, scheduler
+
+
+def test_fires_in_deadline_order():
+    def setup(scheduler, now):
+        scheduler.schedule("c", now + 0.06)
+        scheduler.schedule("a", now + 0.02)
+        scheduler.schedule("b", now + 0.04)
+
+    fired, scheduler = run_scheduler(setup)
+    assert fired == ["a", "b", "c"]
+    assert len(scheduler) == 0
+
+
+def test_past_deadlines_fire_immediately():
+    def setup(scheduler, now):
+        scheduler.schedule("late", now - 10)
+        scheduler.schedule("soon", now + 0.02)
+
+    fired, _ = run_scheduler(setup)
+    assert fired == ["late", "soon"]
+
+
+def test_reschedule_moves_a_key():
+    def setup(scheduler, now):
+        scheduler.schedule("a", now + 0.02)
+        scheduler.schedule("b", now + 0.04)
+        scheduler.schedule("a", now + 0.08)
+
+    fired, _ = run_scheduler(setup)
+    assert fired == ["b", "a"]
+
+
+def test_cancelled_keys_do_not_fire():
+    def setup(scheduler, now):
+        scheduler.schedule("a", now + 0.02)
+        scheduler.schedule("b", now + 0.04)
+        scheduler.cancel("a")
+
+    fired, scheduler = run_scheduler(setup)
+    assert fired == ["b"]
+    assert len(scheduler) == 0
+
+
+def test_future_keys_stay_pending():
+    def setup(scheduler, now):
+        scheduler.schedule("now", now)
+        scheduler.schedule("later", now + 60)
+
+    fired, scheduler = run_scheduler(setup, wait=0.05)
+    assert fired == ["now"]
+    assert len(scheduler) == 1
+
+
+def test_failing_callbacks_do_not_stop_the_loop():
+    fired = []
+
+    async def main():
+        async def callback(key):
+            fired.append(key)
+            if key == "boom":
+                raise RuntimeError(key)
+
+        scheduler = DeadlineScheduler(callback)
+        scheduler.start()
+        now = time.time()
+        scheduler.schedule("boom", now + 0.01)
+        scheduler.schedule("after", now + 0.03)
+        await asyncio.sleep(0.1)
+        scheduler.stop()
+
+    asyncio.run(main())
+    assert fired == ["boom", "after"]
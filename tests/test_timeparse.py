@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+from utils.timeparse import normalize_timezone, parse_duration, parse_time, zone_for
+
+UTC = pytz.UTC
+NEW_YORK = pytz.timezone("America/New_York")
+BERLIN = zone_for("UTC+1")
+
+
+def at(tz, *args):
+    return tz.localize(datetime(*args))
+
+
+# (text, now, expected); all in UTC unless the case says otherwise
+CORPUS = [
+    # Full dates
+    ("2030-05-01 18:00", at(UTC, 2030, 1, 1, 12, 0), at(UTC, 2030, 5, 1, 18, 0)),
+    ("2030-5-1 8:05", at(UTC, 2030, 1, 1, 12, 0), at(UTC, 2030, 5, 1, 8, 5)),
+    # Bare times roll over to tomorrow once passed, including across midnight
+    ("18:00", at(UTC, 2030, 3, 10, 12, 0), at(UTC, 2030, 3, 10, 18, 0)),
+    ("12:00", at(UTC, 2030, 3, 10, 12, 0), at(UTC, 2030, 3, 11, 12, 0)),
+    ("00:00", at(UTC, 2030, 3, 10, 23, 59), at(UTC, 2030, 3, 11, 0, 0)),
+    ("23:30", at(UTC, 2030, 3, 10, 23, 45), at(UTC, 2030, 3, 11, 23, 30)),
+    ("00:15", at(UTC, 2030, 12, 31, 23, 50), at(UTC, 2031, 1, 1, 0, 15)),
+    # Dates without a year roll over to next year once passed
+    ("12-31 20:00", at(UTC, 2030, 12, 31, 12, 0), at(UTC, 2030, 12, 31, 20, 0)),
+    ("12-31 20:00", at(UTC, 2030, 12, 31, 21, 0), at(UTC, 2031, 12, 31, 20, 0)),
+    ("01-01 00:00", at(UTC, 2030, 12, 31, 23, 0), at(UTC, 2031, 1, 1, 0, 0)),
+    ("02-29 10:00", at(UTC, 2028, 1, 1, 0, 0), at(UTC, 2028, 2, 29, 10, 0)),
+    # Day words and weekdays (2030-03-10 is a Sunday)
+    ("today 20:00", at(UTC, 2030, 3, 10, 12, 0), at(UTC, 2030, 3, 10, 20, 0)),
+    ("tomorrow 09:00", at(UTC, 2030, 12, 31, 12, 0), at(UTC, 2031, 1, 1, 9, 0)),
+    ("Tmrw 9:00", at(UTC, 2030, 3, 10, 12, 0), at(UTC, 2030, 3, 11, 9, 0)),
+    ("fri 18:00", at(UTC, 2030, 3, 10, 12, 0), at(UTC, 2030, 3, 15, 18, 0)),
+    ("next friday 18:00", at(UTC, 2030, 3, 10, 12, 0), at(UTC, 2030, 3, 15, 18, 0)),
+    ("tues 10:00", at(UTC, 2030, 3, 10, 12, 0), at(UTC, 2030, 3, 12, 10, 0)),
+    ("Thursday 10:00", at(UTC, 2030, 3, 10, 12, 0), at(UTC, 2030, 3, 14, 10, 0)),
+    ("thurs 10:00", at(UTC, 2030, 3, 10, 12, 0), at(UTC, 2030, 3, 14, 10, 0)),
+    ("wednesday 10:00", at(UTC, 2030, 3, 10, 12, 0), at(UTC, 2030, 3, 13, 10, 0)),
+    ("sun 18:00", at(UTC, 2030, 3, 10, 12, 0), at(UTC, 2030, 3, 10, 18, 0)),
+    ("sun 10:00", at(UTC, 2030, 3, 10, 12, 0), at(UTC, 2030, 3, 17, 10, 0)),
+    ("wed 10:00", at(UTC, 2030, 12, 30, 12, 0), at(UTC, 2031, 1, 1, 10, 0)),
+    # Relative offsets
+    ("in 2h", at(UTC, 2030, 3, 10, 23, 0), at(UTC, 2030, 3, 11, 1, 0)),
+    ("in 1h30m", at(UTC, 2030, 12, 31, 23, 0), at(UTC, 2031, 1, 1, 0, 30)),
+    ("in 45 minutes", at(UTC, 2030, 3, 10, 12, 0), at(UTC, 2030, 3, 10, 12, 45)),
+    ("in 3 days", at(UTC, 2030, 2, 27, 12, 0), at(UTC, 2030, 3, 2, 12, 0)),
+    ("  IN 2 Hours ", at(UTC, 2030, 3, 10, 12, 0), at(UTC, 2030, 3, 10, 14, 0)),
+]
+
+MALFORMED = [
+    "", "   ", "18", "18:0", "24:00", "12:60", "2030-13-01 10:00", "2030-02-30 10:00",
+    "02-29 10:00 pm", "in", "in 2", "in 2 fortnights", "in 2h later", "yesterday 10:00",
+    "funday 10:00", "2030/05/01 18:00", "18:00:00", "noon",
+    # Words that merely start like a weekday
+    "monkey 10:00", "sunny 18:00", "frisbee 10:00", "wedding 12:00", "saturn 20:00",
+    # Offsets past the representable range
+    "in 9999999 days", "in 9999999999d", "in " + "9" * 5000 + "d",
+]
+
+
+@pytest.mark.parametrize("text, now, expected", CORPUS)
+def test_corpus(text, now, expected):
+    assert parse_time(text, UTC, now) == expected
+
+
+@pytest.mark.parametrize("text", MALFORMED)
+def test_malformed_input(text):
+    assert parse_time(text, UTC, at(UTC, 2030, 3, 10, 12, 0)) is None
+
+
+def test_feb_29_in_a_non_leap_year():
+    assert parse_time("2029-02-29 10:00", UTC, at(UTC, 2029, 1, 1, 0, 0)) is None
+    # Rolling a passed Feb 29 into a non-leap year has no valid date either
+    assert parse_time("02-29 10:00", UTC, at(UTC, 2028, 3, 1, 0, 0)) is None
+
+
+def test_result_is_in_requested_zone():
+    now = at(UTC, 2030, 3, 10, 12, 0)
+    result = parse_time("18:00", BERLIN, now)
+    assert result.utcoffset() == timedelta(hours=1)
+    assert (result.hour, result.minute) == (18, 0)
+
+
+def test_midnight_rollover_uses_local_date():
+    # 23:30 UTC is already the next day in UTC+1
+    now = at(UTC, 2030, 3, 10, 23, 30)
+    assert parse_time("01:00", BERLIN, now) == at(BERLIN, 2030, 3, 11, 1, 0)
+    assert parse_time("00:15", BERLIN, now) == at(BERLIN, 2030, 3, 12, 0, 15)
+    assert parse_time("tomorrow 01:00", BERLIN, now) == at(BERLIN, 2030, 3, 12, 1, 0)
+
+
+def test_year_end_rollover_in_local_zone():
+    # Dec 31 23:30 in New York is already Jan 1 in UTC
+    now = at(NEW_YORK, 2030, 12, 31, 23, 30)
+    assert parse_time("00:30", NEW_YORK, now) == at(NEW_YORK, 2031, 1, 1, 0, 30)
+    assert parse_time("12-31 22:00", NEW_YORK, now) == at(NEW_YORK, 2031, 12, 31, 22, 0)
+
+
+def test_dst_wall_clock_is_kept():
+    # US clocks spring forward on 2030-03-10 and fall back on 2030-11-03
+    before_spring = at(NEW_YORK, 2030, 3, 9, 20, 0)
+    result = parse_time("tomorrow 18:00", NEW_YORK, before_spring)
+    assert (result.hour, result.minute) == (18, 0)
+    assert result.utcoffset() == timedelta(hours=-4)
+
+    before_fall = at(NEW_YORK, 2030, 11, 2, 20, 0)
+    result = parse_time("tomorrow 18:00", NEW_YORK, before_fall)
+    assert (result.hour, result.minute) == (18, 0)
+    assert result.utcoffset() == timedelta(hours=-5)
+
+
+def test_relative_offsets_are_elapsed_time_across_dst():
+    now = at(NEW_YORK, 2030, 3, 10, 1, 0)
+    result = parse_time("in 2h", NEW_YORK, now)
+    assert result - now == timedelta(hours=2)
+    assert (result.hour, result.utcoffset()) == (4, timedelta(hours=-4))
+
+
+def test_no_overflow_at_the_end_of_time():
+    now = at(UTC, 9999, 12, 31, 23, 0)
+    for text in ("22:00", "tomorrow 10:00", "fri 10:00", "12-31 10:00", "in 2h"):
+        assert parse_time(text, UTC, now) is None
+
+
+def test_parse_duration():
+    assert parse_duration("1h30m") == timedelta(hours=1, minutes=30)
+    assert parse_duration("2 days 3 hrs") == timedelta(days=2, hours=3)
+    assert parse_duration("90") is None
+    assert parse_duration("2 weeks") is None
+    assert parse_duration("2h soon") is None
+    assert parse_duration("9999999999d") is None
+    assert parse_duration("9" * 5000 + "d") is None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("utc+2", "UTC+2"),
+    ("UTC-05", "UTC-5"),
+    ("UTC+15", None),
+    ("europe/berlin", "Europe/Berlin"),
+    ("Mars/Olympus", None),
+])
+def test_normalize_timezone(text, expected):
+    assert normalize_timezone(text) == expected
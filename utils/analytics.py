@@ -0,0 +1,163 @@
+import bisect
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from utils.storage import get_server_data_path
+
+logger = logging.getLogger('discord')
+
+# Ticket analytics are kept as running aggregates so nothing has to re-read transcripts.
+# Each panel and each panel option gets a block with:
+#   opened_hourly  - ring buffer of tickets opened per hour over the last week
+#   first_join     - histogram of seconds until the first staff member joined
+#   duration       - histogram of seconds between open and close
+#   first_response - histogram of seconds until the first staff message
+#   messages       - total and staff message counts over closed tickets
+#   closes_by      - close count per staff member
+HOURS_KEPT = 24 * 7
+# Histogram bucket upper bounds in seconds: 30s growing by 1.5x up to ~90 days
+DURATION_BUCKETS = [int(30 * 1.5 ** i) for i in range(30)]
+
+def _load_stats(guild_id: str) -> Dict[str, Any]:
+    path = get_server_data_path(guild_id, "ticket_stats.json")
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def _save_stats(guild_id: str, stats: Dict[str, Any]) -> None:
+    with open(get_server_data_path(guild_id, "ticket_stats.json"), 'w') as f:
+        json.dump(stats, f, separators=(",", ":"))
+
+def _stat_keys(ticket_data: Dict[str, Any]) -> List[str]:
+    panel_id = ticket_data.get('panel_id')
+    if not panel_id:
+        return []
+    option_id = ticket_data.get('option_id')
+    return [panel_id, f"{panel_id}:{option_id}"] if option_id else [panel_id]
+
+def _block(stats: Dict[str, Any], key: str) -> Dict[str, Any]:
+    return stats.setdefault(key, {
+        "opened": 0,
+        "closed": 0,
+        "last_hour": 0,
+        "opened_hourly": [0] * HOURS_KEPT,
+        "first_join": [0] * (len(DURATION_BUCKETS) + 1),
+        "duration": [0] * (len(DURATION_BUCKETS) + 1),
+        "first_response": [0] * (len(DURATION_BUCKETS) + 1),
+        "messages": {"total": 0, "staff": 0},
+        "closes_by": {}
+    })
+
+def _add_activity(block: Dict[str, Any], ticket_data: Dict[str, Any]) -> None:
+    """Fold a closed ticket's final message counters into the block"""
+    activity = ticket_data.get('activity')
+    if not activity:
+        return
+    # Blocks written before activity was tracked lack these keys
+    messages = block.setdefault("messages", {"total": 0, "staff": 0})
+    messages["total"] += activity.get('messages', 0)
+    messages["staff"] += activity.get('staff_messages', 0)
+    seconds = _seconds_between(ticket_data.get('created_at'), activity.get('first_staff_response_at'))
+    if seconds is not None:
+        _add_sample(block.setdefault("first_response", [0] * (len(DURATION_BUCKETS) + 1)), seconds)
+
+def _advance_hours(block: Dict[str, Any], hour: int) -> None:
+    """Zero ring slots for hours that passed without activity"""
+    gap = hour - block["last_hour"]
+    if gap <= 0:
+        return
+    for h in range(hour - min(gap, HOURS_KEPT) + 1, hour + 1):
+        block["opened_hourly"][h % HOURS_KEPT] = 0
+    block["last_hour"] = hour
+
+def _seconds_between(start: Optional[str], end: Optional[str]) -> Optional[float]:
+    try:
+        return (datetime.fromisoformat(end) - datetime.fromisoformat(start)).total_seconds()
+    except (TypeError, ValueError):
+        return None
+
+def _add_sample(histogram: List[int], seconds: float) -> None:
+    histogram[bisect.bisect_left(DURATION_BUCKETS, max(seconds, 0))] += 1
+
+def record_ticket_opened(guild_id: str, ticket_data: Dict[str, Any]) -> None:
+    try:
+        created_at = datetime.fromisoformat(ticket_data['created_at'])
+        hour = int(created_at.timestamp() // 3600)
+        stats = _load_stats(guild_id)
+        for key in _stat_keys(ticket_data):
+            block = _block(stats, key)
+            _advance_hours(block, hour)
+            if hour > block["last_hour"] - HOURS_KEPT:
+                block["opened_hourly"][hour % HOURS_KEPT] += 1
+            block["opened"] += 1
+        _save_stats(guild_id, stats)
+    except Exception as e:
+        logger.error(f"❌ Error recording ticket open: {str(e)}")
+
+def record_first_join(guild_id: str, ticket_data: Dict[str, Any], joined_at: str) -> None:
+    try:
+        seconds = _seconds_between(ticket_data.get('created_at'), joined_at)
+        if seconds is None:
+            return
+        stats = _load_stats(guild_id)
+        for key in _stat_keys(ticket_data):
+            _add_sample(_block(stats, key)["first_join"], seconds)
+        _save_stats(guild_id, stats)
+    except Exception as e:
+        logger.error(f"❌ Error recording first staff join: {str(e)}")
+
+def record_ticket_closed(guild_id: str, ticket_data: Dict[str, Any]) -> None:
+    try:
+        seconds = _seconds_between(ticket_data.get('created_at'), ticket_data.get('closed_at'))
+        closer_id = ticket_data.get('closer_id')
+        stats = _load_stats(guild_id)
+        for key in _stat_keys(ticket_data):
+            block = _block(stats, key)
+            block["closed"] += 1
+            if seconds is not None:
+                _add_sample(block["duration"], seconds)
+            if closer_id:
+                block["closes_by"][closer_id] = block["closes_by"].get(closer_id, 0) + 1
+            _add_activity(block, ticket_data)
+        _save_stats(guild_id, stats)
+    except Exception as e:
+        logger.error(f"❌ Error recording ticket close: {str(e)}")
+
+def _histogram_median(histogram: List[int]) -> Optional[float]:
+    """Approximate median in seconds: the upper bound of the bucket holding the middle sample"""
+    total = sum(histogram)
+    if not total:
+        return None
+    running = 0
+    for i, count in enumerate(histogram):
+        running += count
+        if running * 2 >= total:
+            return DURATION_BUCKETS[i] if i < len(DURATION_BUCKETS) else DURATION_BUCKETS[-1]
+    return None
+
+def get_ticket_stats(guild_id: str, panel_id: str, option_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Summarize the aggregates for a panel, or for one of its options"""
+    key = f"{panel_id}:{option_id}" if option_id else panel_id
+    block = _load_stats(guild_id).get(key)
+    if not block:
+        return None
+
+    now_hour = int(datetime.now().timestamp() // 3600)
+    _advance_hours(block, now_hour)
+    hourly = [block["opened_hourly"][h % HOURS_KEPT] for h in range(now_hour - 23, now_hour + 1)]
+    return {
+        "opened": block["opened"],
+        "closed": block["closed"],
+        "opened_last_24h": sum(hourly),
+        "opened_last_7d": sum(block["opened_hourly"]),
+        "hourly_last_24h": hourly,
+        "median_first_join": _histogram_median(block["first_join"]),
+        "median_duration": _histogram_median(block["duration"]),
+        "median_first_response": _histogram_median(block.get("first_response", [])),
+        "messages": block.get("messages", {"total": 0, "staff": 0}),
+        "closes_by": sorted(block["closes_by"].items(), key=lambda item: item[1], reverse=True)
+    }
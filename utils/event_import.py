@@ -0,0 +1,134 @@
+import bisect
+import csv
+import re
+from datetime import datetime, timedelta, tzinfo
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pytz
+
+from utils.timeparse import localize
+
+# Rows yielded by both parsers share these keys:
+#   row, name, description, location, duration_minutes, and either start (aware datetime) or time (text)
+ICS_DURATION = re.compile(r"^P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:\d+S)?)?$")
+
+def iter_csv_events(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Yield one row dict per CSV record; times stay as text for the normal time parser"""
+    reader = csv.DictReader(lines)
+    missing = [column for column in ("name", "time") if column not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"CSV is missing column(s): {', '.join(missing)}")
+    # Count records rather than physical lines (quoted fields can span lines), so row
+    # numbers match what a spreadsheet shows, header being row 1
+    for number, row in enumerate(reader, start=2):
+        yield {
+            "row": number,
+            "name": (row.get("name") or "").strip(),
+            "description": (row.get("description") or "").strip(),
+            "time": (row.get("time") or "").strip(),
+            "location": (row.get("location") or "").strip(),
+            "duration_minutes": (row.get("duration_minutes") or "").strip()
+        }
+
+def _unfold(lines: Iterable[str]) -> Iterator[str]:
+    """Join RFC 5545 folded lines (continuations start with a space or tab)"""
+    current = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current is not None:
+        yield current
+
+def _unescape(value: str) -> str:
+    return value.replace("\\n", "\n").replace("\\N", "\n").replace("\\,", ",").replace("\\;", ";").replace("\\\\", "\\")
+
+def _ics_datetime(value: str, params: Dict[str, str], default_tz: tzinfo) -> datetime:
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        raise ValueError("all-day events aren't supported")
+    if value.endswith("Z"):
+        return pytz.UTC.localize(datetime.strptime(value[:-1], "%Y%m%dT%H%M%S"))
+    tz = pytz.timezone(params["TZID"]) if "TZID" in params else default_tz
+    return localize(tz, datetime.strptime(value, "%Y%m%dT%H%M%S"))
+
+def iter_ics_events(lines: Iterable[str], default_tz: tzinfo) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one row dict per VEVENT, reading the calendar line by line.
+    Floating times are read in default_tz; TZID parameters must be IANA zone names.
+    """
+    event: Optional[Dict[str, Any]] = None
+    count = 0
+    for line in _unfold(lines):
+        if line == "BEGIN:VEVENT":
+            count += 1
+            event = {"row": count, "props": {}}
+            continue
+        if event is None:
+            continue
+        if line == "END:VEVENT":
+            yield _ics_row(event, default_tz)
+            event = None
+            continue
+        name_params, sep, value = line.partition(":")
+        if not sep:
+            continue
+        name, *raw_params = name_params.split(";")
+        params = dict(param.partition("=")[::2] for param in raw_params)
+        event["props"][name.upper()] = (value, params)
+
+def _ics_row(event: Dict[str, Any], default_tz: tzinfo) -> Dict[str, Any]:
+    props = event["props"]
+    row = {
+        "row": event["row"],
+        "name": _unescape(props.get("SUMMARY", ("", {}))[0]).strip(),
+        "description": _unescape(props.get("DESCRIPTION", ("", {}))[0]).strip(),
+        "location": _unescape(props.get("LOCATION", ("", {}))[0]).strip(),
+        "duration_minutes": "",
+        "start": None,
+        "error": None
+    }
+    try:
+        if "DTSTART" not in props:
+            raise ValueError("missing DTSTART")
+        row["start"] = _ics_datetime(*props["DTSTART"], default_tz)
+        if "DTEND" in props:
+            end = _ics_datetime(*props["DTEND"], default_tz)
+            row["duration_minutes"] = str(int((end - row["start"]).total_seconds() // 60))
+        elif "DURATION" in props:
+            match = ICS_DURATION.match(props["DURATION"][0])
+            if not match:
+                raise ValueError(f"unsupported DURATION {props['DURATION'][0]}")
+            parts = {unit: int(amount) for unit, amount in match.groupdict().items() if amount}
+            row["duration_minutes"] = str(int(timedelta(**parts).total_seconds() // 60))
+    except (ValueError, KeyError, OverflowError, pytz.UnknownTimeZoneError) as e:
+        row["error"] = f"bad date: {e}"
+    return row
+
+class RowIntervals:
+    """
+    Accepted import rows per channel, sorted by start, for catching rows that overlap earlier
+    rows in the same file. Accepted rows never overlap each other, so only the neighbours of a
+    new row's position can clash with it.
+    """
+    def __init__(self):
+        self.channels: Dict[int, Tuple[List[datetime], List[Tuple[datetime, int]]]] = {}  # id -> (starts, [(end, row)])
+
+    def clash(self, channel_id: int, start: datetime, end: datetime) -> Optional[int]:
+        """Row number of an accepted row overlapping [start, end), or None"""
+        starts, spans = self.channels.get(channel_id, ([], []))
+        i = bisect.bisect_left(starts, start)
+        if i and spans[i - 1][0] > start:
+            return spans[i - 1][1]
+        if i < len(starts) and starts[i] < end:
+            return spans[i][1]
+        return None
+
+    def add(self, channel_id: int, start: datetime, end: datetime, row: int):
+        starts, spans = self.channels.setdefault(channel_id, ([], []))
+        i = bisect.bisect_left(starts, start)
+        starts.insert(i, start)
+        spans.insert(i, (end, row))
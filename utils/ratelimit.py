@@ -0,0 +1,27 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket used to pace REST calls under Discord rate limits"""
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate  # tokens added per second
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it"""
+        async with self.lock:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
@@ -0,0 +1,92 @@
+import contextlib
+import re
+from datetime import date, datetime, timedelta, tzinfo
+from typing import Any, Dict, Iterator
+
+from utils.timeparse import localize
+
+# Supported subset of RFC 5545 RRULE:
+#   FREQ=DAILY|WEEKLY|MONTHLY, INTERVAL=n, BYDAY=MO,WE (weekly only), COUNT=n, UNTIL=YYYY-MM-DD
+# e.g. "FREQ=WEEKLY;BYDAY=TU,TH;COUNT=12"
+WEEKDAY_CODES = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+MAX_COUNT = 520
+UNTIL_PATTERN = re.compile(r"^(\d{4})-?(\d{2})-?(\d{2})")
+
+def parse_recurrence(spec: str) -> Dict[str, Any]:
+    """Parse an RRULE-style spec into a rule dict; raises ValueError with a readable message"""
+    fields = {}
+    for part in spec.strip().upper().removeprefix("RRULE:").split(";"):
+        if not part:
+            continue
+        key, sep, value = part.partition("=")
+        if not sep:
+            raise ValueError(f"Expected KEY=VALUE, got `{part}`")
+        fields[key.strip()] = value.strip()
+
+    freq = fields.pop("FREQ", None)
+    if freq not in ("DAILY", "WEEKLY", "MONTHLY"):
+        raise ValueError("FREQ must be DAILY, WEEKLY or MONTHLY")
+    rule = {"freq": freq, "interval": 1, "byday": [], "count": None, "until": None}
+
+    if "INTERVAL" in fields:
+        rule["interval"] = int(fields.pop("INTERVAL")) if fields["INTERVAL"].isdigit() else 0
+        if not 1 <= rule["interval"] <= 52:
+            raise ValueError("INTERVAL must be between 1 and 52")
+    if "BYDAY" in fields:
+        if freq != "WEEKLY":
+            raise ValueError("BYDAY is only supported with FREQ=WEEKLY")
+        codes = fields.pop("BYDAY").split(",")
+        if any(code not in WEEKDAY_CODES for code in codes):
+            raise ValueError("BYDAY takes MO, TU, WE, TH, FR, SA or SU")
+        rule["byday"] = sorted({WEEKDAY_CODES[code] for code in codes})
+    if "COUNT" in fields:
+        rule["count"] = int(fields.pop("COUNT")) if fields["COUNT"].isdigit() else 0
+        if not 1 <= rule["count"] <= MAX_COUNT:
+            raise ValueError(f"COUNT must be between 1 and {MAX_COUNT}")
+    if "UNTIL" in fields:
+        match = UNTIL_PATTERN.match(fields.pop("UNTIL"))
+        if not match:
+            raise ValueError("UNTIL must be a date like 2025-06-30")
+        rule["until"] = date(*map(int, match.groups())).isoformat()
+    if fields:
+        raise ValueError(f"Unsupported fields: {', '.join(fields)}")
+    return rule
+
+def iter_occurrences(rule: Dict[str, Any], start: datetime, tz: tzinfo) -> Iterator[datetime]:
+    """
+    Lazily yield occurrence start times in tz, beginning with start.
+    Occurrences keep the same wall-clock time, so they follow DST changes in tz.
+    """
+    local = start.astimezone(tz).replace(tzinfo=None)
+    until = date.fromisoformat(rule["until"]) if rule["until"] else None
+    count = rule["count"]
+    interval = rule["interval"]
+
+    def candidates() -> Iterator[datetime]:
+        if rule["freq"] == "DAILY":
+            step = 0
+            while True:
+                yield local + timedelta(days=step)
+                step += interval
+        elif rule["freq"] == "WEEKLY":
+            weekdays = rule["byday"] or [local.weekday()]
+            week_start = local - timedelta(days=local.weekday())
+            while True:
+                for weekday in weekdays:
+                    candidate = week_start + timedelta(days=weekday)
+                    if candidate >= local:
+                        yield candidate
+                week_start += timedelta(weeks=interval)
+        else:
+            months = 0
+            while True:
+                year, month = divmod(local.month - 1 + months, 12)
+                # Months without this day (e.g. the 31st) are skipped
+                with contextlib.suppress(ValueError):
+                    yield local.replace(year=local.year + year, month=month + 1)
+                months += interval
+
+    for produced, candidate in enumerate(candidates()):
+        if (count is not None and produced >= count) or (until and candidate.date() > until):
+            return
+        yield localize(tz, candidate)
@@ -0,0 +1,81 @@
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger('discord')
+
+
+class DeadlineScheduler:
+    """
+    Min-heap of deadlines driven by a single task.
+    Rescheduling a key pushes a new entry in O(log n); superseded entries are
+    skipped when they reach the top instead of being searched for.
+    """
+    def __init__(self, callback: Callable[[Hashable], Awaitable[Any]]):
+        self.callback = callback
+        self.heap: List[Tuple[float, int, Hashable]] = []
+        self.deadlines: Dict[Hashable, float] = {}
+        self.counter = itertools.count()
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.firing: set = set()
+
+    def __len__(self) -> int:
+        return len(self.deadlines)
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """Set (or move) the deadline for a key; deadline is a UNIX timestamp"""
+        self.deadlines[key] = deadline
+        heapq.heappush(self.heap, (deadline, next(self.counter), key))
+        if self.heap[0][2] == key:
+            self.wakeup.set()
+
+        # Keep superseded entries from piling up on frequently touched keys
+        if len(self.heap) > 2 * len(self.deadlines) + 64:
+            self.heap = [(d, next(self.counter), k) for k, d in self.deadlines.items()]
+            heapq.heapify(self.heap)
+
+    def cancel(self, key: Hashable) -> None:
+        self.deadlines.pop(key, None)
+
+    def start(self) -> None:
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+
+    def stop(self) -> None:
+        if self.task:
+            self.task.cancel()
+            self.task = None
+
+    async def run(self) -> None:
+        while True:
+            # Drop entries whose key was cancelled or rescheduled
+            while self.heap and self.deadlines.get(self.heap[0][2]) != self.heap[0][0]:
+                heapq.heappop(self.heap)
+
+            self.wakeup.clear()
+            if not self.heap:
+                await self.wakeup.wait()
+                continue
+
+            delay = self.heap[0][0] - time.time()
+            if delay > 0:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self.wakeup.wait(), timeout=delay)
+                continue
+
+            _, _, key = heapq.heappop(self.heap)
+            del self.deadlines[key]
+            task = asyncio.create_task(self.fire(key))
+            self.firing.add(task)
+            task.add_done_callback(self.firing.discard)
+
+    async def fire(self, key: Hashable) -> None:
+        try:
+            await self.callback(key)
+        except Exception as e:
+            logger.error(f"❌ Scheduled callback failed for {key}: {e}")
@@ -1,5 +1,6 @@
 import json
 import os
+import re
 import uuid
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
@@ -58,13 +59,52 @@ def save_multi_ticket_configs(guild_id: str, configs: List[Dict[str, Any]]) -> N
     path = get_server_data_path(guild_id, "multi_ticket_configs.json")
     with open(path, 'w') as f:
         json.dump(configs, f, indent=2)
+    invalidate_panel_registry(guild_id)
 
 def get_multi_ticket_setup_by_id(guild_id: str, setup_id: str) -> Optional[Dict[str, Any]]:
-    configs = load_multi_ticket_configs(guild_id)
-    for config in configs:
-        if config['id'] == setup_id:
-            return config
-    return None
+    return get_panel_registry(guild_id)["panels"].get(setup_id)
+
+def get_ticket_option(guild_id: str, panel_id: str, option_id: str) -> Optional[Dict[str, Any]]:
+    return get_panel_registry(guild_id)["options"].get((panel_id, option_id))
+
+# Panel Registry
+# Compiled, read-only view of a server's panel configs. Rebuilt lazily after any config save.
+_panel_registries: Dict[str, Dict[str, Any]] = {}
+_TITLE_FIELDS = re.compile(r"\{(username|userid)\}")
+
+def compile_title_format(title_format: str) -> List[str]:
+    """Split a title format into alternating literal text and field names"""
+    return _TITLE_FIELDS.split(title_format)
+
+def render_title(title_parts: List[str], username: str, userid: str) -> str:
+    values = {"username": username, "userid": userid}
+    return "".join(values[part] if i % 2 else part for i, part in enumerate(title_parts))
+
+def _compile_option(option: Dict[str, Any]) -> Dict[str, Any]:
+    compiled = dict(option)
+    compiled["handle_channel"] = int(option["handle_channel_id"]) if option.get("handle_channel_id") else None
+    compiled["transcripts_channel"] = int(option["transcripts_channel_id"]) if option.get("transcripts_channel_id") else None
+    compiled["title_parts"] = compile_title_format(option.get("title_format", "ticket-{username}"))
+    return compiled
+
+def get_panel_registry(guild_id: str) -> Dict[str, Any]:
+    """Return the server's panels keyed by panel_id and options keyed by (panel_id, option_id)"""
+    registry = _panel_registries.get(guild_id)
+    if registry is None:
+        panels, options = {}, {}
+        for config in load_multi_ticket_configs(guild_id):
+            compiled_options = [_compile_option(option) for option in config.get("ticket_options", [])]
+            panels[config["id"]] = {**config, "ticket_options": compiled_options}
+            for option in compiled_options:
+                options[(config["id"], option["id"])] = option
+        
+        ticket_setups = {config["id"]: config for config in load_ticket_configs(guild_id)}
+        registry = {"panels": panels, "options": options, "ticket_setups": ticket_setups}
+        _panel_registries[guild_id] = registry
+    return registry
+
+def invalidate_panel_registry(guild_id: str) -> None:
+    _panel_registries.pop(guild_id, None)
 
 # User Timezones
 def load_user_timezones(guild_id: str) -> Dict[str, str]:
@@ -77,11 +117,141 @@ def load_user_timezones(guild_id: str) -> Dict[str, str]:
             json.dump({}, f)
         return {}
 
-def save_user_timezone(guild_id: str, user_id: int, timezone: str) -> None:
+def save_user_timezone(guild_id: str, user_id: int, timezone: Optional[str]) -> None:
+    """Set a user's timezone override for one server; None removes the override"""
     timezones = load_user_timezones(guild_id)
-    timezones[str(user_id)] = timezone
+    if timezone is None:
+        timezones.pop(str(user_id), None)
+    else:
+        timezones[str(user_id)] = timezone
     with open(get_server_data_path(guild_id, "user_timezones.json"), 'w') as f:
         json.dump(timezones, f, indent=2)
+    _timezone_overrides[guild_id] = timezones
+
+# Global User Preferences
+# Preferences that follow a user across servers, keyed by user_id
+def load_user_preferences() -> Dict[str, Dict[str, Any]]:
+    try:
+        if os.path.exists("user_preferences.json"):
+            with open("user_preferences.json", "r") as f:
+                return json.load(f)
+    except Exception as e:
+        logger.error(f"Error loading user preferences: {e}")
+    return {}
+
+def save_user_preference(user_id: int, key: str, value: Any) -> None:
+    """Set one preference for a user; None removes it"""
+    global _user_preferences
+    preferences = load_user_preferences()
+    entry = preferences.setdefault(str(user_id), {})
+    if value is None:
+        entry.pop(key, None)
+    else:
+        entry[key] = value
+    if not entry:
+        del preferences[str(user_id)]
+    with open("user_preferences.json", "w") as f:
+        json.dump(preferences, f, indent=2)
+    _user_preferences = preferences
+
+# Timezone lookups are served from memory: global preferences plus per-server overrides,
+# each read from disk once and refreshed by the save functions above.
+_user_preferences: Optional[Dict[str, Dict[str, Any]]] = None
+_timezone_overrides: Dict[str, Dict[str, str]] = {}
+
+def get_user_timezone(guild_id: str, user_id: int) -> Optional[str]:
+    """The user's timezone for a server: the server override if set, else their global one"""
+    global _user_preferences
+    overrides = _timezone_overrides.get(guild_id)
+    if overrides is None:
+        overrides = _timezone_overrides[guild_id] = load_user_timezones(guild_id)
+    timezone = overrides.get(str(user_id))
+    if timezone:
+        return timezone
+    if _user_preferences is None:
+        _user_preferences = load_user_preferences()
+    return _user_preferences.get(str(user_id), {}).get("timezone")
+
+def invalidate_user_timezones(guild_id: str) -> None:
+    _timezone_overrides.pop(guild_id, None)
+
+# Recurring Event Series
+def load_event_series(guild_id: str) -> Dict[str, Dict[str, Any]]:
+    """Recurring event series keyed by series_id"""
+    path = get_server_data_path(guild_id, "event_series.json")
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_event_series(guild_id: str, series_id: str, series: Optional[Dict[str, Any]]) -> None:
+    """Store one series (or delete it when series is None) without touching the others"""
+    all_series = load_event_series(guild_id)
+    if series is None:
+        all_series.pop(series_id, None)
+    else:
+        all_series[series_id] = series
+    with open(get_server_data_path(guild_id, "event_series.json"), 'w') as f:
+        json.dump(all_series, f, indent=2)
+
+# Event Reminders
+def load_event_reminders(guild_id: str) -> Dict[str, Dict[str, Any]]:
+    """Pending reminders keyed by 'event_id:offset_minutes'"""
+    path = get_server_data_path(guild_id, "event_reminders.json")
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_event_reminders(guild_id: str, updates: Dict[str, Optional[Dict[str, Any]]]) -> None:
+    """Add or replace reminders by key; a value of None deletes that reminder"""
+    reminders = load_event_reminders(guild_id)
+    for key, reminder in updates.items():
+        if reminder is None:
+            reminders.pop(key, None)
+        else:
+            reminders[key] = reminder
+    with open(get_server_data_path(guild_id, "event_reminders.json"), 'w') as f:
+        json.dump(reminders, f, indent=2)
+
+# Event Attendance
+# Attendee count history per event: samples are [unix_time, interested, in_voice_channel or null],
+# only appended when a count changed since the previous sample.
+MAX_ATTENDANCE_SAMPLES = 500
+
+def load_event_attendance(guild_id: str) -> Dict[str, Dict[str, Any]]:
+    path = get_server_data_path(guild_id, "event_attendance.json")
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def record_attendance_samples(guild_id: str, samples: Dict[str, Dict[str, Any]]) -> int:
+    """Append samples ({event_id: {"name", "sample"}}) with a single write; returns how many were new"""
+    try:
+        attendance = load_event_attendance(guild_id)
+        added = 0
+        for event_id, entry in samples.items():
+            history = attendance.setdefault(event_id, {"name": entry["name"], "samples": []})
+            history["name"] = entry["name"]
+            if history["samples"] and history["samples"][-1][1:] == entry["sample"][1:]:
+                continue
+            history["samples"].append(entry["sample"])
+            # Keep the first sample so the full span stays visible, drop the oldest after it
+            if len(history["samples"]) > MAX_ATTENDANCE_SAMPLES:
+                del history["samples"][1]
+            added += 1
+        
+        if added:
+            with open(get_server_data_path(guild_id, "event_attendance.json"), 'w') as f:
+                json.dump(attendance, f, separators=(",", ":"))
+        return added
+    except Exception as e:
+        logger.error(f"❌ Error recording event attendance: {str(e)}")
+        return 0
 
 # Staff Roles
 def load_staff_roles(guild_id: str) -> List[str]:
@@ -98,6 +268,37 @@ def save_staff_roles(guild_id: str, staff_roles: List[str]) -> None:
     with open(get_server_data_path(guild_id, "staff_roles.json"), 'w') as f:
         json.dump(staff_roles, f, indent=2)
 
+# Staff Availability
+def load_staff_availability(guild_id: str) -> Dict[str, bool]:
+    path = get_server_data_path(guild_id, "staff_availability.json")
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_staff_availability(guild_id: str, user_id: int, available: bool) -> None:
+    availability = load_staff_availability(guild_id)
+    availability[str(user_id)] = available
+    with open(get_server_data_path(guild_id, "staff_availability.json"), 'w') as f:
+        json.dump(availability, f, indent=2)
+
+# Handle Digests
+def load_handle_digests(guild_id: str) -> Dict[str, str]:
+    """Digest message IDs keyed by 'panel_id:option_id'"""
+    path = get_server_data_path(guild_id, "handle_digests.json")
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_handle_digest(guild_id: str, key: str, message_id: str) -> None:
+    digests = load_handle_digests(guild_id)
+    digests[key] = message_id
+    with open(get_server_data_path(guild_id, "handle_digests.json"), 'w') as f:
+        json.dump(digests, f, indent=2)
+
 # Ticket Setups
 def load_ticket_configs(guild_id: str) -> List[Dict[str, Any]]:
     path = get_server_data_path(guild_id, "ticket_configs.json")
@@ -112,13 +313,10 @@ def load_ticket_configs(guild_id: str) -> List[Dict[str, Any]]:
 def save_ticket_configs(guild_id: str, configs: List[Dict[str, Any]]) -> None:
     with open(get_server_data_path(guild_id, "ticket_configs.json"), 'w') as f:
         json.dump(configs, f, indent=2)
+    invalidate_panel_registry(guild_id)
 
 def get_ticket_setup_by_id(guild_id: str, setup_id: str) -> Optional[Dict[str, Any]]:
-    configs = load_ticket_configs(guild_id)
-    for c in configs:
-        if c['id'] == setup_id:
-            return c
-    return None
+    return get_panel_registry(guild_id)["ticket_setups"].get(setup_id)
 
 # Active Tickets
 def load_active_tickets(guild_id: str) -> Dict[str, Any]:
@@ -190,6 +388,28 @@ def save_active_ticket(guild_id: str, user_id: int, thread_id: str, handle_msg_i
         logger.error(f"❌ Failed to save active ticket: {str(e)}")
         return False
 
+def record_ticket_open(guild_id: str, user_id: int, ticket_data: Dict[str, Any]) -> bool:
+    """Save a new active ticket and bump the user's ticket count in one pass"""
+    try:
+        user_id_str = str(user_id)
+        tickets = load_active_tickets(guild_id)
+        counts = load_user_ticket_counts(guild_id)
+        
+        ticket_data["user_id"] = user_id_str
+        tickets[user_id_str] = ticket_data
+        counts[user_id_str] = counts.get(user_id_str, 0) + 1
+        
+        with open(get_server_data_path(guild_id, "active_tickets.json"), 'w') as f:
+            json.dump(tickets, f, indent=2)
+        with open(get_server_data_path(guild_id, "user_ticket_counts.json"), 'w') as f:
+            json.dump(counts, f, indent=2)
+        
+        logger.info(f"✅ Saved active ticket - Server: {guild_id}, User: {user_id_str}")
+        return True
+    except Exception as e:
+        logger.error(f"❌ Failed to record ticket open: {str(e)}")
+        return False
+
 def get_ticket_data(guild_id: str, identifier: str) -> Optional[Dict[str, Any]]:
     """
     Get ticket data by user_id or thread_id
@@ -245,6 +465,60 @@ def remove_active_ticket(guild_id: str, identifier: str) -> bool:
         logger.error(f"❌ Error removing active ticket: {str(e)}")
         return False
 
+def remove_active_tickets(guild_id: str, thread_ids: List[str]) -> int:
+    """Remove several active tickets by thread_id with a single write; returns how many were removed"""
+    try:
+        tickets = load_active_tickets(guild_id)
+        targets = set(thread_ids)
+        remaining = {user_id: data for user_id, data in tickets.items() if data.get('thread_id') not in targets}
+        removed = len(tickets) - len(remaining)
+        
+        if removed:
+            with open(get_server_data_path(guild_id, "active_tickets.json"), 'w') as f:
+                json.dump(remaining, f, indent=2)
+        logger.info(f"✅ Removed {removed} tickets - Server: {guild_id}")
+        return removed
+    except Exception as e:
+        logger.error(f"❌ Error removing active tickets: {str(e)}")
+        return 0
+
+def update_ticket_activity(guild_id: str, updates: Dict[str, Dict[str, Any]]) -> int:
+    """Store activity counters for several tickets (keyed by thread_id) with a single write"""
+    try:
+        tickets = load_active_tickets(guild_id)
+        updated = 0
+        for data in tickets.values():
+            activity = updates.get(data.get('thread_id'))
+            if activity is not None:
+                data['activity'] = activity
+                updated += 1
+        
+        if updated:
+            with open(get_server_data_path(guild_id, "active_tickets.json"), 'w') as f:
+                json.dump(tickets, f, indent=2)
+        return updated
+    except Exception as e:
+        logger.error(f"❌ Error updating ticket activity: {str(e)}")
+        return 0
+
+def apply_ticket_reconciliation(guild_id: str, stale_thread_ids: List[str], repairs: Dict[str, Dict[str, Any]]) -> bool:
+    """Prune stale tickets and patch repaired entries (keyed by user_id) with a single write"""
+    try:
+        tickets = load_active_tickets(guild_id)
+        stale = set(stale_thread_ids)
+        tickets = {user_id: data for user_id, data in tickets.items() if data.get('thread_id') not in stale}
+        for user_id, patch in repairs.items():
+            if user_id in tickets:
+                tickets[user_id].update(patch)
+        
+        with open(get_server_data_path(guild_id, "active_tickets.json"), 'w') as f:
+            json.dump(tickets, f, indent=2)
+        logger.info(f"✅ Reconciled tickets - Server: {guild_id}, Pruned: {len(stale)}, Repaired: {len(repairs)}")
+        return True
+    except Exception as e:
+        logger.error(f"❌ Error reconciling active tickets: {str(e)}")
+        return False
+
 # User Ticket Counts
 def load_user_ticket_counts(guild_id: str) -> Dict[str, int]:
     path = get_server_data_path(guild_id, "user_ticket_counts.json")
@@ -277,6 +551,10 @@ def save_json_data(guild_id: str, filename: str, data: Any) -> None:
     path = get_server_data_path(guild_id, filename)
     with open(path, 'w') as f:
         json.dump(data, f, indent=2)
+    if filename in ("multi_ticket_configs.json", "ticket_configs.json"):
+        invalidate_panel_registry(guild_id)
+    elif filename == "user_timezones.json":
+        invalidate_user_timezones(guild_id)
 
 def backup_server_data(guild_id: str) -> bool:
     try:
@@ -0,0 +1,134 @@
+import re
+from datetime import date, datetime, timedelta, tzinfo
+from functools import lru_cache
+from typing import Optional
+
+import pytz
+
+# One pattern covers every accepted format; which groups matched tells us the format.
+#   in 2h / in 1h30m / in 45 minutes / in 3 days
+#   [YYYY-]MM-DD HH:MM, today/tomorrow HH:MM, <weekday> HH:MM, HH:MM
+TIME_PATTERN = re.compile(
+    r"""^\s*(?:
+        in\s+(?P<relative>(?:\d+\s*[a-z]+\s*)+)
+        |
+        (?:
+            (?:(?P<year>\d{4})-)?(?P<month>\d{1,2})-(?P<day>\d{1,2})
+            | (?P<dayword>today|tomorrow|tmrw)
+            | (?:next\s+)?(?P<weekday>mon(?:day)?|tue(?:s|sday)?|wed(?:nesday)?|thu(?:r|rs|rsday)?|fri(?:day)?|sat(?:urday)?|sun(?:day)?)
+        )?\s*
+        (?P<hour>\d{1,2}):(?P<minute>\d{2})
+    )\s*$""",
+    re.IGNORECASE | re.VERBOSE
+)
+RELATIVE_PART = re.compile(r"(\d+)\s*([a-z]+)", re.IGNORECASE)
+RELATIVE_UNITS = {
+    "d": "days", "day": "days", "days": "days",
+    "h": "hours", "hr": "hours", "hrs": "hours", "hour": "hours", "hours": "hours",
+    "m": "minutes", "min": "minutes", "mins": "minutes", "minute": "minutes", "minutes": "minutes"
+}
+WEEKDAYS = {"mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6}
+UTC_OFFSET_PATTERN = re.compile(r"^UTC([+-]\d{1,2})$")
+
+@lru_cache(maxsize=None)
+def fixed_offset(minutes: int) -> tzinfo:
+    return pytz.FixedOffset(minutes)
+
+@lru_cache(maxsize=256)
+def utc_offset_timezone(timezone_str: str) -> Optional[tzinfo]:
+    """Turn a stored UTC±X string into a tzinfo, or None if it isn't one"""
+    match = UTC_OFFSET_PATTERN.match(timezone_str)
+    return fixed_offset(int(match.group(1)) * 60) if match else None
+
+IANA_NAMES = {name.lower(): name for name in pytz.all_timezones}
+
+def normalize_timezone(text: str) -> Optional[str]:
+    """Canonical stored form of a UTC±X offset or IANA zone name, or None if it's neither"""
+    text = text.strip()
+    match = UTC_OFFSET_PATTERN.match(text.upper())
+    if match:
+        offset = int(match.group(1))
+        return f"UTC{offset:+d}" if -12 <= offset <= 14 else None
+    return IANA_NAMES.get(text.lower())
+
+@lru_cache(maxsize=512)
+def zone_for(timezone_str: str) -> Optional[tzinfo]:
+    """Resolve a stored timezone string (UTC±X or IANA name) to a tzinfo, or None"""
+    zone = utc_offset_timezone(timezone_str)
+    if zone is None and timezone_str in pytz.all_timezones_set:
+        zone = pytz.timezone(timezone_str)
+    return zone
+
+def parse_duration(text: str) -> Optional[timedelta]:
+    """Parse durations like "2h", "1h30m" or "3 days"; None if any part isn't understood"""
+    text = text.strip()
+    parts = RELATIVE_PART.findall(text)
+    if not parts or RELATIVE_PART.sub("", text).strip():
+        return None
+    delta = {}
+    try:
+        for amount, unit in parts:
+            unit = RELATIVE_UNITS.get(unit.lower())
+            if not unit:
+                return None
+            delta[unit] = delta.get(unit, 0) + int(amount)
+        return timedelta(**delta)
+    except (OverflowError, ValueError):
+        # Past timedelta's range, or too many digits for int()
+        return None
+
+def localize(tz: tzinfo, naive: datetime) -> datetime:
+    return tz.localize(naive) if hasattr(tz, "localize") else naive.replace(tzinfo=tz)
+
+def _at(tz: tzinfo, day: date, hour: int, minute: int) -> datetime:
+    return localize(tz, datetime(day.year, day.month, day.day, hour, minute))
+
+def parse_time(text: str, tz: tzinfo, now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Parse a user-supplied time into an aware datetime in tz, or return None.
+    Dates without a year, bare times and weekdays resolve to the next matching moment after now.
+    """
+    match = TIME_PATTERN.match(text)
+    if not match:
+        return None
+    now = now.astimezone(tz) if now else datetime.now(tz)
+
+    if match.group("relative"):
+        delta = parse_duration(match.group("relative"))
+        if delta is None:
+            return None
+        # Add the offset in UTC so DST changes in tz don't skew it
+        try:
+            return (now.astimezone(pytz.UTC) + delta).astimezone(tz)
+        except OverflowError:
+            return None
+
+    hour, minute = int(match.group("hour")), int(match.group("minute"))
+    if hour > 23 or minute > 59:
+        return None
+
+    try:
+        if match.group("month"):
+            year = int(match.group("year")) if match.group("year") else now.year
+            candidate = localize(tz, datetime(year, int(match.group("month")), int(match.group("day")), hour, minute))
+            # A date without a year that already passed means next year
+            if not match.group("year") and candidate <= now:
+                candidate = localize(tz, datetime(year + 1, int(match.group("month")), int(match.group("day")), hour, minute))
+            return candidate
+    except (ValueError, OverflowError):
+        return None
+
+    today = now.date()
+    dayword = (match.group("dayword") or "").lower()
+    try:
+        if dayword:
+            return _at(tz, today + timedelta(days=0 if dayword == "today" else 1), hour, minute)
+
+        days_ahead = (WEEKDAYS[match.group("weekday")[:3].lower()] - today.weekday()) % 7 if match.group("weekday") else 0
+        candidate = _at(tz, today + timedelta(days=days_ahead), hour, minute)
+        # Already passed: a bare time means tomorrow, a weekday means next week
+        if candidate <= now:
+            candidate = _at(tz, today + timedelta(days=days_ahead + (7 if match.group("weekday") else 1)), hour, minute)
+        return candidate
+    except OverflowError:
+        return None  # Past the last representable date
@@ -0,0 +1,128 @@
+import logging
+import re
+import sqlite3
+import tempfile
+import zipfile
+from contextlib import ExitStack, closing
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from utils.storage import get_server_data_path
+
+logger = logging.getLogger('discord')
+
+# One SQLite database per server keeps search results isolated between guilds.
+# Transcripts live in a plain table; the FTS5 table indexes it as external content.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    id INTEGER PRIMARY KEY,
+    thread_id TEXT UNIQUE NOT NULL,
+    thread_name TEXT,
+    user_id TEXT,
+    panel_id TEXT,
+    option_id TEXT,
+    created_at TEXT,
+    closed_at TEXT,
+    content TEXT
+);
+CREATE INDEX IF NOT EXISTS transcripts_closed_at ON transcripts(closed_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS transcripts_fts USING fts5(
+    thread_name, content, content='transcripts', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS transcripts_ai AFTER INSERT ON transcripts BEGIN
+    INSERT INTO transcripts_fts(rowid, thread_name, content) VALUES (new.id, new.thread_name, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS transcripts_ad AFTER DELETE ON transcripts BEGIN
+    INSERT INTO transcripts_fts(transcripts_fts, rowid, thread_name, content) VALUES ('delete', old.id, old.thread_name, old.content);
+END;
+"""
+
+def connect(guild_id: str) -> sqlite3.Connection:
+    """Open the transcript database for a server, creating the schema if needed"""
+    conn = sqlite3.connect(get_server_data_path(guild_id, "transcripts.db"))
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+def index_transcript(guild_id: str, thread_id: str, thread_name: str, ticket_data: Dict[str, Any], content: str) -> bool:
+    """Store a closed ticket's transcript and add it to the search index"""
+    try:
+        with closing(connect(guild_id)) as conn, conn:
+            conn.execute("DELETE FROM transcripts WHERE thread_id = ?", (thread_id,))
+            conn.execute(
+                "INSERT INTO transcripts (thread_id, thread_name, user_id, panel_id, option_id, created_at, closed_at, content) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id, thread_name, ticket_data.get('user_id'), ticket_data.get('panel_id'),
+                    ticket_data.get('option_id'), ticket_data.get('created_at'), ticket_data.get('closed_at'), content
+                )
+            )
+        return True
+    except Exception as e:
+        logger.error(f"❌ Error indexing transcript: {str(e)}")
+        return False
+
+def search_transcripts(guild_id: str, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """Return transcripts matching every term in the query, best matches first"""
+    # Quote each term so user input can't break FTS query syntax
+    terms = " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+    if not terms:
+        return []
+
+    with closing(connect(guild_id)) as conn:
+        rows = conn.execute(
+            "SELECT t.thread_id, t.thread_name, t.user_id, t.closed_at, "
+            "snippet(transcripts_fts, 1, '**', '**', '…', 16) AS snippet "
+            "FROM transcripts_fts JOIN transcripts t ON t.id = transcripts_fts.rowid "
+            "WHERE transcripts_fts MATCH ? ORDER BY bm25(transcripts_fts) LIMIT ?",
+            (terms, limit)
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+def iter_transcripts(conn: sqlite3.Connection, since: Optional[str] = None, until: Optional[str] = None,
+                     panel_id: Optional[str] = None, user_id: Optional[str] = None) -> Iterator[sqlite3.Row]:
+    """Yield matching transcripts oldest first, one row at a time. since/until bound closed_at (ISO strings, until exclusive)"""
+    clauses, params = [], []
+    for clause, value in (("closed_at >= ?", since), ("closed_at < ?", until), ("panel_id = ?", panel_id), ("user_id = ?", user_id)):
+        if value is not None:
+            clauses.append(clause)
+            params.append(value)
+    where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+    yield from conn.execute(
+        f"SELECT thread_id, thread_name, closed_at, content FROM transcripts {where}ORDER BY closed_at", params
+    )
+
+def _archive_name(row: sqlite3.Row) -> str:
+    name = re.sub(r"[^\w.-]+", "_", row['thread_name'] or "ticket").strip("_")[:80]
+    return f"{(row['closed_at'] or 'unknown')[:10]}-{name}-{row['thread_id']}.txt"
+
+def export_transcripts(guild_id: str, part_limit: int, **filters) -> List[Tuple[BinaryIO, int]]:
+    """
+    Write matching transcripts into zip archives of at most part_limit bytes each.
+    Rows are streamed from the database into temporary files, so memory use stays at
+    about one transcript. Returns (file, transcript count) per archive, rewound for reading.
+    """
+    parts = []
+    archive = None
+    # Leave room for the central directory written when an archive is closed
+    budget = part_limit - 64 * 1024
+
+    def finish():
+        archive.close()
+        parts[-1][0].seek(0)
+
+    # Parts are closed if the export fails; on success the caller owns them
+    with ExitStack() as stack, closing(connect(guild_id)) as conn:
+        for row in iter_transcripts(conn, **filters):
+            data = (row['content'] or "").encode('utf-8')
+            # Start a new part if this entry could push the current one past the limit
+            if archive is None or (parts[-1][1] and parts[-1][0].tell() + len(data) > budget):
+                if archive is not None:
+                    finish()
+                parts.append([stack.enter_context(tempfile.TemporaryFile()), 0])
+                archive = zipfile.ZipFile(parts[-1][0], 'w', compression=zipfile.ZIP_DEFLATED)
+            archive.writestr(_archive_name(row), data)
+            parts[-1][1] += 1
+        if archive is not None:
+            finish()
+        stack.pop_all()
+    return [(fp, count) for fp, count in parts]